@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+BRC polygonizer benchmarks
+Times the pipeline stages on the checked-in your_input_manual_edits.svg and on
+larger synthetic layouts, writes the results as JSON and flags regressions
+against a previous results file
+
+    python benchmark_polygonizer.py                              # writes benchmark_results.json
+    python benchmark_polygonizer.py --compare baseline.json      # exit 1 on regressions
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from svgpathtools import Path, Line, parse_path
+
+import clean_brc_polygonizer as polygonizer
+from synthetic_city import SCALE_PRESETS, write_synthetic_city
+
+BENCHMARK_VERSION = 1
+INPUT_SVG = "your_input_manual_edits.svg"
+SVG_NS = "http://www.w3.org/2000/svg"
+
+# Ring/radial pairs for the three find_improved_intersections code paths
+INTERSECTION_TIMES = ['2:30', '4:30', '6:00', '7:30', '9:30']
+
+def densify_layout(input_svg, output_svg, factor):
+    """Write a copy of input_svg whose ring paths have `factor`× as many segments and whose
+    main radials are `factor`-segment polylines; the geometry (and so the blocks) is unchanged"""
+    ET.register_namespace('', SVG_NS)
+    tree = ET.parse(input_svg)
+    root = tree.getroot()
+
+    ring_group = root.find(".//*[@id='Ring_Roads']")
+    for elem in ring_group.iter():
+        if elem.tag.split('}')[-1] == 'path' and elem.get('d'):
+            segments = []
+            for segment in parse_path(elem.get('d')):
+                segments.extend(segment.cropped(i / factor, (i + 1) / factor) for i in range(factor))
+            elem.set('d', Path(*segments).d())
+
+    radial_group = root.find(".//*[@id='Main_Radial_Roads']")
+    for subgroup in radial_group:
+        for elem in list(subgroup):
+            if elem.tag.split('}')[-1] != 'line':
+                continue
+            x1, y1, x2, y2 = (float(elem.get(attr)) for attr in ('x1', 'y1', 'x2', 'y2'))
+            points = [(x1 + (x2 - x1) * i / factor, y1 + (y2 - y1) * i / factor) for i in range(factor + 1)]
+            polyline = ET.Element(f'{{{SVG_NS}}}polyline', {'class': elem.get('class', ''),
+                                                              'points': ' '.join(f"{x:.3f},{y:.3f}" for x, y in points)})
+            subgroup.insert(list(subgroup).index(elem), polyline)
+            subgroup.remove(elem)
+
+    tree.write(output_svg, encoding='utf-8', xml_declaration=True)
+    return output_svg
+
+def layout_files(names, work_dir):
+    """{name: svg path} for 'real', 'denseN' and 'cityN' layout names"""
+    files = {}
+    for name in names:
+        if name == 'real':
+            files[name] = INPUT_SVG
+        elif name.startswith('dense') and name[len('dense'):].isdigit():
+            files[name] = densify_layout(INPUT_SVG, os.path.join(work_dir, f"{name}.svg"), int(name[len('dense'):]))
+        elif name.startswith('city') and name[len('city'):].isdigit() and int(name[len('city'):]) in SCALE_PRESETS:
+            rings, radial_spacing = SCALE_PRESETS[int(name[len('city'):])]
+            files[name] = write_synthetic_city(os.path.join(work_dir, f"{name}.svg"), rings=rings,
+                                               radial_spacing=radial_spacing)
+        else:
+            raise ValueError(f"Unknown layout: {name} (use 'real', 'denseN' or one of "
+                             f"{', '.join(f'city{scale}' for scale in SCALE_PRESETS)})")
+    return files
+
+def intersection_cases(rings, radials):
+    """(ring_path, radial_path, time_str) triples that exercise each find_improved_intersections path:
+    'direct' (Path.intersect hits), 'angle' (synthetic-angle search) and 'closest' (closest-approach fallback)"""
+    center = complex(622.5, 272.04)
+    # A stub radial near the Man crosses no ring, so Path.intersect finds nothing
+    stub = Path(Line(center, center + 5))
+    cases = {'direct': [], 'angle': [], 'closest': []}
+    for ring_id in polygonizer.ring_order(rings):
+        for time_str in INTERSECTION_TIMES:
+            if time_str in radials:
+                cases['direct'].append((rings[ring_id], radials[time_str], time_str))
+            cases['angle'].append((rings[ring_id], stub, time_str))
+        cases['closest'].append((rings[ring_id], stub, None))
+    return cases
+
+def time_call(func, repeat):
+    """Wall-clock seconds of `repeat` calls to func (stdout suppressed) and the last result"""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func()
+            runs.append(time.perf_counter() - start)
+    return runs, result
+
+def summarize(runs):
+    return {'min': min(runs), 'median': statistics.median(runs), 'runs': runs}
+
+def benchmark_layout(svg_file, repeat, work_dir):
+    """Time every stage on one layout; returns {'stages': {...}, 'blocks': n, ...}"""
+    stages = {}
+
+    runs, (rings, radials) = time_call(lambda: polygonizer.extract_roads_from_manual_svg(svg_file), repeat)
+    stages['extract_roads_from_manual_svg'] = summarize(runs)
+
+    for code_path, cases in intersection_cases(rings, radials).items():
+        runs, _ = time_call(lambda: [polygonizer.find_improved_intersections(*case) for case in cases], repeat)
+        stages[f'find_improved_intersections.{code_path}'] = dict(summarize(runs), calls=len(cases))
+
+    runs, blocks = time_call(lambda: polygonizer.create_brc_blocks(rings, radials), repeat)
+    stages['create_brc_blocks'] = summarize(runs)
+
+    combined_file = os.path.join(work_dir, "combined.svg")
+    arc_file = os.path.join(work_dir, "arc.svg")
+    runs, _ = time_call(lambda: polygonizer.create_combined_svg(svg_file, blocks, combined_file), repeat)
+    stages['create_combined_svg'] = summarize(runs)
+    runs, _ = time_call(lambda: polygonizer.create_arc_optimized_svg(blocks, arc_file), repeat)
+    stages['create_arc_optimized_svg'] = summarize(runs)
+
+    # Validation compares fitted Beziers, so time it on blocks that already carry them
+    with contextlib.redirect_stdout(io.StringIO()):
+        bezier_blocks = polygonizer.create_brc_blocks(rings, radials, representation='bezier',
+                                                      intersections=polygonizer.compute_intersection_table(rings, radials))
+    runs, _ = time_call(lambda: polygonizer.validate_bezier_against_original(bezier_blocks, rings), repeat)
+    stages['validate_bezier_against_original'] = summarize(runs)
+    runs, _ = time_call(lambda: polygonizer.validate_edge_accuracy(blocks, rings, radials), repeat)
+    stages['validate_edge_accuracy'] = summarize(runs)
+
+    return {
+        'input': os.path.basename(svg_file),
+        'input_bytes': os.path.getsize(svg_file),
+        'rings': len(rings),
+        'radials': len(radials),
+        'ring_segments': sum(len(path) for path in rings.values()),
+        'blocks': len(blocks),
+        'stages': stages
+    }
+
+def compare_results(results, baseline, threshold, min_seconds):
+    """Regressions as (layout, stage, baseline time, new time) where the fastest run grew
+    by more than `threshold`× and by more than min_seconds (the minimum is the least noisy)"""
+    regressions = []
+    for layout, layout_results in results['layouts'].items():
+        baseline_stages = baseline.get('layouts', {}).get(layout, {}).get('stages', {})
+        for stage, timing in layout_results['stages'].items():
+            if stage not in baseline_stages:
+                continue
+            old, new = baseline_stages[stage]['min'], timing['min']
+            if new > old * threshold and new - old > min_seconds:
+                regressions.append((layout, stage, old, new))
+    return regressions
+
+def print_results(results, baseline=None):
+    for layout, layout_results in results['layouts'].items():
+        print(f"\n📊 {layout}: {layout_results['blocks']} blocks, {layout_results['ring_segments']} ring segments")
+        baseline_stages = (baseline or {}).get('layouts', {}).get(layout, {}).get('stages', {})
+        for stage, timing in layout_results['stages'].items():
+            line = f"   {stage:<45} {timing['min'] * 1000:10.1f} ms"
+            if stage in baseline_stages:
+                line += f"  ({timing['min'] / baseline_stages[stage]['min']:.2f}× baseline)"
+            print(line)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the BRC polygonizer pipeline stages")
+    parser.add_argument('--layouts', nargs='+', default=['real', 'dense4', 'city10'],
+                        help="'real' (the checked-in SVG), 'denseN' (N× ring segments) and/or 'city1'/'city10'/'city100' "
+                             "(synthetic_city.py presets); default: real dense4 city10")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs per stage; the fastest run is compared (default 3)")
+    parser.add_argument('--output', default="benchmark_results.json",
+                        help="JSON results file (default benchmark_results.json)")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="previous results file to compare against; exits 1 on regressions")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="flag stages whose fastest run grew by more than this factor (default 1.25)")
+    parser.add_argument('--min-seconds', type=float, default=0.01,
+                        help="ignore slowdowns smaller than this many seconds (default 0.01)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("⏱️  BRC POLYGONIZER BENCHMARKS")
+    print("=" * 60)
+
+    results = {
+        'version': BENCHMARK_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'layouts': {}
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name, svg_file in layout_files(args.layouts, work_dir).items():
+            print(f"🏃 Benchmarking {name} ({svg_file})...")
+            results['layouts'][name] = benchmark_layout(svg_file, args.repeat, work_dir)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    print(f"\n📁 Results: {args.output}")
+
+    if baseline is not None:
+        regressions = compare_results(results, baseline, args.threshold, args.min_seconds)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) vs {args.compare}:")
+            for layout, stage, old, new in regressions:
+                print(f"   {layout} {stage}: {old * 1000:.1f} ms → {new * 1000:.1f} ms")
+            return 1
+        print(f"\n✅ No regressions vs {args.compare} (threshold {args.threshold:.2f}×)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+BRC block adjacency graph
+Precomputes which blocks border each other from the ring/time grid the
+blocks are built on, and writes it as a compact CSR (compressed sparse row)
+graph so the web app can answer "which blocks border polygon_C_4:30?"
+without geometry tests at runtime
+"""
+
+import json
+import math
+from bisect import bisect_left
+
+from radial_index import time_minutes
+
+ADJACENCY_VERSION = 1
+
+# Edge type codes in the CSR 'types' array
+EDGE_TYPES = ('same_ring', 'across_ring', 'diagonal')
+SAME_RING, ACROSS_RING, DIAGONAL = range(len(EDGE_TYPES))
+
+def ring_arc_length(start, end, radius=None):
+    """Length of the circular arc of the given radius between two points (the chord without a radius)"""
+    chord = math.dist(start, end)
+    if not radius or chord >= 2 * radius:
+        return chord
+    return 2 * radius * math.asin(chord / (2 * radius))
+
+def ring_points(blocks):
+    """{(ring, time): corner point} for every block corner, i.e. every ring/radial intersection used"""
+    points = {}
+    for block in blocks:
+        block_data = block['block_data']
+        points.setdefault((block['ring'], block['time']), block_data['time1_inner'])
+        points.setdefault((block['ring'], block['time2']), block_data['time2_inner'])
+        points.setdefault((block['outer_ring'], block['time']), block_data['time1_outer'])
+        points.setdefault((block['outer_ring'], block['time2']), block_data['time2_outer'])
+    return points
+
+def outer_arc_radius(block):
+    arc_data = block.get('arc_data')
+    return arc_data['outer_arc']['radius'] if arc_data else None
+
+def block_adjacency_edges(blocks):
+    """Undirected (row_a, row_b, edge_type, shared_length) edges between block rows.
+
+    Uses the grid the blocks are laid out on rather than their outlines:
+    - same_ring: same ring pair, consecutive times; they share the radial
+      edge between the two ring corners at that time.
+    - across_ring: one block's outer ring is the other's inner ring and their
+      time spans overlap; they share that stretch of ring arc. At F the 30
+      minute inner blocks each border two 15 minute outer blocks.
+    - diagonal: across a ring, touching only at one corner (spans meet end
+      to end), with a shared length of 0.
+    """
+    points = ring_points(blocks)
+    spans = [(time_minutes(block['time']), time_minutes(block['time2'])) for block in blocks]
+
+    by_start = {(block['ring'], block['outer_ring'], block['time']): row for row, block in enumerate(blocks)}
+    by_ring = {}
+    for row, block in enumerate(blocks):
+        by_ring.setdefault(block['ring'], []).append((spans[row][0], row))
+    for ring_blocks in by_ring.values():
+        ring_blocks.sort()
+
+    edges = []
+    for row, block in enumerate(blocks):
+        block_data = block['block_data']
+        neighbour = by_start.get((block['ring'], block['outer_ring'], block['time2']))
+        if neighbour is not None:
+            edges.append((row, neighbour, SAME_RING, math.dist(block_data['time2_inner'], block_data['time2_outer'])))
+
+        # Blocks on the far side of the outer ring whose spans overlap or touch this one
+        start, end = spans[row]
+        ring_blocks = by_ring.get(block['outer_ring'], [])
+        first = max(bisect_left(ring_blocks, (start, -1)) - 1, 0)
+        for other_start, other in ring_blocks[first:]:
+            if other_start > end:
+                break
+            other_end = spans[other][1]
+            shared_start, shared_end = max(start, other_start), min(end, other_end)
+            if shared_end < shared_start:
+                continue
+            if shared_end == shared_start:
+                edges.append((row, other, DIAGONAL, 0.0))
+                continue
+            time1 = block['time'] if start >= other_start else blocks[other]['time']
+            time2 = block['time2'] if end <= other_end else blocks[other]['time2']
+            length = ring_arc_length(points[(block['outer_ring'], time1)], points[(block['outer_ring'], time2)],
+                                     outer_arc_radius(block))
+            edges.append((row, other, ACROSS_RING, length))
+    return edges
+
+def build_block_adjacency(blocks, scale=10):
+    """CSR adjacency graph of blocks, keyed by overlay IDs (polygon_<ring>_<time>).
+
+    The neighbours of block i are neighbors[offsets[i]:offsets[i + 1]], with
+    matching edge type codes (indexes into edge_types) and shared edge
+    lengths as integers in 1/scale SVG px. Every edge is listed from both
+    ends; each row is sorted by edge type, then neighbour index.
+    """
+    rows = [[] for _ in blocks]
+    for a, b, edge_type, length in block_adjacency_edges(blocks):
+        quantized = int(round(length * scale))
+        rows[a].append((edge_type, b, quantized))
+        rows[b].append((edge_type, a, quantized))
+
+    offsets, neighbors, types, lengths = [0], [], [], []
+    for row in rows:
+        for edge_type, neighbour, length in sorted(row):
+            neighbors.append(neighbour)
+            types.append(edge_type)
+            lengths.append(length)
+        offsets.append(len(neighbors))
+
+    return {
+        'version': ADJACENCY_VERSION,
+        'scale': scale,
+        'edge_types': list(EDGE_TYPES),
+        'ids': [f"polygon_{block['id']}" for block in blocks],
+        'offsets': offsets,
+        'neighbors': neighbors,
+        'types': types,
+        'lengths': lengths
+    }
+
+def block_neighbours(graph, block_id):
+    """[(neighbour_id, edge_type, shared_length_px)] for one overlay ID of a build_block_adjacency graph"""
+    row = graph['ids'].index(block_id)
+    start, end = graph['offsets'][row], graph['offsets'][row + 1]
+    return [(graph['ids'][neighbour], graph['edge_types'][edge_type], length / graph['scale'])
+            for neighbour, edge_type, length in zip(graph['neighbors'][start:end], graph['types'][start:end],
+                                                    graph['lengths'][start:end])]
+
+def write_block_adjacency(blocks, output_file, scale=10):
+    """Write the adjacency graph as compact JSON; returns the graph"""
+    graph = build_block_adjacency(blocks, scale)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(graph, f, separators=(',', ':'))
+    return graph
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+BRC address geocoder
+Turns free-form camp addresses ("7:45 & G", "G & 7:45", "F 2:30", "3:00 B Plaza",
+"Center Camp Plaza")
+into block IDs and SVG coordinates using hash indexes built once from the
+polygonizer's ring → radial intersection table
+"""
+
+import bisect
+import math
+import re
+import xml.etree.ElementTree as ET
+from radial_index import RadialIndex, canonical_time, time_minutes
+
+RING_NAMES = ['Esplanade', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K']
+RING_ALIASES = {**{ring.lower(): ring for ring in RING_NAMES}, 'esp': 'Esplanade'}
+
+TIME_PATTERN = re.compile(r'(?<![\d:])(\d{1,2})(?::(\d{2}))?(?![\d:])')
+RING_PATTERN = re.compile(r'\b(' + '|'.join(sorted(RING_ALIASES, key=len, reverse=True)) + r')\b')
+SEPARATOR_PATTERN = re.compile(r'&|\band\b|@|,|/|\bat\b')
+CENTER_CAMP_PATTERN = re.compile(r'\bcenter\s+camp\b')
+
+# Center Camp plaza sits on the 6:00 & A intersection (not drawn in the Plazas group)
+CENTER_CAMP = ('A', '6:00')
+
+def extract_plazas(svg_file):
+    """Read {(ring, time): (x, y)} plaza centers from the input SVG's Plazas group"""
+    root = ET.parse(svg_file).getroot()
+    plazas = {}
+    group = root.find(".//*[@id='Plazas']")
+    if group is None:
+        return plazas
+
+    for plaza in group:
+        match = re.fullmatch(r'_?(\d{1,2}):(\d{2})_([A-Za-z]+)_Plaza', plaza.get('id') or '')
+        circle = next((elem for elem in plaza if elem.tag.split('}')[-1] == 'circle'), None)
+        if match and circle is not None and match.group(3).lower() in RING_ALIASES:
+            ring = RING_ALIASES[match.group(3).lower()]
+            plazas[(ring, canonical_time(match.group(1), match.group(2)))] = (float(circle.get('cx')), float(circle.get('cy')))
+    return plazas
+
+class BlockGeocoder:
+    """Address → block ID / coordinate lookups.
+
+    intersections is the ring → {radial_id: (x, y)} table from
+    compute_intersection_table; block_ids (e.g. [b['id'] for b in blocks])
+    limits results to blocks that exist; plazas comes from extract_plazas.
+    """
+
+    def __init__(self, intersections, block_ids=None, plazas=None, center=(622.5, 272.04)):
+        self.center = center
+
+        # (ring, canonical time) → intersection point, resolved once through the radial index
+        radial_index = RadialIndex(dict.fromkeys(radial_id for table in intersections.values() for radial_id in table))
+        self.points = {}
+        for ring, ring_table in intersections.items():
+            for time_str in radial_index.times():
+                point = radial_index.lookup(ring_table, time_str)
+                if point is not None:
+                    self.points[(ring, time_str)] = tuple(point)
+
+        # Per ring: indexed times in clock order, for interpolating between radials
+        self.ring_times = {}
+        for ring, time_str in self.points:
+            self.ring_times.setdefault(ring, []).append(time_str)
+        for times in self.ring_times.values():
+            times.sort(key=time_minutes)
+        self.ring_minutes = {ring: [time_minutes(t) for t in times] for ring, times in self.ring_times.items()}
+
+        # (ring, block start time) → block ID, and each ring's block start times in clock order
+        if block_ids is None:
+            block_ids = [f"{ring}_{time_str}" for ring, times in self.ring_times.items() for time_str in times[:-1]]
+        self.blocks = {}
+        for block_id in block_ids:
+            ring, time_str = block_id.rsplit('_', 1)
+            self.blocks[(ring, time_str)] = block_id
+        self.block_starts = {}
+        for ring, time_str in self.blocks:
+            self.block_starts.setdefault(ring, []).append(time_minutes(time_str))
+        for starts in self.block_starts.values():
+            starts.sort()
+
+        self.plazas = dict(plazas or {})
+        if CENTER_CAMP not in self.plazas and CENTER_CAMP in self.points:
+            self.plazas[CENTER_CAMP] = self.points[CENTER_CAMP]
+
+    def parse(self, address):
+        """Split an address into (ring, time, is_plaza); raises ValueError if unparseable.
+
+        ring or time may be None for plaza addresses ("3:00 Plaza", "G Plaza").
+        """
+        text = (address or '').strip().lower()
+        if CENTER_CAMP_PATTERN.search(text):
+            text = CENTER_CAMP_PATTERN.sub(' ', text)
+            if re.sub(r'\bplaza\b', ' ', text).strip():
+                raise ValueError(f"Unrecognized address: {address!r}")
+            return CENTER_CAMP[0], CENTER_CAMP[1], True
+
+        is_plaza = bool(re.search(r'\bplaza\b', text))
+        text = re.sub(r'\bplaza\b', ' ', text)
+
+        ring_matches = RING_PATTERN.findall(text)
+        time_matches = TIME_PATTERN.findall(text)
+        leftover = SEPARATOR_PATTERN.sub(' ', TIME_PATTERN.sub(' ', RING_PATTERN.sub(' ', text))).strip()
+        if len(ring_matches) > 1 or len(time_matches) > 1 or leftover:
+            raise ValueError(f"Unrecognized address: {address!r}")
+
+        ring = RING_ALIASES[ring_matches[0]] if ring_matches else None
+        time_str = canonical_time(*(value or 0 for value in time_matches[0])) if time_matches else None
+        if not is_plaza and (ring is None or time_str is None):
+            raise ValueError(f"Address needs a time and a street: {address!r}")
+        if ring is None and time_str is None:
+            raise ValueError(f"Unrecognized address: {address!r}")
+        return ring, time_str, is_plaza
+
+    @staticmethod
+    def plaza_id(ring, time_str):
+        """Plaza ID as used by the web app (plaza_3:00_B, plaza_Center_Camp)"""
+        return 'plaza_Center_Camp' if (ring, time_str) == CENTER_CAMP else f"plaza_{time_str}_{ring}"
+
+    def block_for(self, ring, time_str):
+        """ID of the block on `ring` whose frontage contains time_str (clamped to the last block at 10:00)"""
+        starts = self.block_starts.get(ring)
+        minutes = time_minutes(time_str)
+        if not starts or minutes < starts[0] or minutes > time_minutes(self.ring_times[ring][-1]):
+            return None
+        start = starts[bisect.bisect_right(starts, minutes) - 1]
+        return self.blocks[(ring, canonical_time(start // 60, start % 60))]
+
+    def point_for(self, ring, time_str):
+        """Street-corner coordinates of (ring, time): the indexed intersection, or angular
+        interpolation between the two neighbouring radials on that ring"""
+        point = self.points.get((ring, time_str))
+        if point is not None:
+            return point
+
+        times = self.ring_times.get(ring, [])
+        minutes = time_minutes(time_str)
+        after = bisect.bisect_right(self.ring_minutes.get(ring, []), minutes)
+        if after in (0, len(times)):
+            return None
+        t0, t1 = times[after - 1], times[after]
+        fraction = (minutes - time_minutes(t0)) / (time_minutes(t1) - time_minutes(t0))
+
+        cx, cy = self.center
+        (x0, y0), (x1, y1) = self.points[(ring, t0)], self.points[(ring, t1)]
+        r0, r1 = math.hypot(x0 - cx, y0 - cy), math.hypot(x1 - cx, y1 - cy)
+        a0, a1 = math.atan2(y0 - cy, x0 - cx), math.atan2(y1 - cy, x1 - cx)
+        sweep = (a1 - a0 + math.pi) % (2 * math.pi) - math.pi
+        radius, angle = r0 + fraction * (r1 - r0), a0 + fraction * sweep
+        return (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+
+    def geocode_one(self, address):
+        """Geocode a single address; see geocode()"""
+        result = {'address': address, 'kind': None, 'ring': None, 'time': None,
+                  'block_id': None, 'plaza_id': None, 'x': None, 'y': None, 'error': None}
+        try:
+            ring, time_str, is_plaza = self.parse(address)
+        except ValueError as e:
+            result['error'] = str(e)
+            return result
+        result['ring'], result['time'] = ring, time_str
+
+        if is_plaza:
+            # "3:00 Plaza" / "G Plaza" resolve only when exactly one plaza matches
+            candidates = [key for key in self.plazas
+                          if ring in (None, key[0]) and time_str in (None, key[1])]
+            if len(candidates) != 1:
+                label = ' & '.join(part for part in (time_str, ring) if part)
+                result['error'] = (f"No plaza at {label}" if not candidates else
+                                   f"Ambiguous plaza {label}: " +
+                                   ', '.join(self.plaza_id(*key) for key in sorted(candidates)))
+                return result
+            ring, time_str = candidates[0]
+            x, y = self.plazas[(ring, time_str)]
+            result.update(kind='plaza', ring=ring, time=time_str, plaza_id=self.plaza_id(ring, time_str),
+                          x=float(x), y=float(y))
+            return result
+
+        block_id = self.block_for(ring, time_str)
+        point = self.point_for(ring, time_str)
+        if block_id is None or point is None:
+            result['error'] = f"{time_str} & {ring} is outside the city"
+            return result
+        result.update(kind='block', block_id=block_id, x=float(point[0]), y=float(point[1]))
+        return result
+
+    def geocode(self, addresses):
+        """Geocode a list of addresses in one call.
+
+        Returns one dict per address with kind ('block'/'plaza'/None), ring,
+        time, block_id (block IDs as in create_brc_blocks, e.g. 'G_7:45'),
+        plaza_id, x, y and error. Repeated addresses are resolved once.
+        """
+        resolved = {}
+        results = []
+        for address in addresses:
+            if address not in resolved:
+                resolved[address] = self.geocode_one(address)
+            results.append(dict(resolved[address], address=address))
+        return results
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+BRC point-in-block locator
+Answers "which block contains (x, y)?" analytically: points are converted to
+(radius, clock angle) around the Man and binary-searched against the radial
+angles and ring radii, with a Shapely STRtree only for the Esplanade
+exception polygons around 6:00
+"""
+
+import math
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+from radial_index import time_minutes
+
+def clock_angle(dx, dy):
+    """Clock angle in degrees (3:00 = 90, 6:00 = 180, 9:00 = 270) of SVG offsets from the Man"""
+    return np.degrees(np.arctan2(dy, dx) + math.pi / 2) % 360.0
+
+def svg_arc_centers(start, end, radius, large_arc_flag, sweep_flag):
+    """Centers (N, 2) and radii of the circles SVG draws for unrotated circular 'A' commands.
+
+    Follows the SVG endpoint-to-center conversion, including scaling the
+    radius up when it is too small to span the chord.
+    """
+    half = (start - end) / 2
+    half_sq = np.maximum((half ** 2).sum(axis=1), 1e-12)
+    radius = np.maximum(radius, np.sqrt(half_sq))
+    coef = np.sqrt(np.maximum(radius ** 2 - half_sq, 0) / half_sq)
+    coef = np.where(large_arc_flag != sweep_flag, coef, -coef)
+    centers = (start + end) / 2 + coef[:, None] * np.column_stack([half[:, 1], -half[:, 0]])
+    return centers, radius
+
+class BlockLocator:
+    """Point-in-block lookups for create_brc_blocks output (or BlockTable.block dicts).
+
+    The city is split into fine sectors between consecutive radial times and,
+    within each sector, bands between consecutive ring radii. A lookup is a
+    np.searchsorted on the clock angle and one on the radius, then an exact
+    check against the block's straight radial edges and SVG arc circles that
+    steps to a neighbouring block when the point sits just across an edge.
+    Only the exception blocks (polyline outlines) are tested with an STRtree.
+    """
+
+    def __init__(self, blocks, center=(622.5, 272.04)):
+        self.center = center
+        self.ids = [block['id'] for block in blocks]
+        cx, cy = center
+
+        times = sorted({t for block in blocks for t in (block['time'], block['time2'])}, key=time_minutes)
+        rings = []
+        for block in blocks:
+            for ring_id in (block['ring'], block['outer_ring']):
+                if ring_id not in rings:
+                    rings.append(ring_id)
+        time_index = {t: i for i, t in enumerate(times)}
+        ring_index = {ring_id: i for i, ring_id in enumerate(rings)}
+
+        # Corner arrays per block: time1_inner, time2_inner, time1_outer, time2_outer
+        corners = np.array([[block['block_data'][key] for key in ('time1_inner', 'time2_inner', 'time1_outer', 'time2_outer')]
+                            for block in blocks], dtype=float).reshape(len(blocks), 4, 2)
+        radii = np.hypot(corners[:, :, 0] - cx, corners[:, :, 1] - cy)
+
+        # Sector boundaries: median clock angle of every corner on each radial time
+        corner_angles = clock_angle(corners[:, :, 0] - cx, corners[:, :, 1] - cy)
+        boundary_samples = [[] for _ in times]
+        for row, block in enumerate(blocks):
+            boundary_samples[time_index[block['time']]].extend(corner_angles[row, [0, 2]])
+            boundary_samples[time_index[block['time2']]].extend(corner_angles[row, [1, 3]])
+        self.sector_angles = np.array([np.median(samples) for samples in boundary_samples])
+
+        # Per fine sector: ring radii (NaN where a ring has no block) and the block in each band
+        n_sectors = len(times) - 1
+        ring_radii = np.full((n_sectors, len(rings)), np.nan)
+        band_blocks = np.full((n_sectors, len(rings)), -1, dtype=np.int64)
+        for row, block in enumerate(blocks):
+            inner, outer = ring_index[block['ring']], ring_index[block['outer_ring']]
+            for sector in range(time_index[block['time']], time_index[block['time2']]):
+                ring_radii[sector, inner] = radii[row, 0]
+                ring_radii[sector, outer] = radii[row, 2]
+                band_blocks[sector, inner] = row
+
+        # searchsorted needs increasing rows; rings without blocks in a sector inherit the next radius
+        outside = 2.0 * np.nanmax(radii)
+        for sector in range(n_sectors):
+            column = ring_radii[sector]
+            for j in range(len(rings) - 2, -1, -1):
+                if np.isnan(column[j]):
+                    column[j] = column[j + 1]
+            column[np.isnan(column)] = outside
+        self.ring_radii = np.maximum.accumulate(ring_radii, axis=1)
+        self.band_blocks = band_blocks
+        # Candidate blocks for radii outside a sector's bands: the nearest band that has a block
+        self.nearest_band_blocks = band_blocks.copy()
+        for sector_blocks in self.nearest_band_blocks:
+            filled = np.nonzero(sector_blocks >= 0)[0]
+            if len(filled):
+                sector_blocks[:filled[0]] = sector_blocks[filled[0]]
+                sector_blocks[filled[-1] + 1:] = sector_blocks[filled[-1]]
+        # All sectors' radii in one increasing array: sector k is shifted by k * sector_stride
+        self.sector_stride = 2.0 * outside
+        self.flat_radii = (self.ring_radii + self.sector_stride * np.arange(n_sectors)[:, None]).ravel()
+        self.block_sectors = np.array([time_index[block['time']] for block in blocks])
+        self.block_sector_ends = np.array([time_index[block['time2']] for block in blocks])
+        self.block_rings = np.array([ring_index[block['ring']] for block in blocks])
+
+        # Ring edges are the circles the SVG arcs trace (centered near, not exactly on, the Man)
+        arc_datas = [block.get('arc_data') for block in blocks]
+        arc_circles = {}
+        for side, start, end in (('inner', 0, 1), ('outer', 2, 3)):
+            arc_fields = np.array([[arc_data[f'{side}_arc'][key] for key in ('radius', 'large_arc_flag', 'sweep_flag')]
+                                   if arc_data else [radii[row, start], 0, 1]
+                                   for row, arc_data in enumerate(arc_datas)], dtype=float)
+            arc_circles[side] = svg_arc_centers(corners[:, start], corners[:, end], arc_fields[:, 0],
+                                                arc_fields[:, 1], arc_fields[:, 2])
+        (self.inner_centers, self.inner_radii), (self.outer_centers, self.outer_radii) = arc_circles['inner'], arc_circles['outer']
+
+        # Radial edges as (origin, direction); the interior has a positive cross product with both
+        self.edge_origins = corners[:, [0, 3]]       # time1_inner, time2_outer
+        self.edge_directions = np.stack([corners[:, 2] - corners[:, 0], corners[:, 1] - corners[:, 3]], axis=1)
+
+        # Exception blocks carry polyline outlines that don't follow ring arcs
+        self.exception_rows = np.array([row for row, block in enumerate(blocks)
+                                        if (block.get('polyline_data') or {}).get('polygon_points')], dtype=np.int64)
+        self.exception_polygons = [Polygon(blocks[row]['polyline_data']['polygon_points']) for row in self.exception_rows]
+        self.exception_tree = shapely.STRtree(self.exception_polygons) if self.exception_polygons else None
+        self.exception_bounds = shapely.total_bounds(self.exception_polygons) if self.exception_polygons else None
+        self.is_exception = np.zeros(len(blocks), dtype=bool)
+        self.is_exception[self.exception_rows] = True
+
+    def _band_lookup(self, sectors, radius):
+        """Candidate block row for each (sector, radius) pair; -1 only for sectors outside the city.
+
+        Radii inside the first or past the last ring map to the nearest block,
+        so the exact edge tests decide points near the city's inner/outer edge.
+        """
+        n_sectors, n_rings = self.band_blocks.shape
+        rows = np.full(len(sectors), -1, dtype=np.int64)
+        valid = (sectors >= 0) & (sectors < n_sectors)
+        sectors = sectors[valid]
+        shifted = np.minimum(radius[valid], self.sector_stride / 2) + self.sector_stride * sectors
+        bands = np.searchsorted(self.flat_radii, shifted, side='right') - 1 - sectors * n_rings
+        rows[valid] = self.nearest_band_blocks[sectors, np.clip(bands, 0, n_rings - 1)]
+        return rows
+
+    def _violations(self, rows, xy):
+        """Which side of each candidate block a point falls off, shape (N, 4) bool:
+        before the time1 radial, past the time2 radial, inside the inner arc, outside the outer arc"""
+        offsets = xy[:, None, :] - self.edge_origins[rows]
+        directions = self.edge_directions[rows]
+        sides = directions[:, :, 0] * offsets[:, :, 1] - directions[:, :, 1] * offsets[:, :, 0]
+        inner_distance = np.hypot(*(xy - self.inner_centers[rows]).T)
+        outer_distance = np.hypot(*(xy - self.outer_centers[rows]).T)
+        return np.column_stack([sides < 0, inner_distance < self.inner_radii[rows], outer_distance > self.outer_radii[rows]])
+
+    def locate_many(self, points, max_steps=3):
+        """Block row index for each point of an (N, 2) array; -1 where no block contains it"""
+        xy = np.asarray(points, dtype=float).reshape(-1, 2)
+        dx, dy = xy[:, 0] - self.center[0], xy[:, 1] - self.center[1]
+        radius = np.hypot(dx, dy)
+        # Clamp to the outermost sectors: points just past the 2:00/10:00 radials are settled by the edge tests
+        sectors = np.clip(np.searchsorted(self.sector_angles, clock_angle(dx, dy), side='right') - 1,
+                          0, len(self.band_blocks) - 1)
+        rows = self._band_lookup(sectors, radius)
+
+        # The binary search assumes rays and Man-centered circles; radial edges are chords and
+        # ring arcs are slightly off-center, so points near an edge step to the neighbouring block
+        pending = np.nonzero(rows >= 0)[0]
+        for _ in range(max_steps):
+            if not len(pending):
+                break
+            candidates = rows[pending]
+            violations = self._violations(candidates, xy[pending])
+            failing = violations.any(axis=1)
+            pending, candidates, violations = pending[failing], candidates[failing], violations[failing]
+
+            # Radial edge: search the neighbouring sector past the block's own span (inner blocks cover two)
+            neighbour_sectors = np.where(violations[:, 0], self.block_sectors[candidates] - 1,
+                                         self.block_sector_ends[candidates])
+            moved = self._band_lookup(neighbour_sectors, radius[pending])
+            # Ring arc: the block one band in or out, in the point's sector within the block's span
+            arc_only = ~violations[:, 0] & ~violations[:, 1]
+            point_sectors = np.clip(sectors[pending], self.block_sectors[candidates], self.block_sector_ends[candidates] - 1)
+            bands = self.block_rings[candidates] + np.where(violations[:, 2], -1, 1)
+            valid_bands = (bands >= 0) & (bands < self.band_blocks.shape[1])
+            arc_moves = np.full(len(pending), -1, dtype=np.int64)
+            arc_moves[valid_bands] = self.band_blocks[point_sectors[valid_bands], bands[valid_bands]]
+            moved = np.where(arc_only, arc_moves, moved)
+
+            rows[pending] = moved
+            pending = pending[moved >= 0]
+        rows[pending] = -1
+
+        # Exception polygons replace the band geometry around Esplanade 5:30-6:30;
+        # where their polylines overlap a regular block by a sliver, the regular block wins
+        if self.exception_tree is not None:
+            rows[(rows >= 0) & self.is_exception[np.maximum(rows, 0)]] = -1
+            min_x, min_y, max_x, max_y = self.exception_bounds
+            near = np.nonzero((rows < 0) & (xy[:, 0] >= min_x) & (xy[:, 0] <= max_x) &
+                              (xy[:, 1] >= min_y) & (xy[:, 1] <= max_y))[0]
+            point_index, polygon_index = self.exception_tree.query(shapely.points(xy[near]), predicate='within')
+            rows[near[point_index]] = self.exception_rows[polygon_index]
+
+        return rows
+
+    def locate_ids(self, points):
+        """Block ID (or None) for each point of an (N, 2) array"""
+        return [self.ids[row] if row >= 0 else None for row in self.locate_many(points).tolist()]
+
+    def locate(self, x, y):
+        """Block ID containing (x, y), or None"""
+        return self.locate_ids([(x, y)])[0]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+BRC block manifest export
+Writes per-block corners, arc parameters, centroid, bbox and ring/time fields
+as compact JSON or GeoJSON with integer-quantized coordinates, so the web app
+can place blocks without measuring SVG paths in the DOM
+"""
+
+import gzip
+import json
+from shapely.geometry import Polygon
+
+try:
+    import brotli
+except ImportError:  # Optional: only needed for .br siblings
+    brotli = None
+
+MANIFEST_VERSION = 1
+
+def quantize(values, scale):
+    """Round coordinates to integers in units of 1/scale SVG px"""
+    return [int(round(value * scale)) for value in values]
+
+def block_outline(block):
+    """Shapely outline of a block dict (its polygon, else its exception points or corners)"""
+    if block.get('polygon') is not None:
+        return block['polygon']
+    polyline_data = block.get('polyline_data')
+    if polyline_data and polyline_data.get('polygon_points'):
+        return Polygon(polyline_data['polygon_points'])
+    block_data = block['block_data']
+    return Polygon([block_data['time1_inner'], block_data['time2_inner'],
+                    block_data['time2_outer'], block_data['time1_outer']])
+
+def block_manifest_entry(block, scale=10):
+    """Manifest fields of one block; coordinates are flat [x, y, ...] integer lists"""
+    block_data = block['block_data']
+    corners = [block_data['time1_inner'], block_data['time2_inner'], block_data['time1_outer'], block_data['time2_outer']]
+    outline = block_outline(block)
+    centroid = outline.centroid
+
+    entry = {
+        'ring': block['ring'],
+        'outer_ring': block.get('outer_ring'),
+        'time': block['time'],
+        'time2': block.get('time2'),
+        'type': block['type'],
+        'corners': quantize([c for corner in corners for c in corner], scale),  # time1_inner, time2_inner, time1_outer, time2_outer
+        'centroid': quantize([centroid.x, centroid.y], scale),
+        'bbox': quantize(outline.bounds, scale)  # min x, min y, max x, max y
+    }
+
+    arc_data = block.get('arc_data')
+    polyline_data = block.get('polyline_data')
+    if polyline_data and polyline_data.get('polygon_points'):
+        entry['points'] = quantize([c for point in polyline_data['polygon_points'] for c in point], scale)
+    elif arc_data:
+        # [radius, large_arc_flag, sweep_flag] of the inner and outer ring arcs
+        entry['arcs'] = {
+            side: [int(round(arc_data[f'{side}_arc']['radius'] * scale)),
+                   arc_data[f'{side}_arc']['large_arc_flag'], arc_data[f'{side}_arc']['sweep_flag']]
+            for side in ('inner', 'outer')
+        }
+    return entry
+
+def build_block_manifest(blocks, scale=10, center=(622.5, 272.04)):
+    """Compact manifest: {'blocks': {'polygon_<ring>_<time>': entry}} plus the quantization scale"""
+    return {
+        'version': MANIFEST_VERSION,
+        'scale': scale,
+        'center': quantize(center, scale),
+        'blocks': {f"polygon_{block['id']}": block_manifest_entry(block, scale) for block in blocks}
+    }
+
+def build_block_geojson(blocks, scale=10, center=(622.5, 272.04)):
+    """GeoJSON FeatureCollection of block outlines in quantized SVG coordinates"""
+    features = []
+    for block in blocks:
+        properties = block_manifest_entry(block, scale)
+        outline = block_outline(block)
+        ring = []
+        for x, y in outline.exterior.coords:
+            point = quantize((x, y), scale)
+            if not ring or point != ring[-1]:
+                ring.append(point)
+        features.append({
+            'type': 'Feature',
+            'id': f"polygon_{block['id']}",
+            'properties': properties,
+            'geometry': {'type': 'Polygon', 'coordinates': [ring]}
+        })
+
+    return {
+        'type': 'FeatureCollection',
+        'version': MANIFEST_VERSION,
+        'scale': scale,
+        'center': quantize(center, scale),
+        'features': features
+    }
+
+def write_block_manifest(blocks, output_file, scale=10, compress=()):
+    """Write the manifest (GeoJSON for *.geojson, compact JSON otherwise).
+
+    compress may include 'gz' and/or 'br' to also write precompressed
+    siblings (output_file + '.gz' / '.br'). Returns the written paths.
+    """
+    if output_file.endswith('.geojson'):
+        manifest = build_block_geojson(blocks, scale)
+    else:
+        manifest = build_block_manifest(blocks, scale)
+    data = json.dumps(manifest, separators=(',', ':')).encode('utf-8')
+
+    written = [output_file]
+    with open(output_file, 'wb') as f:
+        f.write(data)
+
+    if 'gz' in compress:
+        # mtime=0 keeps the .gz byte-identical across runs
+        with open(output_file + '.gz', 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(output_file + '.gz')
+    if 'br' in compress:
+        if brotli is None:
+            print("⚠️  brotli is not installed; skipping .br manifest (pip install brotli)")
+        else:
+            with open(output_file + '.br', 'wb') as f:
+                f.write(brotli.compress(data, quality=11))
+            written.append(output_file + '.br')
+
+    return written
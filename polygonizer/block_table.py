@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Compact BRC block table
+Stores polygonizer blocks as NumPy record arrays that save to a single
+memory-mappable binary file, so downstream tools can open a city layout
+without parsing SVG or rebuilding Shapely/svgpathtools objects
+"""
+
+import json
+import numpy as np
+
+from radial_index import time_minutes
+
+BLOCK_TABLE_MAGIC = b'BRCBLK01'
+BLOCK_TABLE_ALIGNMENT = 64
+
+BLOCK_TYPES = ['inner', 'outer', 'inner_exception']
+
+# One row per block; ring/time fields index into the table's ring_names/time_names
+BLOCK_DTYPE = np.dtype([
+    ('ring', '<u2'),            # Inner ring of the block
+    ('outer_ring', '<u2'),
+    ('time', '<u2'),            # Radial the block starts at (block IDs are <ring>_<time>)
+    ('time2', '<u2'),           # Radial the block ends at
+    ('type', 'u1'),             # Index into BLOCK_TYPES
+    ('corners', '<f8', (4, 2)),  # time1_inner, time2_inner, time1_outer, time2_outer
+    ('inner_radius', '<f8'),    # Circular arc radii (0 for polyline exception blocks)
+    ('outer_radius', '<f8'),
+    ('inner_large_arc', 'u1'),
+    ('inner_sweep', 'u1'),
+    ('outer_large_arc', 'u1'),
+    ('outer_sweep', 'u1'),
+    ('vertex_offset', '<i4'),   # Slice of the shared vertex buffer (exception polylines only)
+    ('vertex_count', '<i4'),
+])
+
+class BlockTable:
+    """Blocks as a NumPy record array plus a shared (V, 2) vertex buffer.
+
+    records is a recarray with BLOCK_DTYPE rows; ring_names and time_names
+    map the 16-bit integer ring/time fields back to strings.
+    """
+
+    def __init__(self, records, vertices, ring_names, time_names, center=(622.5, 272.04)):
+        self.records = records.view(np.recarray)
+        self.vertices = vertices
+        self.ring_names = list(ring_names)
+        self.time_names = list(time_names)
+        self.center = tuple(center)
+        self._row_by_id = {block_id: row for row, block_id in enumerate(self.ids)}
+
+    @classmethod
+    def from_blocks(cls, blocks, center=(622.5, 272.04)):
+        """Build a table from create_brc_blocks output (arc and polyline data only)"""
+        ring_names = []
+        for block in blocks:
+            for ring_id in (block['ring'], block['outer_ring']):
+                if ring_id not in ring_names:
+                    ring_names.append(ring_id)
+        time_names = sorted({time_str for block in blocks for time_str in (block['time'], block['time2'])},
+                            key=time_minutes)
+        # The header records the records dtype, so tables written with narrower index fields still load
+        index_limit = np.iinfo(BLOCK_DTYPE['ring']).max + 1
+        for label, names in (('rings', ring_names), ('radial times', time_names)):
+            if len(names) > index_limit:
+                raise ValueError(f"Block table can index at most {index_limit} {label}, got {len(names)}")
+        ring_lookup = {ring_id: i for i, ring_id in enumerate(ring_names)}
+        time_lookup = {time_str: i for i, time_str in enumerate(time_names)}
+
+        records = np.zeros(len(blocks), dtype=BLOCK_DTYPE)
+        vertex_chunks = []
+        vertex_total = 0
+
+        for row, block in zip(records, blocks):
+            block_data = block['block_data']
+            row['ring'] = ring_lookup[block['ring']]
+            row['outer_ring'] = ring_lookup[block['outer_ring']]
+            row['time'] = time_lookup[block['time']]
+            row['time2'] = time_lookup[block['time2']]
+            row['type'] = BLOCK_TYPES.index(block['type'])
+            row['corners'] = [block_data['time1_inner'], block_data['time2_inner'],
+                              block_data['time1_outer'], block_data['time2_outer']]
+
+            polyline_data = block.get('polyline_data')
+            arc_data = block.get('arc_data')
+            if polyline_data and polyline_data.get('polygon_points'):
+                points = np.asarray(polyline_data['polygon_points'], dtype=float)
+                row['vertex_offset'] = vertex_total
+                row['vertex_count'] = len(points)
+                vertex_chunks.append(points)
+                vertex_total += len(points)
+            elif arc_data:
+                inner_arc, outer_arc = arc_data['inner_arc'], arc_data['outer_arc']
+                row['inner_radius'] = inner_arc['radius']
+                row['outer_radius'] = outer_arc['radius']
+                row['inner_large_arc'] = inner_arc['large_arc_flag']
+                row['inner_sweep'] = inner_arc['sweep_flag']
+                row['outer_large_arc'] = outer_arc['large_arc_flag']
+                row['outer_sweep'] = outer_arc['sweep_flag']
+            else:
+                raise ValueError(f"Block {block['id']} has neither arc nor polyline data")
+
+        vertices = np.concatenate(vertex_chunks) if vertex_chunks else np.zeros((0, 2))
+        return cls(records, vertices, ring_names, time_names, center)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def ids(self):
+        """Block IDs (<ring>_<time>) in row order"""
+        return [f"{self.ring_names[ring]}_{self.time_names[time]}"
+                for ring, time in zip(self.records.ring.tolist(), self.records.time.tolist())]
+
+    def row(self, block_id):
+        """Row index of a block ID; raises KeyError for unknown IDs"""
+        return self._row_by_id[block_id]
+
+    def polygon_points(self, row):
+        """Exception polyline vertices of a row as a (n, 2) array view (empty for arc blocks)"""
+        record = self.records[row]
+        return self.vertices[record.vertex_offset:record.vertex_offset + record.vertex_count]
+
+    def block(self, row):
+        """Rebuild a light block dict for a row (the fields the SVG writers read)"""
+        record = self.records[row]
+        time1_inner, time2_inner, time1_outer, time2_outer = [tuple(corner) for corner in record.corners.tolist()]
+        block = {
+            'id': f"{self.ring_names[record.ring]}_{self.time_names[record.time]}",
+            'ring': self.ring_names[record.ring],
+            'outer_ring': self.ring_names[record.outer_ring],
+            'time': self.time_names[record.time],
+            'time2': self.time_names[record.time2],
+            'type': BLOCK_TYPES[record.type],
+            'arc_data': None,
+            'polyline_data': None,
+            'block_data': {
+                'time1_inner': time1_inner,
+                'time2_inner': time2_inner,
+                'time1_outer': time1_outer,
+                'time2_outer': time2_outer
+            }
+        }
+
+        if record.vertex_count:
+            block['polyline_data'] = {'polygon_points': [tuple(point) for point in self.polygon_points(row).tolist()]}
+        else:
+            block['arc_data'] = {
+                'inner_arc': {'center': self.center, 'radius': float(record.inner_radius),
+                              'large_arc_flag': int(record.inner_large_arc), 'sweep_flag': int(record.inner_sweep),
+                              'start_point': time1_inner, 'end_point': time2_inner},
+                'outer_arc': {'center': self.center, 'radius': float(record.outer_radius),
+                              'large_arc_flag': int(record.outer_large_arc), 'sweep_flag': int(record.outer_sweep),
+                              'start_point': time1_outer, 'end_point': time2_outer},
+                'radial1': [time1_inner, time1_outer],
+                'radial2': [time2_inner, time2_outer]
+            }
+        return block
+
+    def save(self, path):
+        """Write the table as a JSON header followed by 64-byte aligned raw arrays"""
+        arrays = {'records': np.ascontiguousarray(self.records.view(np.ndarray)),
+                  'vertices': np.ascontiguousarray(self.vertices, dtype='<f8')}
+
+        layout = {}
+        offset = 0
+        for name, array in arrays.items():
+            layout[name] = {'descr': np.lib.format.dtype_to_descr(array.dtype), 'shape': list(array.shape),
+                            'offset': offset}
+            offset += -(-array.nbytes // BLOCK_TABLE_ALIGNMENT) * BLOCK_TABLE_ALIGNMENT
+
+        header = json.dumps({
+            'ring_names': self.ring_names,
+            'time_names': self.time_names,
+            'block_types': BLOCK_TYPES,
+            'center': list(self.center),
+            'arrays': layout
+        }).encode('utf-8')
+        # Pad the header so the data section starts aligned
+        data_start = -(-(len(BLOCK_TABLE_MAGIC) + 8 + len(header)) // BLOCK_TABLE_ALIGNMENT) * BLOCK_TABLE_ALIGNMENT
+        header += b' ' * (data_start - len(BLOCK_TABLE_MAGIC) - 8 - len(header))
+
+        with open(path, 'wb') as f:
+            f.write(BLOCK_TABLE_MAGIC)
+            f.write(np.uint64(len(header)).tobytes())
+            f.write(header)
+            for name, array in arrays.items():
+                f.write(array.tobytes())
+                f.write(b'\0' * (-array.nbytes % BLOCK_TABLE_ALIGNMENT))
+        return path
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Open a table written by save(); with mmap=True the arrays are read-only memory maps"""
+        with open(path, 'rb') as f:
+            if f.read(len(BLOCK_TABLE_MAGIC)) != BLOCK_TABLE_MAGIC:
+                raise ValueError(f"{path} is not a BRC block table")
+            header_length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(header_length))
+            data_start = f.tell()
+            if header['block_types'] != BLOCK_TYPES:
+                raise ValueError(f"{path} uses unknown block types {header['block_types']}")
+
+            arrays = {}
+            for name, spec in header['arrays'].items():
+                dtype = np.lib.format.descr_to_dtype(spec['descr'])
+                shape = tuple(spec['shape'])
+                if mmap:
+                    arrays[name] = (np.memmap(path, dtype=dtype, mode='r', offset=data_start + spec['offset'], shape=shape)
+                                    if np.prod(shape) else np.zeros(shape, dtype=dtype))
+                else:
+                    f.seek(data_start + spec['offset'])
+                    count = int(np.prod(shape))
+                    arrays[name] = np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+
+        return cls(arrays['records'], arrays['vertices'], header['ring_names'], header['time_names'], header['center'])
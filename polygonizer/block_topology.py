@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+BRC block topology checker
+Checks that blocks tile the city the way the outputs claim: no overlaps or gap
+slivers between neighbouring blocks, shared corners on the same intersection
+coordinate and no missing blocks, as a JSON report plus an optional highlight
+overlay SVG
+"""
+
+import json
+import math
+from collections import Counter, defaultdict
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+from block_locator import svg_arc_centers
+from radial_index import time_minutes
+
+TOPOLOGY_VERSION = 1
+
+def arc_samples(start, end, centers, radii, sweep_flag, num_samples):
+    """(N, num_samples, 2) points along N circular arcs from start to end, in the direction SVG's sweep flag draws them"""
+    start_angle = np.arctan2(start[:, 1] - centers[:, 1], start[:, 0] - centers[:, 0])
+    end_angle = np.arctan2(end[:, 1] - centers[:, 1], end[:, 0] - centers[:, 0])
+    delta = end_angle - start_angle
+    delta = np.where((sweep_flag == 1) & (delta < 0), delta + 2 * math.pi, delta)
+    delta = np.where((sweep_flag == 0) & (delta > 0), delta - 2 * math.pi, delta)
+    angles = start_angle[:, None] + delta[:, None] * np.linspace(0, 1, num_samples)
+    return np.stack([centers[:, None, 0] + radii[:, None] * np.cos(angles),
+                     centers[:, None, 1] + radii[:, None] * np.sin(angles)], axis=-1)
+
+def block_outlines(blocks, num_samples=64):
+    """Shapely polygons of the outlines the arc SVG draws, one per block.
+
+    Arc blocks follow their SVG 'A' circles (num_samples points per arc),
+    so neighbours are compared on the drawn geometry rather than the coarse
+    outline in block['polygon']; exception blocks use their polygon_points.
+    """
+    polygons = np.empty(len(blocks), dtype=object)
+    is_arc = np.array([bool(block.get('arc_data')) and not (block.get('polyline_data') or {}).get('polygon_points')
+                       for block in blocks], dtype=bool)
+    arc_rows = np.nonzero(is_arc)[0]
+    for row in np.nonzero(~is_arc)[0]:
+        polyline_data = blocks[row].get('polyline_data') or {}
+        block_data = blocks[row]['block_data']
+        points = polyline_data.get('polygon_points') or [block_data['time1_inner'], block_data['time2_inner'],
+                                                         block_data['time2_outer'], block_data['time1_outer']]
+        polygons[row] = Polygon(points)
+
+    if len(arc_rows):
+        corners = np.array([[blocks[row]['block_data'][key] for key in ('time1_inner', 'time2_inner', 'time1_outer', 'time2_outer')]
+                            for row in arc_rows], dtype=float)
+        sides = []
+        for side, start, end in (('inner', 0, 1), ('outer', 2, 3)):
+            fields = np.array([[blocks[row]['arc_data'][f'{side}_arc'][key] for key in ('radius', 'large_arc_flag', 'sweep_flag')]
+                               for row in arc_rows], dtype=float)
+            centers, radii = svg_arc_centers(corners[:, start], corners[:, end], fields[:, 0], fields[:, 1], fields[:, 2])
+            sides.append(arc_samples(corners[:, start], corners[:, end], centers, radii, fields[:, 2], num_samples))
+        # Inner arc forwards, outer arc backwards; the radials are the closing segments
+        outlines = np.concatenate([sides[0], sides[1][:, ::-1]], axis=1)
+        polygons[arc_rows] = shapely.polygons(shapely.linearrings(outlines))
+    return polygons
+
+def pair_relation(a, b):
+    """'radial' for blocks side by side across a radial, 'ring' for blocks either side of a ring, else 'corner'"""
+    if (a['ring'], a['outer_ring']) == (b['ring'], b['outer_ring']) and (a['time2'] == b['time'] or b['time2'] == a['time']):
+        return 'radial'
+    if a['outer_ring'] == b['ring'] or b['outer_ring'] == a['ring']:
+        a_span = (time_minutes(a['time']), time_minutes(a['time2']))
+        b_span = (time_minutes(b['time']), time_minutes(b['time2']))
+        if min(a_span[1], b_span[1]) > max(a_span[0], b_span[0]):
+            return 'ring'
+    return 'corner'
+
+def corner_mismatches(blocks, tolerance=1e-6):
+    """Intersections ((ring, time) corners) that different blocks place at different coordinates"""
+    corners = defaultdict(list)
+    for block in blocks:
+        block_data = block['block_data']
+        for ring_id, time_str, key in ((block['ring'], block['time'], 'time1_inner'), (block['ring'], block['time2'], 'time2_inner'),
+                                       (block['outer_ring'], block['time'], 'time1_outer'), (block['outer_ring'], block['time2'], 'time2_outer')):
+            corners[(ring_id, time_str)].append((block['id'], tuple(map(float, block_data[key]))))
+
+    mismatches = []
+    for (ring_id, time_str), uses in corners.items():
+        points = np.array([point for _, point in uses])
+        spread = float(np.max(np.hypot(*(points - points[0]).T)))
+        if spread > tolerance:
+            mismatches.append({'corner': f"{ring_id} & {time_str}", 'spread': spread,
+                               'blocks': sorted({block_id for block_id, _ in uses}),
+                               'points': sorted(set(point for _, point in uses))})
+    return sorted(mismatches, key=lambda mismatch: -mismatch['spread'])
+
+def check_block_topology(blocks, expected_ids=None, gap_width=2.0, area_tolerance=1.0, num_samples=64):
+    """Topology report for create_brc_blocks output.
+
+    Candidate neighbour pairs come from one STRtree query over the drawn
+    outlines. For every pair the overlap area is measured, and for blocks
+    sharing a radial or ring edge also the gap slivers between them: the
+    area a morphological closing of width gap_width adds to the pair's
+    union. Pairs over area_tolerance px² are listed. Shared corners must
+    carry identical coordinates, and block IDs are compared against
+    expected_ids (e.g. from block_layout).
+
+    Returns (report, highlights); highlights holds the outlines and the
+    overlap/gap geometries and corner points for write_topology_overlay.
+    """
+    ids = [block['id'] for block in blocks]
+    polygons = block_outlines(blocks, num_samples)
+    valid = shapely.is_valid(polygons)
+    checked = polygons.copy()
+    if not valid.all():
+        checked[~valid] = shapely.make_valid(polygons[~valid])
+
+    # Candidate neighbours: blocks within gap_width of each other, each pair once
+    tree = shapely.STRtree(checked)
+    left, right = tree.query(checked, predicate='dwithin', distance=gap_width)
+    keep = left < right
+    left, right = left[keep], right[keep]
+    relations = np.array([pair_relation(blocks[i], blocks[j]) for i, j in zip(left, right)], dtype=object)
+
+    overlaps = shapely.intersection(checked[left], checked[right])
+    overlap_area = shapely.area(overlaps)
+    # Gap slivers: what closing the pair's union (buffer out, then back in) fills between them
+    edge_pairs = relations != 'corner'
+    unions = shapely.union(checked[left[edge_pairs]], checked[right[edge_pairs]])
+    closed = shapely.buffer(shapely.buffer(unions, gap_width, join_style='mitre'), -gap_width, join_style='mitre')
+    gap_area = np.zeros(len(left))
+    gap_area[edge_pairs] = np.maximum(shapely.area(closed) - shapely.area(unions), 0.0)
+    union_index = np.cumsum(edge_pairs) - 1  # pair → row in unions / closed
+
+    def pair_entries(areas, mask):
+        order = np.argsort(-areas)
+        return [{'blocks': [ids[left[k]], ids[right[k]]], 'relation': relations[k], 'area': float(areas[k])}
+                for k in order if mask[k] and areas[k] > area_tolerance]
+
+    overlap_entries = pair_entries(overlap_area, np.ones(len(left), dtype=bool))
+    gap_entries = pair_entries(gap_area, edge_pairs)
+    mismatches = corner_mismatches(blocks)
+    present, expected = set(ids), set(expected_ids or [])
+    missing = [block_id for block_id in (expected_ids or []) if block_id not in present]
+    unexpected = [block_id for block_id in ids if expected_ids is not None and block_id not in expected]
+    duplicates = sorted(block_id for block_id, count in Counter(ids).items() if count > 1)
+
+    report = {
+        'version': TOPOLOGY_VERSION,
+        'blocks': len(blocks),
+        'expected_blocks': len(expected_ids) if expected_ids is not None else None,
+        'settings': {'gap_width': gap_width, 'area_tolerance': area_tolerance, 'arc_samples': num_samples},
+        'pairs': {relation: int((relations == relation).sum()) for relation in ('radial', 'ring', 'corner')},
+        'total_overlap_area': float(overlap_area.sum()),
+        'total_gap_area': float(gap_area.sum()),
+        'max_overlap_area': float(overlap_area.max()) if len(left) else 0.0,
+        'max_gap_area': float(gap_area.max()) if len(left) else 0.0,
+        'overlaps': overlap_entries,
+        'gaps': gap_entries,
+        'corner_mismatches': mismatches,
+        'invalid_outlines': [ids[row] for row in np.nonzero(~valid)[0]],
+        'missing_blocks': missing,
+        'unexpected_blocks': unexpected,
+        'duplicate_blocks': duplicates
+    }
+    report['ok'] = not any(report[key] for key in ('overlaps', 'gaps', 'corner_mismatches', 'invalid_outlines',
+                                                   'missing_blocks', 'unexpected_blocks', 'duplicate_blocks'))
+
+    def flagged(areas, mask):
+        return [k for k in range(len(left)) if mask[k] and areas[k] > area_tolerance]
+
+    highlights = {
+        'ids': ids,
+        'outlines': polygons,
+        'overlaps': [(ids[left[k]], ids[right[k]], overlaps[k]) for k in flagged(overlap_area, np.ones(len(left), dtype=bool))],
+        # Sliver geometry is only cut out for the flagged pairs; the overlay is all that needs it
+        'gaps': [(ids[left[k]], ids[right[k]], shapely.difference(closed[union_index[k]], unions[union_index[k]]))
+                 for k in flagged(gap_area, edge_pairs)],
+        'corners': [(mismatch['corner'], point) for mismatch in mismatches for point in mismatch['points']]
+    }
+    return report, highlights
+
+def write_topology_report(report, output_file):
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return output_file
+
+def geometry_path_data(geometry, precision=2):
+    """SVG path data for a (multi)polygon's rings"""
+    parts = []
+    for polygon in shapely.get_parts(geometry):
+        if polygon.geom_type != 'Polygon' or polygon.is_empty:
+            continue
+        for ring in [polygon.exterior, *polygon.interiors]:
+            coords = np.asarray(ring.coords)
+            parts.append("M" + " L".join(f"{x:.{precision}f},{y:.{precision}f}" for x, y in coords) + " Z")
+    return " ".join(parts)
+
+def write_topology_overlay(highlights, output_file, padding=20):
+    """Standalone SVG: block outlines in grey, overlaps in red, gap slivers in blue, mismatched corners in orange"""
+    min_x, min_y, max_x, max_y = shapely.total_bounds(highlights['outlines'])
+    view_box = f"{min_x - padding:.2f} {min_y - padding:.2f} {max_x - min_x + 2 * padding:.2f} {max_y - min_y + 2 * padding:.2f}"
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{view_box}">',
+        '  <g id="Block_Outlines" fill="none" stroke="#999" stroke-width="0.3">'
+    ]
+    for block_id, outline in zip(highlights['ids'], highlights['outlines']):
+        lines.append(f'    <path id="{block_id}" d="{geometry_path_data(outline)}"/>')
+    lines.append('  </g>')
+    # Slivers are often a fraction of a pixel wide, so issues get a thick stroke as well as a fill
+    for group_id, color, key in (('Overlaps', '#e00', 'overlaps'), ('Gaps', '#06f', 'gaps')):
+        lines.append(f'  <g id="{group_id}" fill="{color}" stroke="{color}" stroke-width="2" stroke-opacity="0.5">')
+        for a, b, geometry in highlights[key]:
+            lines.append(f'    <path d="{geometry_path_data(geometry)}"><title>{a} / {b}</title></path>')
+        lines.append('  </g>')
+    lines.append('  <g id="Corner_Mismatches" fill="none" stroke="#f80" stroke-width="1">')
+    for corner, (x, y) in highlights['corners']:
+        lines.append(f'    <circle cx="{x:.2f}" cy="{y:.2f}" r="4"><title>{corner}</title></circle>')
+    lines.append('  </g>')
+    lines.append('</svg>')
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    return output_file
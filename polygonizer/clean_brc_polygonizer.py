@@ -1,110 +1,202 @@
 #!/usr/bin/env python3
 """
 Clean BRC Polygonizer for Manual Edits Input
-Creates 96 inner blocks + 160 outer blocks = 256 total
+Creates the inner (30-minute) and outer (15-minute) blocks between the ring
+and radial roads: 96 inner + 160 outer = 256 on the checked-in layout
 Handles exception polygons around 6:00 between Esplanade and A
 """
 
 import svgpathtools
-from svgpathtools import svg2paths2, Path, Line, Arc, wsvg, parse_path
+from svgpathtools import svg2paths2, Path, Line, Arc, CubicBezier, QuadraticBezier, wsvg, parse_path
+import shapely
 from shapely.geometry import Polygon, Point, LineString
 from shapely.ops import nearest_points
+from scipy.spatial import cKDTree
 import numpy as np
+import gzip
+import io
 import math
+import os
+import re
+import sys
+import argparse
+import json
+import hashlib
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from contextlib import ExitStack
+from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import ProcessPoolExecutor
+
+from block_adjacency import write_block_adjacency
+from block_geocoder import BlockGeocoder, extract_plazas
+from block_locator import svg_arc_centers
+from block_manifest import write_block_manifest
+from block_table import BlockTable
+from block_topology import arc_samples, check_block_topology, write_topology_overlay, write_topology_report
+from radial_index import RadialIndex, radial_times, time_minutes
+from ring_stitching import stitch_ring_fragments
+from run_report import REPORT
+
+# Road groups in the input SVG, and the attributes that carry their geometry
+ROAD_GROUP_IDS = ['Ring_Roads', 'Main_Radial_Roads', 'Secondary_Radial_Roads']
+ROAD_GEOMETRY_ATTRS = ['d', 'points', 'x1', 'y1', 'x2', 'y2']
+
+def scan_road_groups(svg_file, group_ids=ROAD_GROUP_IDS):
+    """Stream the SVG with iterparse and collect only the road elements.
+
+    Returns {group_id: [(subgroup_id, tag, attrib), ...]} for each group
+    found (the first element with that id, like root.find), listing every
+    direct child of the group's id'd subgroups in document order. Every
+    element is cleared and detached as soon as it ends, so labels, icons
+    and embedded <image> data never accumulate in memory.
+    """
+    groups = {}
+    stack = []
+    group_depth = None
+    for event, elem in ET.iterparse(svg_file, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            elem_id = elem.get('id')
+            if group_depth is None and elem_id in group_ids and elem_id not in groups:
+                group_depth = len(stack)
+                groups[elem_id] = []
+            continue
+
+        depth = len(stack)
+        if group_depth is not None:
+            if depth == group_depth + 2 and stack[-2].get('id'):
+                group_id = stack[group_depth - 1].get('id')
+                tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+                groups[group_id].append((stack[-2].get('id'), tag, dict(elem.attrib)))
+            elif depth == group_depth:
+                group_depth = None
+
+        stack.pop()
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+    return groups
+
+def polyline_coordinates(points_str):
+    """Parse a polyline 'points' attribute into an (n, 2) float array"""
+    return np.array(points_str.replace(',', ' ').split(), dtype=float).reshape(-1, 2)
+
+def merge_radial_elements(paths, time_str, center, min_length=2.0):
+    """Join a radial drawn as several elements into one path running out from the Man.
+
+    Keeps only segments on the radial's own side of the Man (a polyline drawn on
+    through the Man, or a piece sitting at the opposite time, is cut away) and
+    drops pieces shorter than min_length. A single surviving element is returned
+    unchanged. Returns (path, dropped_length).
+    """
+    angle = time_to_brc_angle(time_str)
+    direction = complex(math.cos(angle), math.sin(angle))
+    origin = complex(*center)
+
+    pieces, dropped = [], 0.0
+    for path in paths:
+        segments = [segment for segment in path
+                    if (((segment.start + segment.end) / 2 - origin) * direction.conjugate()).real > 0]
+        length = sum(segment.length() for segment in segments)
+        dropped += path.length() - length
+        if length < min_length:
+            dropped += length
+        elif segments:
+            pieces.append((path, segments))
+
+    if len(pieces) == 1 and len(pieces[0][1]) == len(pieces[0][0]):
+        return pieces[0][0], dropped
+    segments = [segment if abs(segment.start - origin) <= abs(segment.end - origin) else segment.reversed()
+                for _, piece in pieces for segment in piece]
+    segments.sort(key=lambda segment: abs(segment.start - origin))
+    return Path(*segments), dropped
 
 def extract_roads_from_manual_svg(svg_file):
     """Extract roads from manually edited SVG structure"""
     print(f"🏗️  Extracting roads from {svg_file}...")
     
-    tree = ET.parse(svg_file)
-    root = tree.getroot()
+    road_groups = scan_road_groups(svg_file)
     
     all_rings = {}
     all_radials = {}
     center = (622.5, 272.04)
     
     # Extract Ring Roads
-    ring_group = root.find(".//*[@id='Ring_Roads']")
-    if ring_group is not None:
+    if 'Ring_Roads' in road_groups:
         print("🔄 Processing Ring Roads...")
-        for ring_subgroup in ring_group:
-            ring_id = ring_subgroup.get('id')
-            if ring_id:
-                for path_elem in ring_subgroup:
-                    elem_tag = path_elem.tag.split('}')[-1] if '}' in path_elem.tag else path_elem.tag
-                    if elem_tag == 'path':
-                        d = path_elem.get('d')
-                        if d:
-                            try:
-                                path = parse_path(d)
-                                if ring_id in all_rings:
-                                    combined = Path(*all_rings[ring_id], *path)
-                                    all_rings[ring_id] = combined
-                                else:
-                                    all_rings[ring_id] = path
-                                print(f"  ✓ Added ring {ring_id}")
-                            except Exception as e:
-                                print(f"  ✗ Error parsing ring {ring_id}: {e}")
+        for ring_id, elem_tag, attrib in road_groups['Ring_Roads']:
+            d = attrib.get('d')
+            if elem_tag == 'path' and d:
+                try:
+                    all_rings.setdefault(ring_id, []).append(parse_path(d))
+                    REPORT.detail(f"  ✓ Added ring {ring_id}")
+                except Exception as e:
+                    print(f"  ✗ Error parsing ring {ring_id}: {e}")
+
+        # Join each ring's fragments into one contour ordered around the city
+        for ring_id, paths in all_rings.items():
+            all_rings[ring_id], gaps, fragments = stitch_ring_fragments(paths, center)
+            REPORT.count('ring_fragments', fragments)
+            if fragments > 1:
+                REPORT.count('ring_gaps', len(gaps))
+                gap_note = f" ({len(gaps)} gap(s) left open: {', '.join(f'{gap:.1f}px' for gap in gaps)})" if gaps else ""
+                REPORT.detail(f"  🧵 Stitched ring {ring_id} from {fragments} fragments{gap_note}")
     
     # Extract Main Radial Roads
-    main_radial_group = root.find(".//*[@id='Main_Radial_Roads']")
-    if main_radial_group is not None:
+    if 'Main_Radial_Roads' in road_groups:
         print("⏰ Processing Main Radial Roads...")
-        for radial_subgroup in main_radial_group:
-            radial_id = radial_subgroup.get('id')
-            if radial_id:
-                clean_id = radial_id.lstrip('_')
-                
-                for elem in radial_subgroup:
-                    elem_tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+        radial_elements = {}
+        for radial_id, elem_tag, attrib in road_groups['Main_Radial_Roads']:
+            clean_id = radial_id.lstrip('_')
+            
+            if elem_tag == 'line':
+                if all(attrib.get(attr) is not None for attr in ['x1', 'y1', 'x2', 'y2']):
+                    x1, y1, x2, y2 = (float(attrib[attr]) for attr in ['x1', 'y1', 'x2', 'y2'])
+                    radial_elements.setdefault(clean_id, []).append((elem_tag, Path(Line(complex(x1, y1), complex(x2, y2)))))
                     
-                    if elem_tag == 'line':
-                        if all(elem.get(attr) is not None for attr in ['x1', 'y1', 'x2', 'y2']):
-                            x1, y1 = float(elem.get('x1')), float(elem.get('y1'))
-                            x2, y2 = float(elem.get('x2')), float(elem.get('y2'))
-                            line_path = Path(Line(complex(x1, y1), complex(x2, y2)))
-                            all_radials[clean_id] = line_path
-                            print(f"  ✓ Added main radial {clean_id}")
-                            
-                    elif elem_tag == 'polyline':
-                        points_str = elem.get('points')
-                        if points_str:
-                            try:
-                                coords_flat = list(map(float, points_str.replace(',', ' ').split()))
-                                coords = [complex(coords_flat[i], coords_flat[i+1]) 
-                                         for i in range(0, len(coords_flat), 2)]
-                                
-                                if len(coords) >= 2:
-                                    lines = [Line(coords[i], coords[i+1]) for i in range(len(coords) - 1)]
-                                    polyline_path = Path(*lines)
-                                    all_radials[clean_id] = polyline_path
-                                    print(f"  ✓ Added main radial {clean_id}")
-                            except Exception as e:
-                                print(f"  ✗ Error parsing polyline: {e}")
+            elif elem_tag == 'polyline':
+                points_str = attrib.get('points')
+                if points_str:
+                    try:
+                        coords = polyline_coordinates(points_str)
+                        if len(coords) >= 2:
+                            coords = coords[:, 0] + 1j * coords[:, 1]
+                            radial_elements.setdefault(clean_id, []).append(
+                                (elem_tag, Path(*[Line(start, end) for start, end in zip(coords[:-1], coords[1:])])))
+                    except Exception as e:
+                        print(f"  ✗ Error parsing polyline: {e}")
+        
+        # Some subgroups hold more than one element: the road drawn in two pieces (6:00), a
+        # stub of a few px at the Man, or a piece of the opposite radial (3:30). Merge them
+        # into one path on the radial's side rather than letting the last element win
+        for clean_id, elements in radial_elements.items():
+            times = radial_times(clean_id)
+            if len(elements) > 1 and len(times) == 1:
+                all_radials[clean_id], dropped = merge_radial_elements(
+                    [path for _, path in elements], times[0], center)
+                REPORT.count('merged_radial_elements', len(elements))
+                print(f"  ⚠️  Radial {clean_id} is drawn as {len(elements)} elements "
+                      f"({', '.join(tag for tag, _ in elements)}); merged them, dropping {dropped:.0f}px of stubs "
+                      f"and road past the Man")
+            else:
+                all_radials[clean_id] = elements[-1][1]
+            REPORT.detail(f"  ✓ Added main radial {clean_id}")
     
     # Extract Secondary Radial Roads  
-    secondary_radial_group = root.find(".//*[@id='Secondary_Radial_Roads']")
-    if secondary_radial_group is not None:
+    if 'Secondary_Radial_Roads' in road_groups:
         print("📍 Processing Secondary Radial Roads...")
-        for radial_subgroup in secondary_radial_group:
-            radial_id = radial_subgroup.get('id')
-            if radial_id:
-                clean_id = radial_id.lstrip('_')
-                
-                for elem in radial_subgroup:
-                    elem_tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                    if elem_tag == 'line':
-                        if all(elem.get(attr) is not None for attr in ['x1', 'y1', 'x2', 'y2']):
-                            x1, y1 = float(elem.get('x1')), float(elem.get('y1'))
-                            x2, y2 = float(elem.get('x2')), float(elem.get('y2'))
-                            line_path = Path(Line(complex(x1, y1), complex(x2, y2)))
-                            
-                            # Use unique ID for secondary radials
-                            unique_id = f"{clean_id}_sec" if clean_id in all_radials else clean_id
-                            all_radials[unique_id] = line_path
-                            print(f"  ✓ Added secondary radial {unique_id}")
+        for radial_id, elem_tag, attrib in road_groups['Secondary_Radial_Roads']:
+            clean_id = radial_id.lstrip('_')
+            if elem_tag == 'line':
+                if all(attrib.get(attr) is not None for attr in ['x1', 'y1', 'x2', 'y2']):
+                    x1, y1, x2, y2 = (float(attrib[attr]) for attr in ['x1', 'y1', 'x2', 'y2'])
+                    line_path = Path(Line(complex(x1, y1), complex(x2, y2)))
+                    
+                    # Use unique ID for secondary radials
+                    unique_id = f"{clean_id}_sec" if clean_id in all_radials else clean_id
+                    all_radials[unique_id] = line_path
+                    REPORT.detail(f"  ✓ Added secondary radial {unique_id}")
     
     # Generate missing time increments if needed
     print("🕐 Generating missing time increments...")
@@ -132,7 +224,7 @@ def extract_roads_from_manual_svg(svg_file):
             
             radial_path = Path(Line(start, end))
             all_radials[time_str] = radial_path
-            print(f"  ✓ Generated missing radial {time_str}")
+            REPORT.detail(f"  ✓ Generated missing radial {time_str}")
     
     print(f"📊 Extraction complete:")
     print(f"  Rings: {len(all_rings)} found")
@@ -142,7 +234,104 @@ def extract_roads_from_manual_svg(svg_file):
     
     return all_rings, all_radials
 
-def find_improved_intersections(ring_path, radial_path, time_str=None, center=(622.5, 272.04), tolerance=5.0):
+def compile_path(path):
+    """Precompute a Path's segment table for batched evaluation with evaluate_path.
+
+    Mirrors svgpathtools' own global parameterization: each segment owns a
+    slice of [0, 1] proportional to its length. Line, QuadraticBezier and
+    CubicBezier segments are stored as power-basis coefficients in the same
+    Horner form svgpathtools uses; Arc segments keep their parametric form.
+    """
+    segments = list(path)
+    if not segments:
+        raise ValueError("This path contains no segments!")
+
+    lengths = [segment.length() for segment in segments]
+    total_length = sum(lengths)
+    fractions = [length / total_length for length in lengths] if total_length else lengths
+
+    # Accumulate segment boundaries the same way Path.point does
+    starts, ends = [], []
+    segment_start = 0
+    for fraction in fractions:
+        starts.append(segment_start)
+        segment_start = segment_start + fraction
+        ends.append(segment_start)
+
+    coefficients = np.zeros((len(segments), 4), dtype=complex)
+    is_arc = np.zeros(len(segments), dtype=bool)
+    arc_params = np.zeros((len(segments), 6))
+
+    for i, segment in enumerate(segments):
+        if isinstance(segment, Line):
+            coefficients[i] = [segment.start, segment.end - segment.start, 0, 0]
+        elif isinstance(segment, QuadraticBezier):
+            p0, p1, p2 = segment.start, segment.control, segment.end
+            coefficients[i] = [p0, 2 * (p1 - p0), p0 - 2 * p1 + p2, 0]
+        elif isinstance(segment, CubicBezier):
+            p0, p1, p2, p3 = segment.start, segment.control1, segment.control2, segment.end
+            coefficients[i] = [p0, 3 * (p1 - p0), 3 * (p0 + p2) - 6 * p1, -p0 + 3 * (p1 - p2) + p3]
+        elif isinstance(segment, Arc):
+            is_arc[i] = True
+            arc_params[i] = [segment.theta, segment.delta, segment.rot_matrix.real, segment.rot_matrix.imag,
+                             segment.radius.real, segment.radius.imag]
+            coefficients[i, 0] = segment.center
+        else:
+            raise TypeError(f"Unsupported segment type: {type(segment).__name__}")
+
+    # Segments that don't start where the previous one ended (open gaps between ring fragments)
+    breaks = [False] + [abs(segment.start - previous.end) > 1e-9 for previous, segment in zip(segments, segments[1:])]
+
+    return {
+        'starts': np.array(starts),
+        'ends': np.array(ends),
+        'breaks': np.array(breaks),
+        'coefficients': coefficients,
+        'is_arc': is_arc,
+        'arc_params': arc_params
+    }
+
+def segment_indices(compiled, T):
+    """Index of the segment each global t falls in: the first whose end reaches t, as in
+    Path.point, with t == 1 always mapping to the last segment"""
+    last = len(compiled['ends']) - 1
+    index = np.minimum(np.searchsorted(compiled['ends'], T, side='left'), last)
+    return np.where(T >= 1.0, last, index)
+
+def evaluate_path(path, t_values):
+    """Evaluate a Path (or compile_path table) at many global t values in one call.
+
+    Equivalent to np.array([path.point(t) for t in t_values]) without the
+    per-point segment walk. Returns a complex array shaped like t_values.
+    """
+    compiled = path if isinstance(path, dict) else compile_path(path)
+    T = np.asarray(t_values, dtype=float)
+    REPORT.count('path_points_evaluated', T.size)
+    ends = compiled['ends']
+
+    index = segment_indices(compiled, T)
+    seg_start = compiled['starts'][index]
+    seg_span = ends[index] - seg_start
+    with np.errstate(divide='ignore', invalid='ignore'):
+        local_t = np.where(seg_span > 0, (T - seg_start) / seg_span, 0.0)
+    local_t = np.where(T >= 1.0, 1.0, local_t)
+
+    c0, c1, c2, c3 = compiled['coefficients'][index].T
+    points = c0 + local_t * (c1 + local_t * (c2 + local_t * c3))
+
+    arc_mask = compiled['is_arc'][index]
+    if np.any(arc_mask):
+        theta, delta, cosphi, sinphi, rx, ry = compiled['arc_params'][index[arc_mask]].T
+        center = c0[arc_mask]
+        angle = (theta + local_t[arc_mask] * delta) * math.pi / 180
+        x = rx * cosphi * np.cos(angle) - ry * sinphi * np.sin(angle) + center.real
+        y = rx * sinphi * np.cos(angle) + ry * cosphi * np.sin(angle) + center.imag
+        points[arc_mask] = x + 1j * y
+
+    return points
+
+def find_improved_intersections(ring_path, radial_path, time_str=None, center=(622.5, 272.04), tolerance=5.0,
+                                compiled_ring=None):
     """Find intersections between ring and radial paths with improved accuracy"""
     intersections = []
     
@@ -152,7 +341,9 @@ def find_improved_intersections(ring_path, radial_path, time_str=None, center=(6
         for (T1, seg1, t1), (T2, seg2, t2) in intersect_results:
             point = ring_path.point(T1)
             intersections.append((point.real, point.imag))
+        REPORT.count('path_point_calls', len(intersect_results))
         if intersections:
+            REPORT.count('find_improved_intersections.direct')
             return intersections
     except Exception:
         pass
@@ -167,30 +358,19 @@ def find_improved_intersections(ring_path, radial_path, time_str=None, center=(6
             angle_rad = math.radians(brc_angle)
             
             # Find intersection by sampling ring at high resolution
-            best_intersection = None
-            min_angle_diff = float('inf')
+            ring_points = evaluate_path(compiled_ring if compiled_ring is not None else ring_path,
+                                        np.linspace(0, 1, 2000))  # Increased from 500 to 2000
             
-            # Use high resolution for better accuracy
-            for t in np.linspace(0, 1, 2000):  # Increased from 500 to 2000
-                ring_point = ring_path.point(t)
-                ring_coords = (ring_point.real, ring_point.imag)
-                
-                # Calculate angle from center to this ring point
-                dx = ring_coords[0] - center[0]
-                dy = ring_coords[1] - center[1]
-                point_angle = math.atan2(dy, dx)
-                
-                # Normalize angles to [0, 2π]
-                point_angle = (point_angle + 2 * math.pi) % (2 * math.pi)
-                target_angle = (angle_rad + 2 * math.pi) % (2 * math.pi)
-                
-                # Calculate angular difference
-                angle_diff = min(abs(point_angle - target_angle), 
-                               2 * math.pi - abs(point_angle - target_angle))
-                
-                if angle_diff < min_angle_diff:
-                    min_angle_diff = angle_diff
-                    best_intersection = ring_coords
+            # Calculate angle from center to every ring point, normalized to [0, 2π]
+            point_angles = (np.arctan2(ring_points.imag - center[1], ring_points.real - center[0]) + 2 * math.pi) % (2 * math.pi)
+            target_angle = (angle_rad + 2 * math.pi) % (2 * math.pi)
+            
+            # Calculate angular difference; argmin keeps the first best sample
+            raw_diffs = np.abs(point_angles - target_angle)
+            angle_diffs = np.minimum(raw_diffs, 2 * math.pi - raw_diffs)
+            best_index = int(np.argmin(angle_diffs))
+            min_angle_diff = float(angle_diffs[best_index])
+            best_intersection = (float(ring_points[best_index].real), float(ring_points[best_index].imag))
             
             if best_intersection and min_angle_diff < math.radians(5):  # Tighter tolerance - within 5 degrees
                 # Project intersection onto perfect radial line for straight radials
@@ -204,6 +384,7 @@ def find_improved_intersections(ring_path, radial_path, time_str=None, center=(6
                 perfect_intersection = (perfect_x, perfect_y)
                 
                 intersections.append(perfect_intersection)
+                REPORT.count('find_improved_intersections.angle')
                 return intersections
                 
         except Exception:
@@ -211,72 +392,316 @@ def find_improved_intersections(ring_path, radial_path, time_str=None, center=(6
     
     # Fallback: high-resolution closest point method
     try:
-        # Sample both paths at higher resolution
-        ring_points = [(ring_path.point(t).real, ring_path.point(t).imag) 
-                      for t in np.linspace(0, 1, 2000)]  # Increased from 1000
-        radial_points = [(radial_path.point(t).real, radial_path.point(t).imag) 
-                        for t in np.linspace(0, 1, 1000)]  # Increased from 500
-        
-        # Find closest approach points
-        min_distance = float('inf')
-        best_intersection = None
-        
-        for ring_pt in ring_points:
-            for radial_pt in radial_points:
-                dist = math.sqrt((ring_pt[0] - radial_pt[0])**2 + (ring_pt[1] - radial_pt[1])**2)
-                if dist < min_distance:
-                    min_distance = dist
-                    best_intersection = ((ring_pt[0] + radial_pt[0]) / 2, 
-                                       (ring_pt[1] + radial_pt[1]) / 2)
-        
-        if min_distance < tolerance * 3:  # More lenient tolerance for fallback
+        best_intersection, min_distance = find_closest_approach(
+            compiled_ring if compiled_ring is not None else ring_path, radial_path)
+
+        if best_intersection is not None and min_distance < tolerance * 3:  # More lenient tolerance for fallback
             intersections.append(best_intersection)
-            
+            REPORT.count('find_improved_intersections.closest')
+
     except Exception:
         pass
-    
+
+    if not intersections:
+        REPORT.count('find_improved_intersections.none')
     return intersections
 
-def extract_bezier_curve_from_arc(ring_path, start_point, end_point, tolerance=20.0):
+def find_closest_approach(ring_path, radial_path, ring_samples=2000, radial_samples=1000,
+                          chunk_size=256, refine_steps=4, refine_samples=33):
+    """Find the closest approach between two paths with batched NumPy distances.
+
+    Both paths (Path objects or compile_path tables) are sampled once into
+    complex arrays with evaluate_path and compared chunk by chunk,
+    so the ring x radial distance matrix never has to exist in full. The best
+    sample pair is then refined on a shrinking local grid, which converges to
+    the true crossing when the paths intersect between samples.
+
+    Returns ((x, y) midpoint of the closest pair, distance), or (None, inf).
+    """
+    ring_t = np.linspace(0, 1, ring_samples)
+    radial_t = np.linspace(0, 1, radial_samples)
+    ring_table = ring_path if isinstance(ring_path, dict) else compile_path(ring_path)
+    radial_table = radial_path if isinstance(radial_path, dict) else compile_path(radial_path)
+    ring_points = evaluate_path(ring_table, ring_t)
+    radial_points = evaluate_path(radial_table, radial_t)
+
+    # Coarse pass: row-major argmin per chunk keeps the first minimum, like a nested scan
+    min_distance = float('inf')
+    best_i, best_j = None, None
+    for start in range(0, len(ring_points), chunk_size):
+        distances = np.abs(ring_points[start:start + chunk_size, None] - radial_points[None, :])
+        flat_index = int(np.argmin(distances))
+        i, j = divmod(flat_index, len(radial_points))
+        if distances[i, j] < min_distance:
+            min_distance = float(distances[i, j])
+            best_i, best_j = start + i, j
+
+    if best_i is None:
+        return None, float('inf')
+
+    best_ring_t = ring_t[best_i]
+    best_radial_t = radial_t[best_j]
+    best_ring_point = ring_points[best_i]
+    best_radial_point = radial_points[best_j]
+
+    # Refinement: search a local grid around the best pair, halving the window each step
+    ring_step = 1.0 / (ring_samples - 1)
+    radial_step = 1.0 / (radial_samples - 1)
+    for _ in range(refine_steps):
+        local_ring_t = np.clip(np.linspace(best_ring_t - ring_step, best_ring_t + ring_step, refine_samples), 0, 1)
+        local_radial_t = np.clip(np.linspace(best_radial_t - radial_step, best_radial_t + radial_step, refine_samples), 0, 1)
+        local_ring = evaluate_path(ring_table, local_ring_t)
+        local_radial = evaluate_path(radial_table, local_radial_t)
+
+        distances = np.abs(local_ring[:, None] - local_radial[None, :])
+        i, j = np.unravel_index(int(np.argmin(distances)), distances.shape)
+        if distances[i, j] < min_distance:
+            min_distance = float(distances[i, j])
+            best_ring_t, best_radial_t = local_ring_t[i], local_radial_t[j]
+            best_ring_point, best_radial_point = local_ring[i], local_radial[j]
+
+        ring_step /= 2
+        radial_step /= 2
+
+    midpoint = (best_ring_point + best_radial_point) / 2
+    return (float(midpoint.real), float(midpoint.imag)), min_distance
+
+def time_to_brc_angle(time_str):
+    """Convert a clock time like '7:30' to its BRC angle in radians (3:00 = 0, clockwise)"""
+    hour, minute = map(int, time_str.split(':'))
+    clock_angle = (hour * 30 + minute * 0.5) % 360
+    brc_angle = (clock_angle - 90) % 360
+    return math.radians(brc_angle)
+
+def fit_ring_circle(ring_path, num_samples=720):
+    """Fit a circle (center, radius) to a ring path by algebraic least squares.
+
+    The ring is sampled once; the residual reported is the RMS of the radial
+    distance from each sample to the fitted circle, so rings that are not
+    circular (e.g. the Esplanade around the 6:00 exception zone) stand out.
+    """
+    points = evaluate_path(ring_path, np.linspace(0, 1, num_samples))
+    x, y = points.real, points.imag
+
+    # x² + y² = 2ax + 2by + c  →  center (a, b), radius² = c + a² + b²
+    design = np.column_stack([2 * x, 2 * y, np.ones_like(x)])
+    (cx, cy, c), *_ = np.linalg.lstsq(design, x * x + y * y, rcond=None)
+    radius = math.sqrt(c + cx * cx + cy * cy)
+
+    deviations = np.abs(np.hypot(x - cx, y - cy) - radius)
+
+    return {
+        'center': (float(cx), float(cy)),
+        'radius': radius,
+        'residual': float(np.sqrt(np.mean(deviations ** 2))),
+        'max_residual': float(deviations.max()),
+        # Sorted polar angles of the samples describe which part of the circle the ring covers
+        'covered_angles': np.sort(np.arctan2(y - cy, x - cx))
+    }
+
+def circle_covers_angle(circle, angle, tolerance=math.radians(5)):
+    """Check whether the fitted ring actually passes within tolerance of a polar angle"""
+    covered = circle['covered_angles']
+    angle = (angle + math.pi) % (2 * math.pi) - math.pi
+    index = np.searchsorted(covered, angle)
+    neighbours = covered[[index % len(covered), (index - 1) % len(covered)]]
+    diffs = np.abs(neighbours - angle)
+    return float(np.min(np.minimum(diffs, 2 * math.pi - diffs))) < tolerance
+
+def find_circle_intersections(circle, radial_path, time_str=None, center=(622.5, 272.04)):
+    """Solve ring/radial intersections analytically against a fitted ring circle"""
+    REPORT.count('find_circle_intersections')
+    cx, cy = circle['center']
+    radius = circle['radius']
+    intersections = []
+
+    # Intersect each straight radial segment with the circle: |p0 + u·d - c|² = r²
+    for segment in radial_path:
+        if not isinstance(segment, Line):
+            continue
+        p0 = segment.start
+        d = segment.end - segment.start
+        fx, fy = p0.real - cx, p0.imag - cy
+        a = d.real * d.real + d.imag * d.imag
+        b = 2 * (fx * d.real + fy * d.imag)
+        c = fx * fx + fy * fy - radius * radius
+        disc = b * b - 4 * a * c
+        if a == 0 or disc < 0:
+            continue
+        sqrt_disc = math.sqrt(disc)
+        for u in ((-b - sqrt_disc) / (2 * a), (-b + sqrt_disc) / (2 * a)):
+            if 0 <= u <= 1:
+                point = p0 + u * d
+                if circle_covers_angle(circle, math.atan2(point.imag - cy, point.real - cx)):
+                    intersections.append((point.real, point.imag))
+
+    if intersections:
+        if time_str and len(intersections) > 1:
+            # Prefer the crossing closest to the radial's nominal clock angle
+            target = time_to_brc_angle(time_str)
+            intersections.sort(key=lambda p: abs((math.atan2(p[1] - center[1], p[0] - center[0]) - target + math.pi)
+                                                 % (2 * math.pi) - math.pi))
+        return intersections
+
+    # Radial does not reach the ring: cast the ideal radial ray from the Man instead
+    if time_str and ':' in time_str and '-' not in time_str:
+        angle_rad = time_to_brc_angle(time_str)
+        direction = complex(math.cos(angle_rad), math.sin(angle_rad))
+        fx, fy = center[0] - cx, center[1] - cy
+        b = 2 * (fx * direction.real + fy * direction.imag)
+        c = fx * fx + fy * fy - radius * radius
+        disc = b * b - 4 * c
+        if disc >= 0:
+            distance = (-b + math.sqrt(disc)) / 2
+            point = complex(*center) + distance * direction
+            if distance > 0 and circle_covers_angle(circle, math.atan2(point.imag - cy, point.real - cx)):
+                intersections.append((point.real, point.imag))
+
+    return intersections
+
+def build_ring_index(ring_path, num_samples=1000):
+    """Sample a ring once into a KD-tree for nearest-parameter lookups.
+
+    The same index is shared by every block edge on the ring, so the ring is
+    sampled once per run instead of once per block side.
+    """
+    compiled = compile_path(ring_path)
+    t_values = np.linspace(0, 1, num_samples)
+    points = evaluate_path(compiled, t_values)
+
+    # Cumulative arc length at each sample; steps that jump a gap between fragments add nothing
+    steps = np.abs(np.diff(points))
+    segment_breaks = np.cumsum(compiled['breaks'])[segment_indices(compiled, t_values)]
+    steps[np.diff(segment_breaks) > 0] = 0.0
+
+    return {
+        'compiled': compiled,
+        'closed': abs(ring_path.start - ring_path.end) < 1e-6,
+        't': t_values,
+        'points': points,
+        'lengths': np.concatenate([[0.0], np.cumsum(steps)]),
+        'tree': cKDTree(np.column_stack([points.real, points.imag]))
+    }
+
+def nearest_ring_parameter(ring_index, point):
+    """Find the sampled ring parameter t closest to a point in O(log n). Returns (t, distance)."""
+    distance, index = ring_index['tree'].query((point[0], point[1]))
+    return float(ring_index['t'][index]), float(distance)
+
+def ring_length_at(ring_index, t):
+    """Arc length (px) along the ring up to parameter t, from the ring index's cumulative-length table"""
+    return np.interp(t, ring_index['t'], ring_index['lengths'])
+
+def ring_parameter_at_length(ring_index, length):
+    """Ring parameter t at an arc length (px) along the ring; the inverse of ring_length_at"""
+    return np.interp(length, ring_index['lengths'], ring_index['t'])
+
+def find_arc_parameters(ring_path, start_point, end_point, tolerance, ring_index=None):
+    """Find ring parameters for both arc endpoints, or None where a point is off the ring"""
+    if ring_index is None:
+        ring_index = build_ring_index(ring_path)
+
+    start_t, start_dist = nearest_ring_parameter(ring_index, start_point)
+    end_t, end_dist = nearest_ring_parameter(ring_index, end_point)
+
+    return (start_t if start_dist < tolerance else None,
+            end_t if end_dist < tolerance else None)
+
+def arc_parameter_values(start_t, end_t, num_samples, closed=False):
+    """Ring parameters from start_t to end_t, wrapping through t=0 only on closed rings"""
+    if start_t > end_t and closed:
+        # Handle wrap-around
+        half = num_samples // 2
+        return np.concatenate([np.linspace(start_t, 1, half), np.linspace(0, end_t, num_samples - half)])
+    # Open rings (the city's horseshoe) run backwards instead of through the gap
+    return np.linspace(start_t, end_t, num_samples)
+
+def sample_arc_from_ring(ring_path, start_point, end_point, tolerance=20.0, ring_index=None, num_samples=20):
+    """Sample the ring between two intersection points, or None if either is off the ring"""
+    if ring_index is None:
+        ring_index = build_ring_index(ring_path)
+
+    start_t, end_t = find_arc_parameters(ring_path, start_point, end_point, tolerance, ring_index)
+    if start_t is None or end_t is None:
+        return None
+
+    t_values = arc_parameter_values(start_t, end_t, num_samples, ring_index['closed'])
+    arc_points = evaluate_path(ring_index['compiled'], t_values)
+    return [(point.real, point.imag) for point in arc_points.tolist()]
+
+def fit_cubic_beziers(point_sets, newton_iterations=2):
+    """Least-squares fit one cubic Bezier to each point set in a single batched solve.
+
+    point_sets is a (curves, samples, 2) array. Endpoints are pinned to the
+    first and last sample; the two inner control points solve the 2x2 normal
+    equations for every curve at once using chord-length parameters, which
+    are then improved with Newton reparameterization steps.
+
+    Returns (control_points as (curves, 4, 2), max_errors as (curves,)).
+    """
+    points = np.asarray(point_sets, dtype=float)
+    p0 = points[:, :1, :]
+    p3 = points[:, -1:, :]
+
+    # Chord-length parameterization
+    chords = np.linalg.norm(np.diff(points, axis=1), axis=2)
+    u = np.concatenate([np.zeros((len(points), 1)), np.cumsum(chords, axis=1)], axis=1)
+    total = u[:, -1:]
+    u = np.divide(u, total, out=np.tile(np.linspace(0, 1, points.shape[1]), (len(points), 1)), where=total > 0)
+
+    for iteration in range(newton_iterations + 1):
+        uc = 1 - u
+        b0, b1, b2, b3 = uc ** 3, 3 * uc ** 2 * u, 3 * uc * u ** 2, u ** 3
+
+        # Solve b1·P1 + b2·P2 ≈ points - b0·P0 - b3·P3 for each curve
+        target = points - b0[..., None] * p0 - b3[..., None] * p3
+        a11 = np.sum(b1 * b1, axis=1)
+        a12 = np.sum(b1 * b2, axis=1)
+        a22 = np.sum(b2 * b2, axis=1)
+        r1 = np.sum(b1[..., None] * target, axis=1)
+        r2 = np.sum(b2[..., None] * target, axis=1)
+        det = a11 * a22 - a12 * a12
+
+        # Degenerate systems (coincident samples) fall back to thirds of the chord
+        solvable = np.abs(det) > 1e-12
+        safe_det = np.where(solvable, det, 1.0)[:, None]
+        p1 = np.where(solvable[:, None], (a22[:, None] * r1 - a12[:, None] * r2) / safe_det,
+                      p0[:, 0] + (p3[:, 0] - p0[:, 0]) / 3)
+        p2 = np.where(solvable[:, None], (a11[:, None] * r2 - a12[:, None] * r1) / safe_det,
+                      p0[:, 0] + 2 * (p3[:, 0] - p0[:, 0]) / 3)
+        p1, p2 = p1[:, None, :], p2[:, None, :]
+
+        curve = b0[..., None] * p0 + b1[..., None] * p1 + b2[..., None] * p2 + b3[..., None] * p3
+        if iteration == newton_iterations:
+            break
+
+        # Newton step on f(u) = (B(u) - point)·B'(u) for every sample
+        d1 = 3 * (uc ** 2)[..., None] * (p1 - p0) + 6 * (uc * u)[..., None] * (p2 - p1) + 3 * (u ** 2)[..., None] * (p3 - p2)
+        d2 = 6 * uc[..., None] * (p2 - 2 * p1 + p0) + 6 * u[..., None] * (p3 - 2 * p2 + p1)
+        diff = curve - points
+        numerator = np.sum(diff * d1, axis=2)
+        denominator = np.sum(d1 * d1, axis=2) + np.sum(diff * d2, axis=2)
+        step = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=np.abs(denominator) > 1e-12)
+        u = np.clip(u - step, 0, 1)
+        u[:, 0], u[:, -1] = 0, 1
+
+    max_errors = np.max(np.linalg.norm(curve - points, axis=2), axis=1)
+    control_points = np.concatenate([p0, p1, p2, p3], axis=1)
+
+    return control_points, max_errors
+
+def fit_cubic_bezier_to_points(points, newton_iterations=2):
+    """Fit a single cubic Bezier to sample points; returns [P0, P1, P2, P3] as tuples"""
+    control_points, _ = fit_cubic_beziers([points], newton_iterations)
+    return [tuple(point) for point in control_points[0].tolist()]
+
+def extract_bezier_curve_from_arc(ring_path, start_point, end_point, tolerance=20.0, ring_index=None):
     """Extract a cubic Bezier curve approximation of the arc segment"""
     try:
-        # Find parameter values
-        start_t = None
-        end_t = None
-        
-        min_start_dist = float('inf')
-        min_end_dist = float('inf')
-        
-        for t in np.linspace(0, 1, 1000):
-            point = ring_path.point(t)
-            point_coords = (point.real, point.imag)
-            
-            start_dist = math.sqrt((point_coords[0] - start_point[0])**2 + (point_coords[1] - start_point[1])**2)
-            if start_dist < min_start_dist:
-                min_start_dist = start_dist
-                if start_dist < tolerance:
-                    start_t = t
-            
-            end_dist = math.sqrt((point_coords[0] - end_point[0])**2 + (point_coords[1] - end_point[1])**2)
-            if end_dist < min_end_dist:
-                min_end_dist = end_dist
-                if end_dist < tolerance:
-                    end_t = t
+        # Sample the arc to fit a Bezier curve
+        arc_sample_points = sample_arc_from_ring(ring_path, start_point, end_point, tolerance, ring_index)
         
-        if start_t is not None and end_t is not None:
-            # Sample the arc to fit a Bezier curve
-            if start_t > end_t:
-                # Handle wrap-around
-                t_values = list(np.linspace(start_t, 1, 10)) + list(np.linspace(0, end_t, 10))
-            else:
-                t_values = np.linspace(start_t, end_t, 20)
-            
-            # Get sample points along the arc
-            arc_sample_points = []
-            for t in t_values:
-                point = ring_path.point(t)
-                arc_sample_points.append((point.real, point.imag))
-            
+        if arc_sample_points is not None:
             # Fit a cubic Bezier curve to the sample points
             if len(arc_sample_points) >= 4:
                 return fit_cubic_bezier_to_points(arc_sample_points)
@@ -331,16 +756,89 @@ def fit_circular_arc_to_points(start_point, end_point, center=(622.5, 272.04)):
     }
 
 
-def cubic_bezier_to_svg_path(control_points):
+class PathDataBuilder:
+    """Accumulates SVG path data in a list buffer, joined once by getvalue().
+
+    Coordinates are written with `precision` decimals. With relative=True,
+    commands after the initial moveto are lowercase deltas between rounded
+    absolute positions, so rounding error never accumulates along a path.
+    """
+
+    def __init__(self, precision=1, relative=False, start=None):
+        self.precision = precision
+        self.relative = relative
+        self.parts = []
+        self.current = None if start is None else self._round(start)
+        self.subpath_start = self.current
+
+    def _round(self, point):
+        return (round(point[0], self.precision), round(point[1], self.precision))
+
+    def _coords(self, point, origin=None):
+        p = self.precision
+        if origin is None:
+            return f"{point[0]:.{p}f},{point[1]:.{p}f}"
+        x, y = self._round(point)
+        return f"{x - origin[0]:.{p}f},{y - origin[1]:.{p}f}"
+
+    def _command(self, command, points, prefix=""):
+        origin = self.current if self.relative and self.current is not None else None
+        if origin is not None:
+            command = command.lower()
+        coords = " ".join(self._coords(point, origin) for point in points)
+        self.parts.append(f"{command} {prefix}{coords}")
+        self.current = self._round(points[-1])
+
+    def move_to(self, point):
+        # The first moveto is always absolute
+        self.current = None if not self.parts else self.current
+        self._command('M', [point])
+        self.subpath_start = self.current
+        return self
+
+    def line_to(self, point):
+        self._command('L', [point])
+        return self
+
+    def arc_to(self, radius, large_arc_flag, sweep_flag, point):
+        """Circular arc (rx = ry = radius, no rotation) to point"""
+        self._command('A', [point], f"{radius:.{self.precision}f},{radius:.{self.precision}f} 0 {large_arc_flag},{sweep_flag} ")
+        return self
+
+    def quad_to(self, control, point):
+        self._command('Q', [control, point])
+        return self
+
+    def cubic_to(self, control1, control2, point):
+        self._command('C', [control1, control2, point])
+        return self
+
+    def polyline(self, points):
+        """Move to the first point and draw lines through the rest"""
+        self.move_to(points[0])
+        for point in points[1:]:
+            self.line_to(point)
+        return self
+
+    def close(self):
+        self.parts.append('z' if self.relative else 'Z')
+        self.current = self.subpath_start
+        return self
+
+    def getvalue(self):
+        return " ".join(self.parts)
+
+def cubic_bezier_to_svg_path(control_points, precision=1, relative=False):
     """Convert cubic Bezier control points to SVG path data"""
+    builder = PathDataBuilder(precision, relative)
     if len(control_points) < 4:
         # Fallback to line
         if len(control_points) >= 2:
-            return f"M {control_points[0][0]:.1f},{control_points[0][1]:.1f} L {control_points[-1][0]:.1f},{control_points[-1][1]:.1f}"
-        return ""
+            builder.move_to(control_points[0]).line_to(control_points[-1])
+        return builder.getvalue()
     
     P0, P1, P2, P3 = control_points
-    return f"M {P0[0]:.1f},{P0[1]:.1f} C {P1[0]:.1f},{P1[1]:.1f} {P2[0]:.1f},{P2[1]:.1f} {P3[0]:.1f},{P3[1]:.1f}"
+    return builder.move_to(P0).cubic_to(P1, P2, P3).getvalue()
 
 def create_4_sided_arc_block(time1_inner, time2_inner, time1_outer, time2_outer, center=(622.5, 272.04), block_id=None, esplanade_ring_path=None):
     """Create proper 4-sided block using circular arcs: inner arc + radial + outer arc + radial"""
@@ -380,7 +878,7 @@ def create_4_sided_arc_block(time1_inner, time2_inner, time1_outer, time2_outer,
 
 def create_esplanade_exception_block(time1_inner, time2_inner, time1_outer, time2_outer, center=(622.5, 272.04), esplanade_ring_path=None, block_id=""):
     """Create Esplanade exception block using Rod's Ring Road arc reconstruction"""
-    print(f"🔄 Creating Esplanade exception block {block_id} with Rod's Ring Road arc...")
+    REPORT.detail(f"🔄 Creating Esplanade exception block {block_id} with Rod's Ring Road arc...")
     
     # Rod's Ring Road arc parameters
     # Center: A & 6:00 intersection point (time2_outer for Esplanade_5:30, time1_outer for Esplanade_6:00)
@@ -537,12 +1035,15 @@ def create_esplanade_exception_block(time1_inner, time2_inner, time1_outer, time
     
     return exception_block
 
-def create_4_sided_bezier_block(inner_ring_path, outer_ring_path, time1_inner, time2_inner, time1_outer, time2_outer):
+def create_4_sided_bezier_block(inner_ring_path, outer_ring_path, time1_inner, time2_inner, time1_outer, time2_outer,
+                                inner_ring_index=None, outer_ring_index=None, inner_bezier=None, outer_bezier=None):
     """Create proper 4-sided block using Bezier curves: inner arc + radial + outer arc + radial"""
     
-    # Get Bezier curve control points for rings
-    inner_bezier = extract_bezier_curve_from_arc(inner_ring_path, time1_inner, time2_inner)
-    outer_bezier = extract_bezier_curve_from_arc(outer_ring_path, time1_outer, time2_outer)
+    # Get Bezier curve control points for rings (unless already fitted in a batch)
+    if inner_bezier is None:
+        inner_bezier = extract_bezier_curve_from_arc(inner_ring_path, time1_inner, time2_inner, ring_index=inner_ring_index)
+    if outer_bezier is None:
+        outer_bezier = extract_bezier_curve_from_arc(outer_ring_path, time1_outer, time2_outer, ring_index=outer_ring_index)
     
     if len(inner_bezier) < 2 or len(outer_bezier) < 2:
         return {
@@ -571,12 +1072,15 @@ def create_4_sided_bezier_block(inner_ring_path, outer_ring_path, time1_inner, t
     
     return bezier_block
 
-def create_4_sided_block(inner_ring_path, outer_ring_path, time1_inner, time2_inner, time1_outer, time2_outer):
+def create_4_sided_block(inner_ring_path, outer_ring_path, time1_inner, time2_inner, time1_outer, time2_outer,
+                         inner_ring_index=None, outer_ring_index=None, inner_arc=None, outer_arc=None):
     """Create proper 4-sided block: inner arc + radial + outer arc + radial"""
     
     # Get curved segments for rings (fallback to old method for Shapely compatibility)
-    inner_arc = extract_bezier_curve_from_arc(inner_ring_path, time1_inner, time2_inner)
-    outer_arc = extract_bezier_curve_from_arc(outer_ring_path, time1_outer, time2_outer)
+    if inner_arc is None:
+        inner_arc = extract_bezier_curve_from_arc(inner_ring_path, time1_inner, time2_inner, ring_index=inner_ring_index)
+    if outer_arc is None:
+        outer_arc = extract_bezier_curve_from_arc(outer_ring_path, time1_outer, time2_outer, ring_index=outer_ring_index)
     
     # Convert Bezier curves to points for Shapely (sample at low resolution)
     if len(inner_arc) >= 4 and len(outer_arc) >= 4:
@@ -626,239 +1130,621 @@ def sample_bezier_curve(control_points, num_samples=10):
     return samples
 
 
-def find_best_intersection(intersections_dict, target_time):
-    """Find the best intersection point for a given time"""
-    # Try exact match first
-    if target_time in intersections_dict:
-        return intersections_dict[target_time]
-    
-    # Try compound radial names
-    for radial_id, intersection in intersections_dict.items():
-        if target_time in radial_id:
-            return intersection
-    
-    return None
+def fit_block_beziers(pending_blocks, rings, ring_indexes, tolerance=20.0, verbose=True):
+    """Fit cubic Beziers to the inner and outer ring arcs of many blocks at once.
+
+    Returns one (inner_bezier, outer_bezier, inner_max_error, outer_max_error)
+    tuple per block. Arcs whose endpoints are off the ring fall back to a
+    straight 2-point line with no error figure.
+    """
+    arc_requests = []
+    for pending in pending_blocks:
+        time1_inner, time2_inner, time1_outer, time2_outer = pending['corners']
+        arc_requests.append((pending['ring'], time1_inner, time2_inner))
+        arc_requests.append((pending['outer_ring'], time1_outer, time2_outer))
+
+    curves = [[start, end] for _, start, end in arc_requests]
+    errors = [None] * len(arc_requests)
+
+    sample_sets, sample_owners = [], []
+    for i, (ring_id, start, end) in enumerate(arc_requests):
+        samples = sample_arc_from_ring(rings[ring_id], start, end, tolerance, ring_indexes[ring_id])
+        if samples is not None and len(samples) >= 4:
+            sample_sets.append(samples)
+            sample_owners.append(i)
+
+    if sample_sets:
+        control_points, max_errors = fit_cubic_beziers(sample_sets)
+        for owner, controls, max_error in zip(sample_owners, control_points.tolist(), max_errors.tolist()):
+            curves[owner] = [tuple(point) for point in controls]
+            errors[owner] = max_error
+
+        if verbose:
+            print(f"🧮 Fitted {len(sample_sets)} Bezier arcs in one batch: "
+                  f"max error {max(max_errors):.2f}px, mean {np.mean(max_errors):.2f}px")
+
+    return [(curves[2 * k], curves[2 * k + 1], errors[2 * k], errors[2 * k + 1])
+            for k in range(len(pending_blocks))]
+
+SEGMENT_KINDS = {Line: 0, QuadraticBezier: 1, CubicBezier: 2, Arc: 3}
+
+def path_to_arrays(path):
+    """Pack a Path into compact (kinds, points) arrays for shipping to worker processes.
+
+    Each segment is one int8 kind plus four complex slots: the Bezier control
+    points, or start / radius / (rotation + flags) / end for an Arc.
+    """
+    kinds = np.zeros(len(path), dtype=np.int8)
+    points = np.zeros((len(path), 4), dtype=complex)
+    for i, segment in enumerate(path):
+        kinds[i] = SEGMENT_KINDS[type(segment)]
+        if isinstance(segment, Arc):
+            flags = int(segment.large_arc) + 2 * int(segment.sweep)
+            points[i] = [segment.start, segment.radius, complex(segment.rotation, flags), segment.end]
+        else:
+            bpoints = segment.bpoints()
+            points[i, :len(bpoints)] = bpoints
+    return kinds, points
+
+def path_from_arrays(kinds, points):
+    """Rebuild a Path from path_to_arrays output"""
+    segments = []
+    for kind, p in zip(kinds.tolist(), points.tolist()):
+        if kind == 0:
+            segments.append(Line(p[0], p[1]))
+        elif kind == 1:
+            segments.append(QuadraticBezier(p[0], p[1], p[2]))
+        elif kind == 2:
+            segments.append(CubicBezier(p[0], p[1], p[2], p[3]))
+        else:
+            flags = int(p[2].imag)
+            segments.append(Arc(p[0], p[1], p[2].real, bool(flags & 1), bool(flags & 2), p[3]))
+    return Path(*segments)
+
+def roads_to_arrays(rings, radials):
+    """Pack ring and radial dicts for a worker initializer"""
+    return ({ring_id: path_to_arrays(path) for ring_id, path in rings.items()},
+            {radial_id: path_to_arrays(path) for radial_id, path in radials.items()})
+
+# Per-process road geometry, unpacked once by init_road_worker
+_worker_roads = {}
+
+def init_road_worker(ring_arrays, radial_arrays):
+    """Process pool initializer: rebuild the road paths once per worker"""
+    _worker_roads['rings'] = {ring_id: path_from_arrays(*arrays) for ring_id, arrays in ring_arrays.items()}
+    _worker_roads['radials'] = {radial_id: path_from_arrays(*arrays) for radial_id, arrays in radial_arrays.items()}
+    _worker_roads['ring_indexes'] = {}
+
+def ring_intersections_task(task):
+    """Worker task: all intersections for one ring"""
+    ring_id, circle, center = task
+    return compute_ring_intersections(ring_id, _worker_roads['rings'][ring_id], _worker_roads['radials'], circle, center)
+
+def block_beziers_task(pending_blocks):
+    """Worker task: batched Bezier fits for the blocks of one ring pair"""
+    ring_indexes = _worker_roads['ring_indexes']
+    for pending in pending_blocks:
+        for ring_id in (pending['ring'], pending['outer_ring']):
+            if ring_id not in ring_indexes:
+                ring_indexes[ring_id] = build_ring_index(_worker_roads['rings'][ring_id])
+    return fit_block_beziers(pending_blocks, _worker_roads['rings'], ring_indexes, verbose=False)
+
+def fit_block_beziers_parallel(pending_blocks, executor):
+    """fit_block_beziers split by ring pair across a process pool, merged back in block order"""
+    groups = defaultdict(list)
+    for k, pending in enumerate(pending_blocks):
+        groups[(pending['ring'], pending['outer_ring'])].append(k)
+
+    # Ship only what the fit needs, not the arc data
+    tasks = [[{key: pending_blocks[k][key] for key in ('ring', 'outer_ring', 'corners')} for k in indices]
+             for indices in groups.values()]
+
+    results = [None] * len(pending_blocks)
+    for indices, group_results in zip(groups.values(), executor.map(block_beziers_task, tasks)):
+        for k, result in zip(indices, group_results):
+            results[k] = result
+
+    errors = [error for result in results for error in result[2:] if error is not None]
+    if errors:
+        print(f"🧮 Fitted {len(errors)} Bezier arcs across {len(tasks)} ring pairs: "
+              f"max error {max(errors):.2f}px, mean {np.mean(errors):.2f}px")
+    return results
+
+def find_best_intersection(intersections_dict, target_time, radial_index):
+    """Find the intersection point for a given time on one ring (see RadialIndex.lookup)"""
+    return radial_index.lookup(intersections_dict, target_time)
+
+class LazyBlock(dict):
+    """Block dict whose optional representations are computed on first access.
+
+    lazy_fields maps a key (e.g. 'bezier_data') to a zero-argument loader.
+    Reading the key through [] or get() runs the loader once and stores the
+    result like any other field; `in` reports it without loading. Anything
+    that walks the whole dict (iteration, keys/items/values, copy(),
+    dict(block), json.dump) or pickles it loads every pending field first,
+    so copies and pickles are plain, complete blocks without the loaders.
+    """
+
+    def __init__(self, fields, lazy_fields=None):
+        super().__init__(fields)
+        self._lazy_fields = dict(lazy_fields or {})
+
+    def _resolve(self, key):
+        loader = self._lazy_fields.pop(key, None)
+        if loader is not None:
+            self[key] = loader()
+
+    def __getitem__(self, key):
+        self._resolve(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._resolve(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        return key in self._lazy_fields or super().__contains__(key)
+
+    def is_loaded(self, key):
+        """True if the field exists without having to run its loader"""
+        return super().__contains__(key)
+
+    def resolve_all(self):
+        """Run every pending loader"""
+        for key in list(self._lazy_fields):
+            self._resolve(key)
+        return self
+
+    def __iter__(self):
+        return super(LazyBlock, self.resolve_all()).__iter__()
+
+    def __len__(self):
+        return super().__len__() + len(self._lazy_fields)
+
+    def keys(self):
+        return super(LazyBlock, self.resolve_all()).keys()
+
+    def items(self):
+        return super(LazyBlock, self.resolve_all()).items()
+
+    def values(self):
+        return super(LazyBlock, self.resolve_all()).values()
+
+    def copy(self):
+        return dict(self.resolve_all().items())
 
-def create_brc_blocks(rings, radials):
-    """Create the complete set of BRC blocks"""
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+def sample_arc_block_outline(arc_block, arc_samples=6):
+    """Outline points for a block straight from its circular arc data (no ring sampling)"""
+    polyline_data = arc_block.get('polyline_data')
+    if polyline_data and polyline_data.get('polygon_points'):
+        return list(polyline_data['polygon_points'])
+
+    arc_data = arc_block.get('arc_data')
+    if not arc_data:
+        return list(arc_block.get('points', []))
+
+    def arc_points(arc):
+        cx, cy = arc['center']
+        return [(cx + arc['radius'] * math.cos(arc['start_angle'] + arc['sweep'] * i / (arc_samples - 1)),
+                 cy + arc['radius'] * math.sin(arc['start_angle'] + arc['sweep'] * i / (arc_samples - 1)))
+                for i in range(arc_samples)]
+
+    # Inner arc, then the outer arc walked backwards; the closing radial is implicit
+    inner_points = arc_points(arc_data['inner_arc'])
+    outer_points = list(reversed(arc_points(arc_data['outer_arc'])))
+    return inner_points + outer_points
+
+# Ring order and division: Esplanade-F pairs hold inner blocks, F-K pairs outer blocks
+RING_ORDER = ['Esplanade', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K']
+
+# Define time increments to meet adjacency requirements exactly
+INNER_TIMES = ['2:00', '2:30', '3:00', '3:30', '4:00', '4:30', '5:00', '5:30',
+               '6:00', '6:30', '7:00', '7:30', '8:00', '8:30', '9:00', '9:30', '10:00']
+OUTER_TIMES = [f"{hour}:{minute:02d}" for hour in range(2, 10) for minute in [0, 15, 30, 45]] + ['10:00']
+
+def ring_order(rings, center=(622.5, 272.04)):
+    """Ring IDs present in `rings`, inside out: RING_ORDER names first, then any extra rings
+    (e.g. from synthetic_city.py) by mean distance from the Man"""
+    extra_rings = [ring_id for ring_id in rings if ring_id not in RING_ORDER]
+    mean_radius = {ring_id: float(np.mean(np.abs(evaluate_path(rings[ring_id], np.linspace(0, 1, 16)) - complex(*center))))
+                   for ring_id in extra_rings}
+    return [ring for ring in RING_ORDER if ring in rings] + sorted(extra_rings, key=mean_radius.get)
+
+def layout_times(radials):
+    """Inner and outer block times for a set of radials.
+
+    Outer blocks span every radial time from 2:00 to 10:00 and inner blocks
+    every other one; for the real city that is OUTER_TIMES / INNER_TIMES.
+    """
+    times = [t for t in RadialIndex(radials).times() if time_minutes('2:00') <= time_minutes(t) <= time_minutes('10:00')]
+    if times == OUTER_TIMES:
+        return INNER_TIMES, OUTER_TIMES
+    inner_times = times[::2]
+    if inner_times[-1] != times[-1]:
+        inner_times.append(times[-1])
+    return inner_times, times
+
+def block_layout(available_rings, inner_times=INNER_TIMES, outer_times=OUTER_TIMES):
+    """List every expected block as (block_id, type, inner_ring, outer_ring, time1, time2)"""
+    f_index = available_rings.index('F') if 'F' in available_rings else 6
+    inner_pairs = [(available_rings[j], available_rings[j+1]) for j in range(min(f_index, len(available_rings) - 1))]
+    remaining_rings = available_rings[f_index:]
+    outer_pairs = [(remaining_rings[j], remaining_rings[j+1]) for j in range(len(remaining_rings)-1)]
+    
+    layout = []
+    for block_type, ring_pairs, times in (('inner', inner_pairs, inner_times), ('outer', outer_pairs, outer_times)):
+        for inner_ring, outer_ring in ring_pairs:
+            for time1, time2 in zip(times[:-1], times[1:]):
+                layout.append((f"{inner_ring}_{time1}", block_type, inner_ring, outer_ring, time1, time2))
+    return layout
+
+def create_brc_blocks(rings, radials, intersection_mode='sampled', residual_threshold=1.0, representation='arc',
+                      workers=1, intersections=None, block_ids=None):
+    """Create the complete set of BRC blocks
+
+    intersection_mode='sampled' searches every ring/radial pair with
+    find_improved_intersections. intersection_mode='circle' fits each ring
+    to a circle once and solves its intersections in closed form; rings whose
+    fit residual exceeds residual_threshold fall back to the sampled search.
+
+    representation selects which block geometry is computed up front:
+    'arc' (circular arc data only), 'bezier' (plus fitted Bezier data),
+    'sampled' (plus Bezier-sampled curved_points) or 'all'. Anything not
+    computed up front is filled in lazily the first time a block is asked
+    for it, so arc-only runs never sample the ring paths for blocks.
+
+    workers > 1 spreads the per-ring intersection search and the per ring
+    pair Bezier fits over a process pool; results merge back in the serial
+    order, so the output is identical to workers=1.
+
+    intersections may be a precomputed table from compute_intersection_table
+    (e.g. loaded from the road cache), in which case the search is skipped.
+    block_ids, if given, limits the build to those block IDs.
+    """
+    if representation not in ('arc', 'bezier', 'sampled', 'all'):
+        raise ValueError(f"Unknown representation: {representation}")
+    
     print("🏘️  Creating BRC blocks...")
     
-    # Define ring order and division
-    ring_order = ['Esplanade', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K']
-    available_rings = [ring for ring in ring_order if ring in rings]
+    available_rings = ring_order(rings)
+    inner_times, outer_times = layout_times(radials)
     
-    # Define time increments to meet adjacency requirements exactly
-    inner_times = ['2:00', '2:30', '3:00', '3:30', '4:00', '4:30', '5:00', '5:30', 
-                   '6:00', '6:30', '7:00', '7:30', '8:00', '8:30', '9:00', '9:30', '10:00']
+    center = (622.5, 272.04)
     
-    outer_times = []
-    for hour in range(2, 10):
-        for minute in [0, 15, 30, 45]:
-            outer_times.append(f"{hour}:{minute:02d}")
-    outer_times.append('10:00')  # Add final time to complete adjacency pairs
+    needs_pool = workers > 1 and (intersections is None or representation != 'arc')
+    if needs_pool:
+        print(f"⚙️  Using {workers} worker processes")
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=init_road_worker,
+                                       initargs=roads_to_arrays(rings, radials))
+    else:
+        executor = None
     
-    center = (622.5, 272.04)
+    try:
+        if intersections is None:
+            intersections = compute_intersection_table(rings, radials, intersection_mode, residual_threshold,
+                                                       center=center, executor=executor)
+        else:
+            print("♻️  Using precomputed intersection table")
+            intersections = defaultdict(dict, {ring_id: dict(table) for ring_id, table in intersections.items()})
+        
+        return build_blocks_from_intersections(rings, intersections, available_rings, inner_times, outer_times,
+                                               center, representation, executor, block_ids, RadialIndex(radials))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+def compute_intersection_table(rings, radials, intersection_mode='sampled', residual_threshold=1.0,
+                               center=(622.5, 272.04), workers=1, executor=None):
+    """Compute the ring → {radial_id: (x, y)} intersection table for every available ring
+
+    Uses the given process pool, or starts one when workers > 1.
+    """
+    available_rings = ring_order(rings)
     
     # Find intersections
     print("📐 Computing intersections...")
     intersections = defaultdict(dict)
     
-    for ring_id in available_rings:
-        ring_path = rings[ring_id]
-        
-        # Check which radials to use based on inner/outer
-        if ring_id in ['Esplanade', 'A', 'B', 'C', 'D', 'E', 'F']:
-            # Inner rings use main radials only
-            relevant_radials = {k: v for k, v in radials.items() if '_sec' not in k}
+    ring_circles = {}
+    if intersection_mode == 'circle':
+        print(f"🔵 Fitting ring circles (residual threshold {residual_threshold:.2f}px)...")
+        for ring_id in available_rings:
+            circle = fit_ring_circle(rings[ring_id])
+            analytic = circle['residual'] <= residual_threshold
+            if analytic:
+                ring_circles[ring_id] = circle
+            REPORT.detail(f"  {ring_id}: r={circle['radius']:.1f}, residual={circle['residual']:.3f}px "
+                  f"(max {circle['max_residual']:.3f}px) → {'analytic' if analytic else 'sampled fallback'}")
+    elif intersection_mode != 'sampled':
+        raise ValueError(f"Unknown intersection mode: {intersection_mode}")
+    
+    own_executor = None
+    if executor is None and workers > 1:
+        print(f"⚙️  Using {workers} worker processes")
+        executor = own_executor = ProcessPoolExecutor(max_workers=workers, initializer=init_road_worker,
+                                                      initargs=roads_to_arrays(rings, radials))
+    
+    try:
+        if executor is not None:
+            tasks = [(ring_id, ring_circles.get(ring_id), center) for ring_id in available_rings]
+            ring_results = executor.map(ring_intersections_task, tasks)
         else:
-            # Outer rings use both main and secondary radials
-            relevant_radials = radials
+            ring_results = (compute_ring_intersections(ring_id, rings[ring_id], radials, ring_circles.get(ring_id), center)
+                            for ring_id in available_rings)
         
-        for radial_id in relevant_radials:
-            radial_path = relevant_radials[radial_id]
-            
-            # Extract time string for geometric calculation
-            time_str = None
-            if ':' in radial_id and '-' not in radial_id:
-                time_str = radial_id
-            elif '-' in radial_id:
-                # For compound radials like "3:30-9:30", try both times
-                times = radial_id.split('-')
-                for t in times:
-                    if ':' in t:
-                        time_str = t
-                        break
-            
-            intersection_points = find_improved_intersections(ring_path, radial_path, time_str)
-            if intersection_points:
-                intersections[ring_id][radial_id] = intersection_points[0]
+        # map() yields in submission order, so the table is identical to a serial run
+        for ring_id, ring_intersections in zip(available_rings, ring_results):
+            intersections[ring_id].update(ring_intersections)
+    finally:
+        if own_executor is not None:
+            own_executor.shutdown()
     
-    # Create blocks
-    blocks = []
+    return intersections
+
+def compute_ring_intersections(ring_id, ring_path, radials, circle=None, center=(622.5, 272.04)):
+    """Intersect one ring with every radial it meets; returns {radial_id: (x, y)}"""
+    ring_intersections = {}
+    compiled_ring = compile_path(ring_path) if circle is None else None
+    
+    # Check which radials to use based on inner/outer
+    if ring_id in ['Esplanade', 'A', 'B', 'C', 'D', 'E', 'F']:
+        # Inner rings use main radials only
+        relevant_radials = {k: v for k, v in radials.items() if '_sec' not in k}
+    else:
+        # Outer rings use both main and secondary radials
+        relevant_radials = radials
+    
+    for radial_id in relevant_radials:
+        radial_path = relevant_radials[radial_id]
+        
+        # Extract time string for geometric calculation
+        time_str = None
+        if ':' in radial_id and '-' not in radial_id:
+            time_str = radial_id
+        elif '-' in radial_id:
+            # For compound radials like "3:30-9:30", try both times
+            times = radial_id.split('-')
+            for t in times:
+                if ':' in t:
+                    time_str = t
+                    break
+        
+        if circle is not None:
+            intersection_points = find_circle_intersections(circle, radial_path, time_str, center)
+        else:
+            intersection_points = find_improved_intersections(ring_path, radial_path, time_str,
+                                                              compiled_ring=compiled_ring)
+        if intersection_points:
+            ring_intersections[radial_id] = intersection_points[0]
+    
+    return ring_intersections
+
+def largest_polygon(geometry):
+    """The largest Polygon of a make_valid result (which may be a MultiPolygon or a collection with stray lines)"""
+    if geometry.geom_type == 'Polygon':
+        return geometry
+    parts = [polygon for part in getattr(geometry, 'geoms', []) if part.geom_type in ('Polygon', 'MultiPolygon')
+             for polygon in getattr(part, 'geoms', [part])]
+    return max(parts, key=lambda polygon: polygon.area) if parts else Polygon()
+
+def build_block_polygons(outlines):
+    """Shapely polygons and their areas for many block outlines in a few vectorized calls.
+
+    Every outline's points go into one coordinate array with per-outline
+    offsets for shapely.linearrings / shapely.polygons. Validity is checked
+    for all of them at once and only the invalid ones are repaired with
+    shapely.make_valid, keeping the largest piece so every block polygon
+    stays a single Polygon. Returns (polygons, areas) as NumPy arrays.
+    """
+    if not outlines:
+        return np.empty(0, dtype=object), np.empty(0)
+    
+    counts = [len(points) for points in outlines]
+    coords = np.concatenate([np.asarray(points, dtype=float) for points in outlines])
+    polygons = shapely.polygons(shapely.linearrings(coords, indices=np.repeat(np.arange(len(outlines)), counts)))
+    
+    invalid = ~shapely.is_valid(polygons)
+    if invalid.any():
+        REPORT.count('repaired_polygons', int(invalid.sum()))
+        polygons[invalid] = [largest_polygon(geometry) for geometry in shapely.make_valid(polygons[invalid])]
+    
+    return polygons, shapely.area(polygons)
+
+def build_blocks_from_intersections(rings, intersections, available_rings, inner_times, outer_times,
+                                    center=(622.5, 272.04), representation='arc', executor=None, block_ids=None,
+                                    radial_index=None):
+    """Build the block list from a ring → radial intersection table, optionally only for block_ids
+
+    radial_index maps block times to radial IDs; by default it is built from
+    the radial IDs in the table.
+    """
+    if radial_index is None:
+        radial_index = RadialIndex(dict.fromkeys(radial_id for table in intersections.values() for radial_id in table))
+    # Sample each ring once; every block edge lookup below shares these indexes
+    ring_indexes = {ring_id: build_ring_index(rings[ring_id]) for ring_id in available_rings}
+    
+    # Collect block corners; geometry that needs ring sampling is built afterwards in one batch
+    pending_blocks = []
     f_index = available_rings.index('F') if 'F' in available_rings else 6
     
-    # Inner blocks (96 total)
-    if f_index >= 0:
-        inner_ring_pairs = [(available_rings[j], available_rings[j+1]) for j in range(f_index)]
-        print(f"Inner ring pairs: {inner_ring_pairs}")
+    # Inner blocks (96 total) pair the rings up to F; outer blocks (160 total) pair F outwards
+    remaining_rings = available_rings[f_index:]
+    ring_pair_layouts = [
+        ('inner', [(available_rings[j], available_rings[j+1]) for j in range(min(f_index, len(available_rings) - 1))], inner_times),
+        ('outer', [(remaining_rings[j], remaining_rings[j+1]) for j in range(len(remaining_rings)-1)], outer_times)
+    ]
+    
+    for block_type, ring_pairs, times in ring_pair_layouts:
+        print(f"{block_type.capitalize()} ring pairs: {ring_pairs}")
         
-        for inner_ring, outer_ring in inner_ring_pairs:
-            for i, time1 in enumerate(inner_times[:-1]):
-                time2 = inner_times[i + 1]
-                
-                # Skip exception blocks for now, just create regular blocks
-                # TODO: Implement proper 6:00 exception blocks later if needed
+        for inner_ring, outer_ring in ring_pairs:
+            for i, time1 in enumerate(times[:-1]):
+                time2 = times[i + 1]
+                block_id = f"{inner_ring}_{time1}"
+                if block_ids is not None and block_id not in block_ids:
+                    continue
                 
-                # Regular 4-sided blocks
                 try:
-                    # Get intersection points with improved lookup
-                    time1_inner = find_best_intersection(intersections[inner_ring], time1)
-                    time2_inner = find_best_intersection(intersections[inner_ring], time2)
-                    time1_outer = find_best_intersection(intersections[outer_ring], time1)
-                    time2_outer = find_best_intersection(intersections[outer_ring], time2)
+                    # Get intersection points with improved lookup (including secondary radials)
+                    corners = tuple(find_best_intersection(intersections[ring_id], time_str, radial_index)
+                                    for ring_id, time_str in [(inner_ring, time1), (inner_ring, time2),
+                                                              (outer_ring, time1), (outer_ring, time2)])
                     
-                    if not all([time1_inner, time2_inner, time1_outer, time2_outer]):
+                    if not all(corners):
                         print(f"  ✗ Missing intersections for {inner_ring}_{time1}-{time2}")
                         continue
                     
-                    # Create arc, Bezier and regular versions
-                    block_id = f"{inner_ring}_{time1}"
+                    # Create arc version now; Bezier and regular versions follow the batch fit
                     # Pass Esplanade ring path for exception blocks
-                    esplanade_path = rings.get('Esplanade') if inner_ring == 'Esplanade' else None
-                    arc_block = create_4_sided_arc_block(
-                        time1_inner, time2_inner, time1_outer, time2_outer, 
-                        block_id=block_id, esplanade_ring_path=esplanade_path
-                    )
-                    
-                    bezier_block = create_4_sided_bezier_block(
-                        rings[inner_ring], rings[outer_ring],
-                        time1_inner, time2_inner, time1_outer, time2_outer
-                    )
+                    esplanade_path = rings.get('Esplanade') if block_type == 'inner' and inner_ring == 'Esplanade' else None
+                    arc_block = create_4_sided_arc_block(*corners, block_id=block_id, esplanade_ring_path=esplanade_path)
                     
-                    curved_points = create_4_sided_block(
-                        rings[inner_ring], rings[outer_ring],
-                        time1_inner, time2_inner, time1_outer, time2_outer
-                    )
-                    
-                    if len(curved_points) >= 3:
-                        polygon = Polygon(curved_points)
-                        if not polygon.is_valid:
-                            polygon = polygon.buffer(0)
-                        if polygon.is_valid and polygon.area > 0.1:
-                            blocks.append({
-                                'id': f"{inner_ring}_{time1}",
-                                'polygon': polygon,
-                                'ring': inner_ring,
-                                'time': time1,
-                                'type': 'inner',
-                                'curved_points': curved_points,
-                                'intersection_count': 4,  # Always uses exactly 4 intersections as input
-                                'total_points': len(curved_points),  # Number of points after arc expansion
-                                'arc_data': arc_block.get('arc_data'),  # Add circular arc data
-                                'polyline_data': arc_block.get('polyline_data'),  # Add polyline exception data
-                                'bezier_data': bezier_block.get('bezier_data'),  # Add Bezier curve data
-                                'block_data': {
-                                    'inner_ring_path': rings[inner_ring],
-                                    'outer_ring_path': rings[outer_ring],
-                                    'time1_inner': time1_inner,
-                                    'time2_inner': time2_inner,
-                                    'time1_outer': time1_outer,
-                                    'time2_outer': time2_outer
-                                }
-                            })
+                    pending_blocks.append({
+                        'id': block_id,
+                        'type': block_type,
+                        'ring': inner_ring,
+                        'outer_ring': outer_ring,
+                        'time': time1,
+                        'time2': time2,
+                        'corners': corners,
+                        'arc_block': arc_block
+                    })
                         
                 except Exception as e:
-                    print(f"  ✗ Inner block {inner_ring}_{time1} creation failed: {e}")
+                    print(f"  ✗ {block_type.capitalize()} block {block_id} creation failed: {e}")
                     continue
-        
     
-    # Outer blocks (160 total)
-    if f_index >= 0:
-        remaining_rings = available_rings[f_index:]
-        outer_ring_pairs = [(remaining_rings[j], remaining_rings[j+1]) for j in range(len(remaining_rings)-1)]
-        print(f"Outer ring pairs: {outer_ring_pairs}")
-        
-        for inner_ring, outer_ring in outer_ring_pairs:
-            for i, time1 in enumerate(outer_times[:-1]):
-                time2 = outer_times[i + 1]
-                
-                try:
-                    # Get intersection points with improved lookup (including secondary radials)
-                    time1_inner = find_best_intersection(intersections[inner_ring], time1)
-                    time2_inner = find_best_intersection(intersections[inner_ring], time2)
-                    time1_outer = find_best_intersection(intersections[outer_ring], time1)
-                    time2_outer = find_best_intersection(intersections[outer_ring], time2)
-                    
-                    if not all([time1_inner, time2_inner, time1_outer, time2_outer]):
-                        print(f"  ✗ Missing intersections for {inner_ring}_{time1}-{time2}")
-                        continue
-                    
-                    # Create arc, Bezier and regular versions
-                    block_id = f"{inner_ring}_{time1}"
-                    arc_block = create_4_sided_arc_block(
-                        time1_inner, time2_inner, time1_outer, time2_outer, 
-                        block_id=block_id
-                    )
-                    
-                    bezier_block = create_4_sided_bezier_block(
-                        rings[inner_ring], rings[outer_ring],
-                        time1_inner, time2_inner, time1_outer, time2_outer
-                    )
-                    
-                    curved_points = create_4_sided_block(
-                        rings[inner_ring], rings[outer_ring],
-                        time1_inner, time2_inner, time1_outer, time2_outer
-                    )
+    compute_bezier = representation in ('bezier', 'sampled', 'all')
+    compute_sampled = representation in ('sampled', 'all')
+    
+    # Fit every block's inner and outer ring arc in one batched least-squares solve,
+    # the first time any block needs a Bezier (eagerly unless representation='arc')
+    bezier_batch = []
+    
+    def load_block_beziers(k):
+        if not bezier_batch:
+            if executor is not None:
+                bezier_batch.append(fit_block_beziers_parallel(pending_blocks, executor))
+            else:
+                bezier_batch.append(fit_block_beziers(pending_blocks, rings, ring_indexes))
+        return bezier_batch[0][k]
+    
+    def load_bezier_data(k):
+        pending = pending_blocks[k]
+        inner_bezier, outer_bezier, inner_error, outer_error = load_block_beziers(k)
+        time1_inner, time2_inner, time1_outer, time2_outer = pending['corners']
+        bezier_block = create_4_sided_bezier_block(
+            rings[pending['ring']], rings[pending['outer_ring']],
+            time1_inner, time2_inner, time1_outer, time2_outer,
+            ring_indexes[pending['ring']], ring_indexes[pending['outer_ring']],
+            inner_bezier=inner_bezier, outer_bezier=outer_bezier
+        )
+        bezier_data = bezier_block.get('bezier_data')
+        if bezier_data:
+            bezier_data['inner_max_error'] = inner_error
+            bezier_data['outer_max_error'] = outer_error
+        return bezier_data
+    
+    def load_curved_points(k):
+        pending = pending_blocks[k]
+        inner_bezier, outer_bezier, _, _ = load_block_beziers(k)
+        time1_inner, time2_inner, time1_outer, time2_outer = pending['corners']
+        return create_4_sided_block(
+            rings[pending['ring']], rings[pending['outer_ring']],
+            time1_inner, time2_inner, time1_outer, time2_outer,
+            ring_indexes[pending['ring']], ring_indexes[pending['outer_ring']],
+            inner_arc=inner_bezier, outer_arc=outer_bezier
+        )
+    
+    # Block outlines first; polygons are then built, validated and measured in batched GEOS calls
+    outlines = []
+    for k, pending in enumerate(pending_blocks):
+        try:
+            lazy_fields = {
+                'bezier_data': lambda k=k: load_bezier_data(k),  # Add Bezier curve data
+                'curved_points': lambda k=k: load_curved_points(k)
+            }
+            block_fields = {}
+            if compute_bezier:
+                block_fields['bezier_data'] = lazy_fields.pop('bezier_data')()
+            if compute_sampled:
+                block_fields['curved_points'] = lazy_fields.pop('curved_points')()
+                outline_points = block_fields['curved_points']
+            else:
+                # Analytic outline from the circular arcs; no ring sampling needed
+                outline_points = sample_arc_block_outline(pending['arc_block'])
+            
+            if len(outline_points) >= 3:
+                outlines.append((pending, outline_points, block_fields, lazy_fields))
                     
-                    if len(curved_points) >= 3:
-                        polygon = Polygon(curved_points)
-                        if not polygon.is_valid:
-                            polygon = polygon.buffer(0)
-                        if polygon.is_valid and polygon.area > 0.1:
-                            blocks.append({
-                                'id': f"{inner_ring}_{time1}",
-                                'polygon': polygon,
-                                'ring': inner_ring,
-                                'time': time1,
-                                'type': 'outer',
-                                'curved_points': curved_points,
-                                'intersection_count': 4,  # Always uses exactly 4 intersections as input
-                                'total_points': len(curved_points),  # Number of points after arc expansion
-                                'arc_data': arc_block.get('arc_data'),  # Add circular arc data
-                                'polyline_data': arc_block.get('polyline_data'),  # Add polyline exception data
-                                'bezier_data': bezier_block.get('bezier_data'),  # Add Bezier curve data
-                                'block_data': {
-                                    'inner_ring_path': rings[inner_ring],
-                                    'outer_ring_path': rings[outer_ring],
-                                    'time1_inner': time1_inner,
-                                    'time2_inner': time2_inner,
-                                    'time1_outer': time1_outer,
-                                    'time2_outer': time2_outer
-                                }
-                            })
-                            
-                except Exception as e:
-                    print(f"  ✗ Outer block {inner_ring}_{time1} creation failed: {e}")
-                    continue
-        
+        except Exception as e:
+            print(f"  ✗ {pending['type'].capitalize()} block {pending['id']} creation failed: {e}")
+            continue
     
-    print(f"Created {len(blocks)} curved blocks")
+    polygons, areas = build_block_polygons([outline_points for _, outline_points, _, _ in outlines])
+    
+    blocks = []
+    for (pending, outline_points, block_fields, lazy_fields), polygon, area in zip(outlines, polygons, areas):
+        if area <= 0.1:
+            continue
+        inner_ring, outer_ring = pending['ring'], pending['outer_ring']
+        time1_inner, time2_inner, time1_outer, time2_outer = pending['corners']
+        arc_block = pending['arc_block']
+        blocks.append(LazyBlock({
+            'id': pending['id'],
+            'polygon': polygon,
+            'ring': inner_ring,
+            'outer_ring': outer_ring,
+            'time': pending['time'],
+            'time2': pending['time2'],
+            'type': pending['type'],
+            'representation': representation,
+            'intersection_count': 4,  # Always uses exactly 4 intersections as input
+            'total_points': len(outline_points),  # Number of points after arc expansion
+            'arc_data': arc_block.get('arc_data'),  # Add circular arc data
+            'polyline_data': arc_block.get('polyline_data'),  # Add polyline exception data
+            **block_fields,
+            'block_data': {
+                'inner_ring_path': rings[inner_ring],
+                'outer_ring_path': rings[outer_ring],
+                'inner_ring_index': ring_indexes[inner_ring],
+                'outer_ring_index': ring_indexes[outer_ring],
+                'time1_inner': time1_inner,
+                'time2_inner': time2_inner,
+                'time1_outer': time1_outer,
+                'time2_outer': time2_outer
+            }
+        }, lazy_fields))
+    
+    # The process pool is shut down once blocks are returned; later lazy loads fit serially
+    executor = None
+    
+    print(f"Created {len(blocks)} curved blocks (representation: {representation})")
     
     # Analyze intersection usage and Bezier data
     if blocks:
         total_points = [b['total_points'] for b in blocks]
         intersection_counts = [b['intersection_count'] for b in blocks]
-        bezier_blocks = [b for b in blocks if b.get('bezier_data')]
         
         print(f"\n📊 Intersection & Bezier Analysis:")
         print(f"  All polygons use exactly {set(intersection_counts)} intersections as input")
         print(f"  Point counts after arc expansion: min={min(total_points)}, max={max(total_points)}, avg={sum(total_points)/len(total_points):.1f}")
-        print(f"  Blocks with Bezier data: {len(bezier_blocks)}/{len(blocks)} ({100*len(bezier_blocks)/len(blocks):.1f}%)")
+        if compute_bezier:
+            bezier_blocks = [b for b in blocks if b.get('bezier_data')]
+            print(f"  Blocks with Bezier data: {len(bezier_blocks)}/{len(blocks)} ({100*len(bezier_blocks)/len(blocks):.1f}%)")
+        else:
+            print(f"  Bezier data: computed on first access (representation={representation})")
         
         # Sample of point counts
         sample_blocks = blocks[:3]
         for block in sample_blocks:
-            bezier_status = "✓ Bezier" if block.get('bezier_data') else "✗ No Bezier"
+            if compute_bezier:
+                bezier_status = "✓ Bezier" if block.get('bezier_data') else "✗ No Bezier"
+            else:
+                bezier_status = "Bezier deferred"
             print(f"  Example: {block['id']} - {block['intersection_count']} intersections → {block['total_points']} points ({bezier_status})")
     
     # Validate radial road lengths (Esplanade-A should be ~2x longer than other ring pairs)
@@ -894,68 +1780,41 @@ def create_brc_blocks(rings, radials):
     
     return blocks
 
-def extract_actual_arc_from_ring(ring_path, start_point, end_point, tolerance=10.0):
-    """Extract the actual arc segment from the original ring path between two intersection points"""
+def extract_actual_arc_from_ring(ring_path, start_point, end_point, tolerance=10.0, ring_index=None, path=None):
+    """Extract the actual arc segment from the original ring path between two intersection points
+
+    Appends the segment to path (a PathDataBuilder whose current point is
+    start_point; a new one if None) and returns the builder.
+    """
+    if path is None:
+        path = PathDataBuilder(start=start_point)
+    
     try:
-        # Find parameter values for start and end points on the ring path
-        start_t = None
-        end_t = None
-        
-        min_start_dist = float('inf')
-        min_end_dist = float('inf')
+        if ring_index is None:
+            ring_index = build_ring_index(ring_path)
         
-        # Sample the ring path to find closest points to intersections
-        for t in np.linspace(0, 1, 1000):
-            ring_point = ring_path.point(t)
-            ring_coords = (ring_point.real, ring_point.imag)
-            
-            start_dist = math.sqrt((ring_coords[0] - start_point[0])**2 + (ring_coords[1] - start_point[1])**2)
-            if start_dist < min_start_dist:
-                min_start_dist = start_dist
-                if start_dist < tolerance:
-                    start_t = t
-            
-            end_dist = math.sqrt((ring_coords[0] - end_point[0])**2 + (ring_coords[1] - end_point[1])**2)
-            if end_dist < min_end_dist:
-                min_end_dist = end_dist
-                if end_dist < tolerance:
-                    end_t = t
+        # Find parameter values for start and end points on the ring path
+        start_t, end_t = find_arc_parameters(ring_path, start_point, end_point, tolerance, ring_index)
         
         if start_t is not None and end_t is not None:
             # Extract the actual path segment
-            if start_t > end_t:
-                # Handle wrap-around case
-                t_range = list(np.linspace(start_t, 1, 5)) + list(np.linspace(0, end_t, 5))
-            else:
-                t_range = np.linspace(start_t, end_t, 8)
+            t_range = arc_parameter_values(start_t, end_t, 8, ring_index['closed'])
             
             # Get points along the actual ring curve
-            curve_points = []
-            for t in t_range:
-                point = ring_path.point(t)
-                curve_points.append((point.real, point.imag))
+            ring_points = evaluate_path(ring_index['compiled'], t_range)
+            curve_points = [(point.real, point.imag) for point in ring_points.tolist()]
             
             # Convert to SVG path using the actual curve geometry
             if len(curve_points) >= 3:
-                # Start with first point
-                path_data = ""
-                
                 # Use quadratic bezier curves to approximate the real arc
                 for i in range(1, len(curve_points) - 1, 2):
-                    if i + 1 < len(curve_points):
-                        control_pt = curve_points[i]
-                        end_pt = curve_points[i + 1] if i + 1 < len(curve_points) else curve_points[-1]
-                        path_data += f" Q {control_pt[0]:.1f},{control_pt[1]:.1f} {end_pt[0]:.1f},{end_pt[1]:.1f}"
-                    else:
-                        # Just line to final point
-                        end_pt = curve_points[i]
-                        path_data += f" L {end_pt[0]:.1f},{end_pt[1]:.1f}"
+                    path.quad_to(curve_points[i], curve_points[i + 1])
                 
                 # Ensure we end at the exact end point
                 if curve_points[-1] != end_point:
-                    path_data += f" L {end_point[0]:.1f},{end_point[1]:.1f}"
+                    path.line_to(end_point)
                 
-                return path_data
+                return path
         
     except Exception:
         pass
@@ -980,13 +1839,56 @@ def extract_actual_arc_from_ring(ring_path, start_point, end_point, tolerance=10
         perp_y /= length
         control_x = mid_x + perp_x * curve_factor
         control_y = mid_y + perp_y * curve_factor
-        return f" Q {control_x:.1f},{control_y:.1f} {end_point[0]:.1f},{end_point[1]:.1f}"
+        return path.quad_to((control_x, control_y), end_point)
     
-    return f" L {end_point[0]:.1f},{end_point[1]:.1f}"
+    return path.line_to(end_point)
 
-def create_polygon_svg(blocks, output_file):
-    """Create SVG with proper arcs instead of many-sided polygons"""
-    svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
+def ring_block_path_data(block, precision=1, relative=False):
+    """Build a block's SVG path data from its ring segments; same return as block_path_data"""
+    block_data = block.get('block_data', {})
+    path = PathDataBuilder(precision, relative)
+    
+    if ('inner_ring_path' in block_data and 'outer_ring_path' in block_data and 
+        block_data['time1_inner'] is not None and block_data['time2_inner'] is not None):
+        # Create path with proper arcs
+        inner_start = block_data['time1_inner']
+        inner_end = block_data['time2_inner']
+        outer_start = block_data['time1_outer'] 
+        outer_end = block_data['time2_outer']
+        
+        # Start at inner ring start point, then the actual arc segment from the inner ring
+        path.move_to(inner_start)
+        extract_actual_arc_from_ring(block_data['inner_ring_path'], inner_start, inner_end,
+                                     ring_index=block_data.get('inner_ring_index'), path=path)
+        
+        # Straight line to outer ring end point (radial)
+        path.line_to(outer_end)
+        
+        # Actual arc segment from the outer ring (reversed direction)
+        extract_actual_arc_from_ring(block_data['outer_ring_path'], outer_end, outer_start,
+                                     ring_index=block_data.get('outer_ring_index'), path=path)
+        
+        # Close path (radial back to start)
+        return path.close().getvalue(), 4, True
+    
+    # Fallback to original method for blocks without ring data
+    polygon = block['polygon']
+    coords = block.get('curved_points')
+    
+    if not coords:
+        if hasattr(polygon, 'exterior'):
+            coords = list(polygon.exterior.coords)
+        elif hasattr(polygon, 'geoms'):
+            largest_poly = max(polygon.geoms, key=lambda p: p.area)
+            coords = list(largest_poly.exterior.coords)
+    
+    if not coords:
+        return "", 0, False
+    return path.polyline(coords).close().getvalue(), len(coords), False
+
+def polygon_svg_output(output_file, precision=1, relative=False):
+    """Output spec for an SVG of blocks traced along the actual ring segments"""
+    header = '''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1160.17 861.54">
   <defs>
     <style>
@@ -1015,71 +1917,93 @@ def create_polygon_svg(blocks, output_file):
   </defs>
   <g id="BRC_Polygons">
 '''
-    
-    for block in blocks:
-        block_data = block.get('block_data', {})
-        
-        if ('inner_ring_path' in block_data and 'outer_ring_path' in block_data and 
-            block_data['time1_inner'] is not None and block_data['time2_inner'] is not None):
-            # Create path with proper arcs
-            inner_start = block_data['time1_inner']
-            inner_end = block_data['time2_inner']
-            outer_start = block_data['time1_outer'] 
-            outer_end = block_data['time2_outer']
-            
-            # Start at inner ring start point
-            d = f"M {inner_start[0]:.1f},{inner_start[1]:.1f}"
-            
-            # Extract actual arc segment from inner ring
-            inner_arc = extract_actual_arc_from_ring(block_data['inner_ring_path'], inner_start, inner_end)
-            d += inner_arc
-            
-            # Straight line to outer ring end point (radial)
-            d += f" L {outer_end[0]:.1f},{outer_end[1]:.1f}"
-            
-            # Extract actual arc segment from outer ring (reversed direction)
-            outer_arc = extract_actual_arc_from_ring(block_data['outer_ring_path'], outer_end, outer_start)
-            d += outer_arc
-            
-            # Close path (radial back to start)
-            d += " Z"
-            
-            css_class = block['type'].replace('_', '-')
-            svg_content += f'    <path id="{block["id"]}" class="{css_class}" d="{d}" />\n'
-        
-        else:
-            # Fallback to original method for blocks without ring data
-            polygon = block['polygon']
-            coords = block.get('curved_points')
-            
-            if not coords:
-                if hasattr(polygon, 'exterior'):
-                    coords = list(polygon.exterior.coords)
-                elif hasattr(polygon, 'geoms'):
-                    largest_poly = max(polygon.geoms, key=lambda p: p.area)
-                    coords = list(largest_poly.exterior.coords)
-                else:
-                    continue
-            
-            if coords:
-                d = f"M {coords[0][0]:.1f},{coords[0][1]:.1f}"
-                for x, y in coords[1:]:
-                    d += f" L {x:.1f},{y:.1f}"
-                d += " Z"
-                
-                css_class = block['type'].replace('_', '-')
-                svg_content += f'    <path id="{block["id"]}" class="{css_class}" d="{d}" />\n'
-    
-    svg_content += '''  </g>
-</svg>'''
-    
-    with open(output_file, 'w') as f:
-        f.write(svg_content)
-    
+    return {
+        'file': output_file,
+        'header': header,
+        'footer': '''  </g>
+</svg>''',
+        'path_data': lambda block: ring_block_path_data(block, precision, relative),
+        'element': lambda block, d: f'    <path id="{block["id"]}" class="{block["type"].replace("_", "-")}" d="{d}" />\n',
+        'skip_empty': True
+    }
+
+def create_polygon_svg(blocks, output_file, precision=1, relative=False):
+    """Create SVG with proper arcs instead of many-sided polygons"""
+    stream_block_svgs(blocks, [polygon_svg_output(output_file, precision, relative)])
     return output_file
 
-def create_combined_svg(original_svg, blocks, output_file):
-    """Create combined SVG with original roads and new polygons"""
+def block_path_data(block, use_bezier=True, precision=1, relative=False):
+    """Build a block's SVG path data string.
+
+    Tries polyline exception data, then circular arc data, then (when
+    use_bezier) Bezier data, then the sampled curved_points outline.
+    Returns (d, point_count, uses_arcs); d is "" when the block has no geometry.
+    """
+    arc_data = block.get('arc_data')
+    polyline_data = block.get('polyline_data')
+    # Bezier data is only read when arc data is missing, so lazy blocks don't fit it needlessly
+    has_arcs = bool(arc_data and 'inner_arc' in arc_data and 'outer_arc' in arc_data)
+    bezier_data = None if (polyline_data or has_arcs or not use_bezier) else block.get('bezier_data')
+    path = PathDataBuilder(precision, relative)
+
+    if polyline_data and 'polygon_points' in polyline_data:
+        # Handle new exception blocks with custom polygon points
+        polygon_points = polyline_data['polygon_points']
+        if not polygon_points:
+            return "", 0, False
+        return path.polyline(polygon_points).close().getvalue(), len(polygon_points), True
+
+    if polyline_data and 'inner_polyline' in polyline_data and 'outer_arc' in polyline_data:
+        # Handle old Esplanade exception blocks with 50-point polylines
+        inner_polyline = polyline_data['inner_polyline']
+        outer_arc = polyline_data['outer_arc']
+        radial2 = polyline_data['radial2']
+        if not inner_polyline:
+            return "", 0, False
+
+        path.polyline(inner_polyline)  # Polyline for inner boundary
+        path.line_to(radial2[1])  # First radial line to outer ring
+        # Outer arc (reversed direction), then Z closes back to start (second radial)
+        path.arc_to(outer_arc['radius'], outer_arc['large_arc_flag'], 1 - outer_arc['sweep_flag'], outer_arc['start_point'])
+        return path.close().getvalue(), len(inner_polyline) + 2, True  # polyline points + 2 radial endpoints
+
+    if has_arcs:
+        inner_arc = arc_data['inner_arc']
+        outer_arc = arc_data['outer_arc']
+        radial2 = arc_data['radial2']
+
+        # Create path with proper 4-sided structure using circular arcs
+        path.move_to(inner_arc['start_point'])
+        path.arc_to(inner_arc['radius'], inner_arc['large_arc_flag'], inner_arc['sweep_flag'],
+                    inner_arc['end_point'])  # Inner arc (side 1)
+        path.line_to(radial2[1])  # First radial line (side 2)
+        # Outer arc (side 3) - reversed direction and sweep, ending at the outer arc start
+        path.arc_to(outer_arc['radius'], outer_arc['large_arc_flag'], 1 - outer_arc['sweep_flag'],
+                    outer_arc['start_point'])
+        # Z command automatically draws the second radial line back to start (side 4)
+        return path.close().getvalue(), 4, True  # 2 arc endpoints + 2 radial endpoints
+
+    if bezier_data and 'inner_arc' in bezier_data and 'outer_arc' in bezier_data:
+        # Fallback to Bezier for old data
+        inner_arc = bezier_data['inner_arc']
+        outer_arc = bezier_data['outer_arc']
+        radial2 = bezier_data['radial2']
+
+        if len(inner_arc) >= 4 and len(outer_arc) >= 4:
+            path.move_to(inner_arc[0]).cubic_to(*inner_arc[1:4])  # Inner arc (side 1)
+            path.line_to(radial2[1])  # First radial line (side 2)
+            outer_reversed = list(reversed(outer_arc))
+            path.line_to(outer_reversed[0]).cubic_to(*outer_reversed[1:4])  # Outer arc (side 3), reversed
+            return path.close().getvalue(), 8, True  # Close path (second radial line: side 4)
+
+    # Fallback to polygon points
+    coords = block.get('curved_points', [])
+    if not coords:
+        return "", 0, False
+    return path.polyline(coords).close().getvalue(), len(coords), False
+
+def combined_svg_output(original_svg, output_file, precision=1, relative=False):
+    """Output spec for the original SVG with the block polygons overlaid"""
     # Read original SVG
     tree = ET.parse(original_svg)
     root = tree.getroot()
@@ -1113,105 +2037,34 @@ def create_combined_svg(original_svg, blocks, output_file):
       }'''
             style.text += additional_styles
     
-    # Create polygon group with SVG namespace
+    # Serialize the document around an empty overlay group; block paths are streamed into it
     svg_ns = '{http://www.w3.org/2000/svg}'
-    polygon_group = ET.SubElement(root, f'{svg_ns}g', {'id': 'BRC_Polygons_Overlay'})
+    ET.SubElement(root, f'{svg_ns}g', {'id': 'BRC_Polygons_Overlay'})
+    buffer = io.BytesIO()
+    tree.write(buffer, encoding='utf-8', xml_declaration=True)
+    document = buffer.getvalue().decode('utf-8')
     
-    for block in blocks:
-        # Use the same logic as create_arc_optimized_svg to ensure consistency
-        arc_data = block.get('arc_data')
-        polyline_data = block.get('polyline_data')
-        bezier_data = block.get('bezier_data')
-        
-        d = ""
-        
-        if polyline_data and 'polygon_points' in polyline_data:
-            # Handle new exception blocks with custom polygon points
-            polygon_points = polyline_data['polygon_points']
-            
-            if polygon_points:
-                d = f"M {polygon_points[0][0]:.1f},{polygon_points[0][1]:.1f}"
-                for x, y in polygon_points[1:]:
-                    d += f" L {x:.1f},{y:.1f}"
-                d += " Z"
-        
-        elif polyline_data and 'inner_polyline' in polyline_data and 'outer_arc' in polyline_data:
-            # Handle old Esplanade exception blocks with 50-point polylines
-            inner_polyline = polyline_data['inner_polyline']
-            outer_arc = polyline_data['outer_arc']
-            radial1 = polyline_data['radial1'] 
-            radial2 = polyline_data['radial2']
-            
-            # Create path with polyline for inner boundary
-            if inner_polyline:
-                d = f"M {inner_polyline[0][0]:.1f},{inner_polyline[0][1]:.1f}"
-                for x, y in inner_polyline[1:]:
-                    d += f" L {x:.1f},{y:.1f}"
-                
-                # First radial line to outer ring
-                d += f" L {radial2[1][0]:.1f},{radial2[1][1]:.1f}"
-                
-                # Outer arc (reversed direction)
-                outer_start = outer_arc['end_point']
-                outer_end = outer_arc['start_point'] 
-                outer_radius = outer_arc['radius']
-                outer_sweep = 1 - outer_arc['sweep_flag']
-                d += f" A {outer_radius:.1f},{outer_radius:.1f} 0 {outer_arc['large_arc_flag']},{outer_sweep} {outer_end[0]:.1f},{outer_end[1]:.1f}"
-                
-                # Z closes back to start (second radial)
-                d += " Z"
-        
-        elif arc_data and 'inner_arc' in arc_data and 'outer_arc' in arc_data:
-            inner_arc = arc_data['inner_arc']
-            outer_arc = arc_data['outer_arc']
-            radial1 = arc_data['radial1'] 
-            radial2 = arc_data['radial2']
-            
-            # Create path with proper 4-sided structure using circular arcs
-            # Start at inner arc start point
-            start_point = inner_arc['start_point']
-            d = f"M {start_point[0]:.1f},{start_point[1]:.1f}"
-            
-            # Inner arc (side 1)
-            end_point = inner_arc['end_point']
-            radius = inner_arc['radius']
-            large_arc = inner_arc['large_arc_flag']
-            sweep = inner_arc['sweep_flag']
-            d += f" A {radius:.1f},{radius:.1f} 0 {large_arc},{sweep} {end_point[0]:.1f},{end_point[1]:.1f}"
-            
-            # First radial line (side 2) 
-            d += f" L {radial2[1][0]:.1f},{radial2[1][1]:.1f}"
-            
-            # Outer arc (side 3) - reversed direction
-            outer_start = outer_arc['end_point']  # Start from end (reverse)
-            outer_end = outer_arc['start_point']  # End at start (reverse)
-            outer_radius = outer_arc['radius']
-            # Reverse the sweep direction for the outer arc
-            outer_sweep = 1 - outer_arc['sweep_flag']
-            d += f" A {outer_radius:.1f},{outer_radius:.1f} 0 {outer_arc['large_arc_flag']},{outer_sweep} {outer_end[0]:.1f},{outer_end[1]:.1f}"
-            
-            # Z command automatically draws the second radial line back to start
-            d += " Z"  # Close path (second radial line: side 4)
-        
-        else:
-            # Fallback to polygon points
-            coords = block.get('curved_points', [])
-            if coords:
-                d = f"M {coords[0][0]:.1f},{coords[0][1]:.1f}"
-                for x, y in coords[1:]:
-                    d += f" L {x:.1f},{y:.1f}"
-                d += " Z"
-        
-        if d:
-            css_class = block['type'].replace('_', '-')
-            ET.SubElement(polygon_group, f'{svg_ns}path', {
-                'id': f"polygon_{block['id']}",
-                'class': css_class,
-                'd': d
-            })
-    
-    # Write combined SVG
-    tree.write(output_file, encoding='utf-8', xml_declaration=True)
+    overlay = re.search(r'<((?:\w+:)?)g id="BRC_Polygons_Overlay" />', document)
+    prefix = overlay.group(1)
+    
+    def element(block, d):
+        css_class = block['type'].replace('_', '-')
+        d = xml_escape(d, {'"': '&quot;'})
+        return f'<{prefix}path id="polygon_{block["id"]}" class="{css_class}" d="{d}" />'
+    
+    return {
+        'file': output_file,
+        'header': document[:overlay.start()] + f'<{prefix}g id="BRC_Polygons_Overlay">',
+        'footer': f'</{prefix}g>' + document[overlay.end():],
+        # Same path data as the arc SVG, minus the Bezier fallback
+        'path_data': lambda block: block_path_data(block, use_bezier=False, precision=precision, relative=relative),
+        'element': element,
+        'skip_empty': True
+    }
+
+def create_combined_svg(original_svg, blocks, output_file, precision=1, relative=False):
+    """Create combined SVG with original roads and new polygons"""
+    stream_block_svgs(blocks, [combined_svg_output(original_svg, output_file, precision, relative)])
     return output_file
 
 def validate_bezier_against_original(blocks, rings):
@@ -1236,6 +2089,9 @@ def validate_bezier_against_original(blocks, rings):
         if ring_name not in rings:
             continue
         original_ring = rings[ring_name]
+        ring_index = ring_blocks[0].get('block_data', {}).get('inner_ring_index')
+        if ring_index is None:
+            ring_index = build_ring_index(original_ring)
         
         for i, block in enumerate(ring_blocks[:2]):  # Max 2 per ring
             bezier_data = block.get('bezier_data')
@@ -1263,27 +2119,14 @@ def validate_bezier_against_original(blocks, rings):
             end_pt = block_data['time2_inner']
             
             # Find parameter values on original path
-            start_t, end_t = None, None
-            for t in np.linspace(0, 1, 200):
-                ring_pt = original_ring.point(t)
-                ring_coords = (ring_pt.real, ring_pt.imag)
-                
-                if math.sqrt((ring_coords[0] - start_pt[0])**2 + (ring_coords[1] - start_pt[1])**2) < 15:
-                    start_t = t
-                if math.sqrt((ring_coords[0] - end_pt[0])**2 + (ring_coords[1] - end_pt[1])**2) < 15:
-                    end_t = t
+            start_t, end_t = find_arc_parameters(original_ring, start_pt, end_pt, 15, ring_index)
             
             if start_t is not None and end_t is not None:
                 # Sample original path
-                if start_t > end_t:
-                    t_vals = list(np.linspace(start_t, 1, 5)) + list(np.linspace(0, end_t, 5))
-                else:
-                    t_vals = np.linspace(start_t, end_t, 10)
-                    
-                original_samples = []
-                for t in t_vals:
-                    pt = original_ring.point(t)
-                    original_samples.append((pt.real, pt.imag))
+                t_vals = arc_parameter_values(start_t, end_t, 10, ring_index['closed'])
+                
+                original_points = evaluate_path(ring_index['compiled'], t_vals)
+                original_samples = [(pt.real, pt.imag) for pt in original_points.tolist()]
                 
                 # Calculate RMS error between curves
                 if len(original_samples) == len(bezier_samples):
@@ -1304,7 +2147,7 @@ def validate_bezier_against_original(blocks, rings):
                     total_error += rms_error
                     validation_count += 1
                     
-                    print(f"  {ring_name}: RMS error = {rms_error:.1f}px ({error_percentage:.1f}% of arc)")
+                    REPORT.detail(f"  {ring_name}: RMS error = {rms_error:.1f}px ({error_percentage:.1f}% of arc)")
     
     if validation_count > 0:
         avg_error = total_error / validation_count
@@ -1313,9 +2156,241 @@ def validate_bezier_against_original(blocks, rings):
     else:
         print(f"  ⚠️  Could not validate curves (insufficient data)")
 
-def create_arc_optimized_svg(blocks, output_file):
-    """Create SVG using circular arcs for maximum accuracy"""
-    svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
+# Ring samples in each validation index; nearest-parameter snapping error stays well under 0.1px
+VALIDATION_RING_SAMPLES = 20000
+
+def svg_arc_points(arcs, num_samples):
+    """(len(arcs), num_samples, 2) points along arc_data arcs exactly as the SVG 'A' command draws them.
+
+    Uses SVG endpoint parameterization (the circle of arc['radius'] through
+    start_point and end_point picked by the large-arc/sweep flags, radius
+    scaled up if too short), not the Man-centred circle the radius came from.
+    """
+    start = np.array([arc['start_point'] for arc in arcs], dtype=float)
+    end = np.array([arc['end_point'] for arc in arcs], dtype=float)
+    fields = np.array([[arc[key] for key in ('radius', 'large_arc_flag', 'sweep_flag')] for arc in arcs], dtype=float)
+    centers, radii = svg_arc_centers(start, end, fields[:, 0], fields[:, 1], fields[:, 2])
+    return arc_samples(start, end, centers, radii, fields[:, 2], num_samples)
+
+def bezier_points(control_points, num_samples):
+    """Points along a cubic Bezier, as an (n, 2) array"""
+    t = np.linspace(0, 1, num_samples)[:, None]
+    p0, p1, p2, p3 = np.asarray(control_points, dtype=float)
+    return (1 - t)**3 * p0 + 3 * (1 - t)**2 * t * p1 + 3 * (1 - t) * t**2 * p2 + t**3 * p3
+
+def block_edges(block, geometry='arc', num_samples=64):
+    """A block's four edges as (edge, drawn points or None, source) triples.
+
+    edge is 'inner', 'outer', 'radial1' or 'radial2'; source is
+    ('ring', ring_id, start, end) or ('radial', time, start, end), or None
+    for the inner side of the Esplanade exception blocks, which follows
+    Rod's Ring Road rather than an input road. Drawn points are None where
+    the block has no usable geometry for the edge.
+    """
+    block_data = block['block_data']
+    time1_inner, time2_inner = block_data['time1_inner'], block_data['time2_inner']
+    time1_outer, time2_outer = block_data['time1_outer'], block_data['time2_outer']
+    inner, outer = None, None
+    inner_source = ('ring', block['ring'], time1_inner, time2_inner)
+    
+    polyline_data = block.get('polyline_data')
+    if polyline_data and polyline_data.get('polygon_points'):
+        inner_source = None
+        # Exception outlines run ... A & time2 → arc along A → A & time1
+        polygon_points = polyline_data['polygon_points']
+        if tuple(time2_outer) in [tuple(point) for point in polygon_points]:
+            index = [tuple(point) for point in polygon_points].index(tuple(time2_outer))
+            outline = LineString(polygon_points[index:][::-1])
+            outer = shapely.get_coordinates(shapely.line_interpolate_point(outline, np.linspace(0, 1, num_samples),
+                                                                           normalized=True))
+    elif geometry == 'bezier':
+        bezier_data = block.get('bezier_data')
+        if bezier_data and len(bezier_data['inner_arc']) >= 4 and len(bezier_data['outer_arc']) >= 4:
+            inner = bezier_points(bezier_data['inner_arc'][:4], num_samples)
+            outer = bezier_points(bezier_data['outer_arc'][:4], num_samples)
+    elif block.get('arc_data'):
+        inner, outer = svg_arc_points([block['arc_data']['inner_arc'], block['arc_data']['outer_arc']], num_samples)
+    
+    ramp = np.linspace(0, 1, num_samples)[:, None]
+    def radial(start, end):
+        return np.asarray(start, dtype=float) + ramp * (np.asarray(end, dtype=float) - np.asarray(start, dtype=float))
+    
+    return [
+        ('inner', inner, inner_source),
+        ('outer', outer, ('ring', block['outer_ring'], time1_outer, time2_outer)),
+        ('radial1', radial(time1_inner, time1_outer), ('radial', block['time'], time1_inner, time1_outer)),
+        ('radial2', radial(time2_inner, time2_outer), ('radial', block['time2'], time2_inner, time2_outer))
+    ]
+
+def sample_ring_edges(ring_index, starts, ends, num_samples, tolerance=15.0):
+    """Source ring geometry between each (start, end) corner pair, evenly spaced in arc length.
+
+    Returns ((edges, num_samples, 2) points, mask of edges whose corners lie on the ring).
+    """
+    start_distance, start_sample = ring_index['tree'].query(np.asarray(starts, dtype=float))
+    end_distance, end_sample = ring_index['tree'].query(np.asarray(ends, dtype=float))
+    start_length = ring_index['lengths'][start_sample]
+    end_length = ring_index['lengths'][end_sample]
+    total_length = ring_index['lengths'][-1]
+    if ring_index['closed']:
+        # Closed rings wrap forward through t=0 instead of running backwards, as in arc_parameter_values
+        end_length = np.where(start_length > end_length, end_length + total_length, end_length)
+    lengths = start_length[:, None] + np.linspace(0, 1, num_samples) * (end_length - start_length)[:, None]
+    if ring_index['closed']:
+        lengths = np.mod(lengths, total_length)
+    points = evaluate_path(ring_index['compiled'], ring_parameter_at_length(ring_index, lengths).ravel())
+    points = points.reshape(lengths.shape)
+    return np.stack([points.real, points.imag], axis=-1), (start_distance < tolerance) & (end_distance < tolerance)
+
+def radial_line(radial_path):
+    """Shapely LineString through a radial's segment endpoints (radials are lines and polylines)"""
+    return LineString([(segment.start.real, segment.start.imag) for segment in radial_path] +
+                      [(radial_path.end.real, radial_path.end.imag)])
+
+def validate_edge_accuracy(blocks, rings, radials, geometry='arc', num_samples=64, worst=10):
+    """Deviation of every block edge from the source ring and radial geometry.
+
+    All four edges of every block (inner arc, outer arc, both radials) are
+    sampled and compared against the input roads between the same corners:
+    max and RMS distance of the drawn points from the source, and the
+    Hausdorff distance between the two. Source sampling is batched per ring
+    and per radial time, and distances come from vectorized Shapely calls. geometry is 'arc' (the
+    drawn circular arcs) or 'bezier' (the fitted Bezier data).
+
+    Returns a summary dict: totals, per-edge-kind stats and the `worst`
+    edges by Hausdorff distance.
+    """
+    print(f"\n📐 Validating every block edge against the source roads ({geometry})...")
+    
+    drawn, sources, labels = [], [], []
+    no_source, skipped = [], []
+    for block in blocks:
+        for edge, points, source in block_edges(block, geometry, num_samples):
+            if source is None:
+                no_source.append(f"{block['id']}/{edge}")
+                continue
+            if points is None:
+                skipped.append(f"{block['id']}/{edge}")
+                continue
+            drawn.append(points)
+            sources.append(source)
+            labels.append((block['id'], edge))
+    
+    source_points = np.zeros((len(drawn), num_samples, 2))
+    found = np.zeros(len(drawn), dtype=bool)
+    
+    # Ring edges: one arc-length-spaced batch per ring
+    ring_edges = defaultdict(list)
+    for k, (kind, road_id, start, end) in enumerate(sources):
+        if kind == 'ring':
+            ring_edges[road_id].append(k)
+    for ring_id, edge_indexes in ring_edges.items():
+        if ring_id not in rings:
+            continue
+        ring_index = build_ring_index(rings[ring_id], VALIDATION_RING_SAMPLES)
+        points, on_ring = sample_ring_edges(ring_index, [sources[k][2] for k in edge_indexes],
+                                            [sources[k][3] for k in edge_indexes], num_samples)
+        source_points[edge_indexes] = points
+        found[edge_indexes] = on_ring
+    
+    # Radial edges: per time, the radial passing closest to both corners, cut between them
+    radial_index = RadialIndex(radials)
+    lines = {radial_id: radial_line(path) for radial_id, path in radials.items()}
+    radial_edges = defaultdict(list)
+    for k, (kind, time_str, start, end) in enumerate(sources):
+        if kind == 'radial':
+            radial_edges[time_str].append(k)
+    for time_str, edge_indexes in radial_edges.items():
+        candidates = [radial_index.exact[time_str]] if time_str in radial_index.exact else radial_index.fallbacks.get(time_str, [])
+        if not candidates:
+            continue
+        corners = shapely.points([[sources[k][2], sources[k][3]] for k in edge_indexes])
+        candidate_lines = np.array([lines[radial_id] for radial_id in candidates])
+        distances = shapely.distance(corners[None, :, :], candidate_lines[:, None, None]).sum(axis=2)
+        line = candidate_lines[np.argmin(distances, axis=0)][:, None]
+        positions = shapely.line_locate_point(line, corners)
+        positions = positions[:, :1] + np.linspace(0, 1, num_samples) * (positions[:, 1:] - positions[:, :1])
+        source_points[edge_indexes] = shapely.get_coordinates(shapely.line_interpolate_point(line, positions)).reshape(-1, num_samples, 2)
+        found[edge_indexes] = True
+    
+    # Distances for every drawn sample against its source polyline, then Hausdorff per edge
+    drawn_points = np.stack(drawn)[found] if drawn else np.zeros((0, num_samples, 2))
+    source_lines = shapely.linestrings(source_points[found])
+    distances = shapely.distance(shapely.points(drawn_points), source_lines[:, None])
+    max_deviation = distances.max(axis=1) if len(distances) else np.zeros(0)
+    rms_deviation = np.sqrt((distances ** 2).mean(axis=1)) if len(distances) else np.zeros(0)
+    hausdorff = shapely.hausdorff_distance(shapely.linestrings(drawn_points), source_lines)
+    
+    found_labels = [label for label, ok in zip(labels, found) if ok]
+    unmatched = [f"{block_id}/{edge}" for (block_id, edge), ok in zip(labels, found) if not ok]
+    
+    def stats(mask):
+        if not mask.any():
+            return {'edges': 0}
+        return {
+            'edges': int(mask.sum()),
+            'max_deviation': float(max_deviation[mask].max()),
+            'rms_deviation': float(np.sqrt((distances[mask] ** 2).mean())),
+            'max_hausdorff': float(hausdorff[mask].max())
+        }
+    
+    edge_kinds = np.array([edge for _, edge in found_labels])
+    order = np.argsort(hausdorff)[::-1][:worst]
+    summary = {
+        'geometry': geometry,
+        'blocks': len(blocks),
+        **stats(np.ones(len(found_labels), dtype=bool)),
+        'by_edge': {kind: stats(np.isin(edge_kinds, kinds)) for kind, kinds in
+                    [('inner', ['inner']), ('outer', ['outer']), ('radial', ['radial1', 'radial2'])]},
+        'no_source': no_source,
+        'skipped': skipped,
+        'unmatched': unmatched,
+        'worst': [{'block': found_labels[k][0], 'edge': found_labels[k][1],
+                   'max_deviation': float(max_deviation[k]), 'rms_deviation': float(rms_deviation[k]),
+                   'hausdorff': float(hausdorff[k])} for k in order]
+    }
+    REPORT.count('validated_edges', summary['edges'])
+    
+    print(f"  Edges validated: {summary['edges']} of {len(blocks) * 4} "
+          f"({len(no_source)} without source roads, {len(skipped)} without drawn geometry, "
+          f"{len(unmatched)} off their ring/radial)")
+    for label, failed in [('without drawn geometry', skipped), ('off their ring/radial', unmatched)]:
+        if failed:
+            REPORT.count('unvalidated_edges', len(failed))
+            print(f"  ❌ {len(failed)} edges {label}: {', '.join(failed[:5])}{' ...' if len(failed) > 5 else ''}")
+    if summary['edges']:
+        print(f"  Max deviation: {summary['max_deviation']:.3f}px, RMS: {summary['rms_deviation']:.3f}px, "
+              f"max Hausdorff: {summary['max_hausdorff']:.3f}px")
+        for kind, kind_stats in summary['by_edge'].items():
+            if kind_stats['edges']:
+                print(f"    {kind:<7} {kind_stats['edges']:4d} edges: max {kind_stats['max_deviation']:.3f}px, "
+                      f"RMS {kind_stats['rms_deviation']:.3f}px, Hausdorff {kind_stats['max_hausdorff']:.3f}px")
+        print(f"  Worst edges:")
+        for entry in summary['worst']:
+            print(f"    {entry['block']}/{entry['edge']}: Hausdorff {entry['hausdorff']:.3f}px, "
+                  f"max {entry['max_deviation']:.3f}px, RMS {entry['rms_deviation']:.3f}px")
+    return summary
+
+def edge_gate_failures(summary, max_error):
+    """Reasons a validate_edge_accuracy summary fails --max-edge-error (empty when it passes).
+
+    Edges that could not be validated fail the gate too, so a block with
+    missing geometry or a corner off its road can't pass by being left out.
+    """
+    failures = []
+    if not summary['edges']:
+        failures.append("no edge could be validated")
+    elif summary['max_hausdorff'] > max_error:
+        failures.append(f"worst edge is {summary['max_hausdorff']:.3f}px from its source road")
+    if summary['skipped']:
+        failures.append(f"{len(summary['skipped'])} edges without drawn geometry")
+    if summary['unmatched']:
+        failures.append(f"{len(summary['unmatched'])} edges off their ring/radial")
+    return failures
+
+def arc_svg_output(output_file, precision=1, relative=False):
+    """Output spec for the circular-arc block SVG"""
+    header = '''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1160.17 861.54">
   <defs>
     <style>
@@ -1346,174 +2421,707 @@ def create_arc_optimized_svg(blocks, output_file):
   </defs>
   <g id="BRC_Arc_Blocks">
 '''
-    
-    arc_count = 0
-    total_points = 0
-    
-    for block in blocks:
-        # Try new arc data first, then polyline exception, then fallback to bezier data
-        arc_data = block.get('arc_data')
-        polyline_data = block.get('polyline_data')
-        bezier_data = block.get('bezier_data')
-        
-        if polyline_data and 'polygon_points' in polyline_data:
-            # Handle new exception blocks with custom polygon points
-            polygon_points = polyline_data['polygon_points']
-            
-            if polygon_points:
-                d = f"M {polygon_points[0][0]:.1f},{polygon_points[0][1]:.1f}"
-                for x, y in polygon_points[1:]:
-                    d += f" L {x:.1f},{y:.1f}"
-                d += " Z"
-                
-                arc_count += 1
-                total_points += len(polygon_points)
+    return {
+        'file': output_file,
+        'header': header,
+        'footer': '''  </g>
+</svg>''',
+        'path_data': lambda block: block_path_data(block, precision=precision, relative=relative),
+        'element': lambda block, d: f'    <path id="{block["id"]}" class="{block["type"]}-block" d="{d}" />\n',
+        'skip_empty': False
+    }
+
+def stream_block_svgs(blocks, outputs):
+    """Write several block SVGs in one pass over blocks.
+
+    outputs are specs from polygon_svg_output, combined_svg_output or
+    arc_svg_output. Each file gets its header, then one <path> element per
+    block as soon as it is built, then its footer. Returns per-output stats
+    ({'paths', 'arcs', 'points'}) in the same order.
+    """
+    stats = [{'paths': 0, 'arcs': 0, 'points': 0} for _ in outputs]
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(output['file'], 'w', encoding='utf-8')) for output in outputs]
+        for output, f in zip(outputs, files):
+            f.write(output['header'])
         
-        elif polyline_data and 'inner_polyline' in polyline_data and 'outer_arc' in polyline_data:
-            # Handle old Esplanade exception blocks with 50-point polylines
-            inner_polyline = polyline_data['inner_polyline']
-            outer_arc = polyline_data['outer_arc']
-            radial1 = polyline_data['radial1'] 
-            radial2 = polyline_data['radial2']
-            
-            # Create path with polyline for inner boundary
-            if inner_polyline:
-                d = f"M {inner_polyline[0][0]:.1f},{inner_polyline[0][1]:.1f}"
-                for x, y in inner_polyline[1:]:
-                    d += f" L {x:.1f},{y:.1f}"
-                
-                # First radial line to outer ring
-                d += f" L {radial2[1][0]:.1f},{radial2[1][1]:.1f}"
-                
-                # Outer arc (reversed direction)
-                outer_start = outer_arc['end_point']
-                outer_end = outer_arc['start_point'] 
-                outer_radius = outer_arc['radius']
-                outer_sweep = 1 - outer_arc['sweep_flag']
-                d += f" A {outer_radius:.1f},{outer_radius:.1f} 0 {outer_arc['large_arc_flag']},{outer_sweep} {outer_end[0]:.1f},{outer_end[1]:.1f}"
-                
-                # Z closes back to start (second radial)
-                d += " Z"
-                
-                arc_count += 1
-                total_points += len(inner_polyline) + 2  # polyline points + 2 radial endpoints
-            
-        elif arc_data and 'inner_arc' in arc_data and 'outer_arc' in arc_data:
-            inner_arc = arc_data['inner_arc']
-            outer_arc = arc_data['outer_arc']
-            radial1 = arc_data['radial1'] 
-            radial2 = arc_data['radial2']
-            
-            # Create path with proper 4-sided structure using circular arcs
-            # Start at inner arc start point
-            start_point = inner_arc['start_point']
-            d = f"M {start_point[0]:.1f},{start_point[1]:.1f}"
-            
-            # Inner arc (side 1)
-            end_point = inner_arc['end_point']
-            radius = inner_arc['radius']
-            large_arc = inner_arc['large_arc_flag']
-            sweep = inner_arc['sweep_flag']
-            d += f" A {radius:.1f},{radius:.1f} 0 {large_arc},{sweep} {end_point[0]:.1f},{end_point[1]:.1f}"
-            
-            # First radial line (side 2) 
-            d += f" L {radial2[1][0]:.1f},{radial2[1][1]:.1f}"
-            
-            # Outer arc (side 3) - reversed direction
-            outer_start = outer_arc['end_point']  # Start from end (reverse)
-            outer_end = outer_arc['start_point']  # End at start (reverse)
-            outer_radius = outer_arc['radius']
-            # Reverse the sweep direction for the outer arc
-            outer_sweep = 1 - outer_arc['sweep_flag']
-            d += f" A {outer_radius:.1f},{outer_radius:.1f} 0 {outer_arc['large_arc_flag']},{outer_sweep} {outer_end[0]:.1f},{outer_end[1]:.1f}"
-            
-            # Z command automatically draws the second radial line back to start
-            d += " Z"  # Close path (second radial line: side 4)
-            
-            arc_count += 1
-            total_points += 4  # 2 arc endpoints + 2 radial endpoints
-            
-        elif bezier_data and 'inner_arc' in bezier_data and 'outer_arc' in bezier_data:
-            # Fallback to Bezier for old data
-            inner_arc = bezier_data['inner_arc']
-            outer_arc = bezier_data['outer_arc']
-            radial1 = bezier_data['radial1'] 
-            radial2 = bezier_data['radial2']
-            
-            if len(inner_arc) >= 4 and len(outer_arc) >= 4:
-                d = cubic_bezier_to_svg_path(inner_arc)  # Inner arc (side 1)
-                d += f" L {radial2[1][0]:.1f},{radial2[1][1]:.1f}"  # First radial line (side 2)
-                
-                # Outer arc (reversed)
-                outer_reversed = list(reversed(outer_arc))
-                outer_path = cubic_bezier_to_svg_path(outer_reversed)
-                d += " " + outer_path[2:]  # Outer arc (side 3) - Remove "M " from start
-                
-                d += " Z"  # Close path (second radial line: side 4)
-                
-                arc_count += 1
-                total_points += 8
-            else:
-                # Fallback for incomplete data
-                coords = block.get('curved_points', [])
-                if coords:
-                    d = f"M {coords[0][0]:.1f},{coords[0][1]:.1f}"
-                    for x, y in coords[1:]:
-                        d += f" L {x:.1f},{y:.1f}"
-                    d += " Z"
-                    total_points += len(coords)
-        else:
-            # Fallback to polygon points
-            coords = block.get('curved_points', [])
-            if coords:
-                d = f"M {coords[0][0]:.1f},{coords[0][1]:.1f}"
-                for x, y in coords[1:]:
-                    d += f" L {x:.1f},{y:.1f}"
-                d += " Z"
-                total_points += len(coords)
+        for block in blocks:
+            for output, f, output_stats in zip(outputs, files, stats):
+                d, point_count, uses_arcs = output['path_data'](block)
+                if not d and output['skip_empty']:
+                    continue
+                f.write(output['element'](block, d))
+                output_stats['paths'] += 1
+                output_stats['arcs'] += uses_arcs
+                output_stats['points'] += point_count
         
-        css_class = f"{block['type']}-block"
-        svg_content += f'    <path id="{block["id"]}" class="{css_class}" d="{d}" />\n'
-    
-    svg_content += '''  </g>
-</svg>'''
-    
-    with open(output_file, 'w') as f:
-        f.write(svg_content)
-    
+        for output, f in zip(outputs, files):
+            f.write(output['footer'])
+    return stats
+
+def print_arc_svg_stats(output_file, blocks, stats):
+    """Report how many arc SVG polygons use circular arcs and how many points they need"""
+    arc_count, total_points = stats['arcs'], stats['points']
     print(f"\n🎨 Arc SVG Optimization:")
     print(f"  File: {output_file}")
     print(f"  Polygons using circular arcs: {arc_count}/{len(blocks)} ({100*arc_count/len(blocks):.1f}%)")
     print(f"  Total points used: {total_points}")
     print(f"  Average points per polygon: {total_points/len(blocks):.1f}")
     print(f"  Reduction vs standard: {100*(1 - total_points/(len(blocks)*12)):.1f}% fewer points")
-    
+
+def create_arc_optimized_svg(blocks, output_file, precision=1, relative=False):
+    """Create SVG using circular arcs for maximum accuracy"""
+    stats = stream_block_svgs(blocks, [arc_svg_output(output_file, precision, relative)])[0]
+    print_arc_svg_stats(output_file, blocks, stats)
     return output_file
 
-def main():
-    input_file = "your_input_manual_edits.svg"
+# Zoom-dependent variants of the combined SVG: max_zoom is the MapView zoom (0.5-5) a level is meant for,
+# tolerance the total error in SVG px (coordinate rounding included), about one screen px at max_zoom;
+# the 'full' level uses --precision unsimplified
+LOD_LEVELS = (
+    {'name': 'overview', 'max_zoom': 0.5, 'precision': 0, 'tolerance': 2.0},
+    {'name': 'low', 'max_zoom': 1.0, 'precision': 0, 'tolerance': 1.0},
+    {'name': 'medium', 'max_zoom': 2.5, 'precision': 1, 'tolerance': 0.4},
+    {'name': 'full', 'max_zoom': None, 'precision': None, 'tolerance': 0.0},
+)
+
+def rounding_error(precision):
+    """Farthest a point moves when both its coordinates are rounded to precision decimals"""
+    return 0.5 * math.sqrt(2) * 10 ** -precision
+
+def simplify_tolerance(tolerance, precision):
+    """Part of a level's error tolerance left for chords and decimation once coordinate rounding is paid for"""
+    if tolerance <= 0:
+        return 0.0
+    budget = tolerance - rounding_error(precision)
+    if budget <= 0:
+        raise ValueError(f"LOD tolerance {tolerance}px is below the {rounding_error(precision):.3f}px "
+                         f"rounding error of {precision} decimals")
+    return budget
+
+def arc_sagitta(arc):
+    """Largest distance between a circular arc_data arc and its chord"""
+    half_chord = math.dist(arc['start_point'], arc['end_point']) / 2
+    radius = max(arc['radius'], half_chord)
+    if arc['large_arc_flag']:
+        return radius + math.sqrt(radius ** 2 - half_chord ** 2)
+    return radius - math.sqrt(radius ** 2 - half_chord ** 2)
+
+def simplify_outline(points, tolerance):
+    """Exception polyline points decimated with Douglas-Peucker, staying within tolerance px of the original"""
+    simplified = shapely.simplify(Polygon(points), tolerance, preserve_topology=True)
+    return list(simplified.exterior.coords)[:-1]
+
+def lod_block_path_data(block, precision=1, tolerance=0.0, relative=False):
+    """Combined-overlay path data of a block simplified to tolerance px.
+
+    Ring arcs whose sagitta is within tolerance are drawn as chords and
+    exception polylines are decimated; everything else (and tolerance=0)
+    matches block_path_data. Returns (d, point_count, chords).
+    """
+    arc_data = block.get('arc_data')
+    polyline_data = block.get('polyline_data')
+    if tolerance <= 0 or not (polyline_data or (arc_data and 'inner_arc' in arc_data and 'outer_arc' in arc_data)):
+        d, point_count, _ = block_path_data(block, use_bezier=False, precision=precision, relative=relative)
+        return d, point_count, 0
+    path = PathDataBuilder(precision, relative)
+
+    if polyline_data:
+        if not polyline_data.get('polygon_points'):
+            d, point_count, _ = block_path_data(block, use_bezier=False, precision=precision, relative=relative)
+            return d, point_count, 0
+        points = simplify_outline(polyline_data['polygon_points'], tolerance)
+        return path.polyline(points).close().getvalue(), len(points), 0
+
+    inner_arc, outer_arc = arc_data['inner_arc'], arc_data['outer_arc']
+    chords = 0
+    path.move_to(inner_arc['start_point'])
+    if arc_sagitta(inner_arc) <= tolerance:
+        path.line_to(inner_arc['end_point'])
+        chords += 1
+    else:
+        path.arc_to(inner_arc['radius'], inner_arc['large_arc_flag'], inner_arc['sweep_flag'], inner_arc['end_point'])
+    path.line_to(arc_data['radial2'][1])
+    if arc_sagitta(outer_arc) <= tolerance:
+        path.line_to(outer_arc['start_point'])
+        chords += 1
+    else:
+        path.arc_to(outer_arc['radius'], outer_arc['large_arc_flag'], 1 - outer_arc['sweep_flag'],
+                    outer_arc['start_point'])
+    return path.close().getvalue(), 4, chords
+
+def write_lod_outputs(blocks, input_file, output_dir, precision=1, relative=False, levels=LOD_LEVELS):
+    """Write one combined SVG per LOD level into output_dir, plus lod_manifest.json with their byte sizes.
+
+    All levels are streamed in one pass over the blocks. The manifest lists
+    each level's file, max_zoom, precision, simplify_tolerance, max_error,
+    raw and gzip byte sizes and point/chord counts, so the app can pick the
+    cheapest level for its zoom. simplify_tolerance is what is left of the
+    level's tolerance for chords and decimation once the rounding error of
+    its precision is paid for; max_error, their sum, bounds how far the
+    written outline strays from the exact geometry. Chords are counted per
+    level as lod_chords.<name>. Returns the manifest.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    outputs, chords = [], []
+    for level in levels:
+        level_precision = precision if level['precision'] is None else level['precision']
+        output = combined_svg_output(input_file, os.path.join(output_dir, f"brc_combined_validation.{level['name']}.svg"),
+                                     level_precision, relative)
+        level_chords = [0]
+        tolerance = simplify_tolerance(level['tolerance'], level_precision)
+
+        def path_data(block, level_precision=level_precision, tolerance=tolerance, level_chords=level_chords):
+            d, point_count, block_chords = lod_block_path_data(block, level_precision, tolerance, relative)
+            level_chords[0] += block_chords
+            return d, point_count, block_chords == 0
+
+        output['path_data'] = path_data
+        outputs.append(output)
+        chords.append(level_chords)
+    stats = stream_block_svgs(blocks, outputs)
+
+    manifest = {'version': 1, 'levels': []}
+    for level, output, level_stats, level_chords in zip(levels, outputs, stats, chords):
+        with open(output['file'], 'rb') as f:
+            data = f.read()
+        level_precision = precision if level['precision'] is None else level['precision']
+        tolerance = simplify_tolerance(level['tolerance'], level_precision)
+        manifest['levels'].append({
+            'name': level['name'],
+            'file': os.path.basename(output['file']),
+            'max_zoom': level['max_zoom'],
+            'precision': level_precision,
+            'simplify_tolerance': round(tolerance, 4),
+            'max_error': round(tolerance + rounding_error(level_precision), 4),
+            'bytes': len(data),
+            'gzip_bytes': len(gzip.compress(data, compresslevel=9, mtime=0)),
+            'paths': level_stats['paths'],
+            'points': level_stats['points'],
+            'chords': level_chords[0]
+        })
+        REPORT.count(f"lod_chords.{level['name']}", level_chords[0])
+
+    with open(os.path.join(output_dir, "lod_manifest.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+# Bump whenever extraction or intersection logic changes so stale caches are ignored
+CACHE_VERSION = 3
+
+def hash_road_elements(svg_file):
+    """Hash every road element's geometry attributes in the input SVG.
+
+    Returns {element_key: sha1 hex}, where element_key is
+    'group/subgroup/index' (e.g. 'Ring_Roads/A/0').
+    """
+    element_hashes = {}
+
+    for group_id, elements in scan_road_groups(svg_file).items():
+        indexes = defaultdict(int)
+        for subgroup_id, elem_tag, attrib in elements:
+            geometry = '|'.join(f"{attr}={attrib[attr]}" for attr in ROAD_GEOMETRY_ATTRS if attrib.get(attr) is not None)
+            digest = hashlib.sha1(f"{elem_tag}|{geometry}".encode('utf-8')).hexdigest()
+            element_hashes[f"{group_id}/{subgroup_id}/{indexes[subgroup_id]}"] = digest
+            indexes[subgroup_id] += 1
+
+    return element_hashes
+
+def road_cache_settings(intersection_mode, residual_threshold):
+    """Algorithm version and intersection settings a cached table depends on"""
+    return f"v{CACHE_VERSION}|{intersection_mode}|{residual_threshold!r}"
+
+def road_cache_key(element_hashes, intersection_mode, residual_threshold):
+    """Combine element hashes, algorithm version and intersection settings into one cache key"""
+    digest = hashlib.sha1(road_cache_settings(intersection_mode, residual_threshold).encode('utf-8'))
+    for element_key in sorted(element_hashes):
+        digest.update(f"{element_key}={element_hashes[element_key]}".encode('utf-8'))
+    return digest.hexdigest()
+
+def pack_paths(paths):
+    """Pack an ordered {id: Path} dict into flat arrays with per-path offsets"""
+    ids = list(paths)
+    packed = [path_to_arrays(paths[path_id]) for path_id in ids]
+    offsets = np.cumsum([0] + [len(kinds) for kinds, _ in packed])
+    kinds = np.concatenate([k for k, _ in packed]) if packed else np.zeros(0, dtype=np.int8)
+    points = np.concatenate([p for _, p in packed]) if packed else np.zeros((0, 4), dtype=complex)
+    return np.array(ids, dtype=str), offsets, kinds, points
+
+def unpack_paths(ids, offsets, kinds, points):
+    """Inverse of pack_paths; keeps the original dict order"""
+    return {path_id: path_from_arrays(kinds[offsets[i]:offsets[i + 1]], points[offsets[i]:offsets[i + 1]])
+            for i, path_id in enumerate(ids.tolist())}
+
+def save_road_cache(cache_file, cache_key, element_hashes, rings, radials, intersections, settings=""):
+    """Write parsed roads and the intersection table to a compressed .npz cache"""
+    ring_ids, ring_offsets, ring_kinds, ring_points = pack_paths(rings)
+    radial_ids, radial_offsets, radial_kinds, radial_points = pack_paths(radials)
+
+    table = [(ring_id, radial_id, point) for ring_id, ring_table in intersections.items()
+             for radial_id, point in ring_table.items()]
+
+    np.savez_compressed(
+        cache_file,
+        cache_key=np.array(cache_key),
+        settings=np.array(settings),
+        element_keys=np.array(list(element_hashes), dtype=str),
+        element_hashes=np.array(list(element_hashes.values()), dtype=str),
+        ring_ids=ring_ids, ring_offsets=ring_offsets, ring_kinds=ring_kinds, ring_points=ring_points,
+        radial_ids=radial_ids, radial_offsets=radial_offsets, radial_kinds=radial_kinds, radial_points=radial_points,
+        intersection_rings=np.array([row[0] for row in table], dtype=str),
+        intersection_radials=np.array([row[1] for row in table], dtype=str),
+        intersection_points=np.array([row[2] for row in table], dtype=float).reshape(-1, 2)
+    )
+    print(f"💾 Saved road cache to {cache_file}")
+
+def load_road_cache(cache_file, cache_key=None):
+    """Load a road cache written by save_road_cache.
+
+    Returns a dict with settings, element_hashes, rings, radials and intersections,
+    or None if the file is missing, unreadable, or its key differs from cache_key.
+    Pass cache_key=None to load the last run's roads whatever they were.
+    """
+    try:
+        with np.load(cache_file) as data:
+            if cache_key is not None and str(data['cache_key']) != cache_key:
+                return None
+
+            intersections = defaultdict(dict)
+            for ring_id, radial_id, point in zip(data['intersection_rings'].tolist(),
+                                                 data['intersection_radials'].tolist(),
+                                                 data['intersection_points'].tolist()):
+                intersections[ring_id][radial_id] = tuple(point)
+
+            return {
+                'cache_key': str(data['cache_key']),
+                'settings': str(data['settings']),
+                'element_hashes': dict(zip(data['element_keys'].tolist(), data['element_hashes'].tolist())),
+                'rings': unpack_paths(data['ring_ids'], data['ring_offsets'], data['ring_kinds'], data['ring_points']),
+                'radials': unpack_paths(data['radial_ids'], data['radial_offsets'], data['radial_kinds'], data['radial_points']),
+                'intersections': intersections
+            }
+    except (OSError, KeyError, ValueError):
+        return None
+
+def diff_roads(old_paths, new_paths):
+    """IDs of paths that were added, removed or whose segments changed"""
+    changed = set(old_paths) ^ set(new_paths)
+    for path_id in set(old_paths) & set(new_paths):
+        old_kinds, old_points = path_to_arrays(old_paths[path_id])
+        new_kinds, new_points = path_to_arrays(new_paths[path_id])
+        if not (np.array_equal(old_kinds, new_kinds) and np.array_equal(old_points, new_points)):
+            changed.add(path_id)
+    return changed
+
+def update_intersection_table(intersections, rings, radials, changed_rings, changed_radials,
+                              intersection_mode='sampled', residual_threshold=1.0, center=(622.5, 272.04)):
+    """Patch a previous intersection table after some rings/radials changed.
+
+    Changed rings get their whole row recomputed; every other ring only
+    recomputes its entries for the changed radials. Unchanged pairs keep
+    their cached points.
+    """
+    updated = defaultdict(dict)
+    for ring_id in ring_order(rings):
+        if ring_id in changed_rings:
+            ring_radials = radials
+            ring_table = {}
+        elif changed_radials:
+            ring_radials = {radial_id: radials[radial_id] for radial_id in changed_radials if radial_id in radials}
+            ring_table = {radial_id: point for radial_id, point in intersections.get(ring_id, {}).items()
+                          if radial_id not in changed_radials}
+        else:
+            updated[ring_id].update(intersections.get(ring_id, {}))
+            continue
+        
+        circle = None
+        if intersection_mode == 'circle':
+            circle = fit_ring_circle(rings[ring_id])
+            if circle['residual'] > residual_threshold:
+                circle = None
+        
+        ring_table.update(compute_ring_intersections(ring_id, rings[ring_id], ring_radials, circle, center))
+        # Keep the radial order of a full rebuild
+        updated[ring_id].update({radial_id: ring_table[radial_id] for radial_id in radials if radial_id in ring_table})
+    
+    return updated
+
+def affected_block_ids(old_intersections, new_intersections, rings, radials, changed_rings):
+    """IDs of blocks on a changed ring or with a corner that moved between two intersection tables"""
+    available_rings = ring_order(rings)
+    radial_index = RadialIndex(dict.fromkeys(radial_id for table in (*old_intersections.values(), *new_intersections.values())
+                                             for radial_id in table))
+    affected = []
+    for block_id, _, inner_ring, outer_ring, time1, time2 in block_layout(available_rings, *layout_times(radials)):
+        if inner_ring in changed_rings or outer_ring in changed_rings:
+            affected.append(block_id)
+            continue
+        for ring_id in (inner_ring, outer_ring):
+            for time_str in (time1, time2):
+                if (find_best_intersection(old_intersections.get(ring_id, {}), time_str, radial_index) !=
+                        find_best_intersection(new_intersections.get(ring_id, {}), time_str, radial_index)):
+                    break
+            else:
+                continue
+            affected.append(block_id)
+            break
+    return affected
+
+SVG_PATH_PATTERN = re.compile(r'(<(?:svg:)?path id=")([^"]*)(" class="[^"]*" d=")([^"]*)(")')
+
+def read_svg_path_data(svg_file, id_prefix=""):
+    """Read {block_id: d} for the block paths in an output SVG written by this script"""
+    with open(svg_file, encoding='utf-8') as f:
+        content = f.read()
+    return {match.group(2)[len(id_prefix):]: match.group(4) for match in SVG_PATH_PATTERN.finditer(content)
+            if match.group(2).startswith(id_prefix)}
+
+def patch_svg_path_data(svg_file, path_data, id_prefix=""):
+    """Rewrite the d attribute of just the given {block_id: d} paths in an output SVG (text-level)"""
+    with open(svg_file, encoding='utf-8') as f:
+        content = f.read()
+    
+    def replace(match):
+        block_id = match.group(2)[len(id_prefix):]
+        if not match.group(2).startswith(id_prefix) or block_id not in path_data:
+            return match.group(0)
+        return match.group(1) + match.group(2) + match.group(3) + path_data[block_id] + match.group(5)
+    
+    with open(svg_file, 'w', encoding='utf-8') as f:
+        f.write(SVG_PATH_PATTERN.sub(replace, content))
+
+def patch_combined_svg(combined_file, input_file, road_groups, path_data):
+    """Patch a combined validation SVG in place after road edits.
+
+    Copies the given (group_id, subgroup_id) road groups over from the
+    input SVG and rewrites the d attribute of the given {block_id: d}
+    overlay paths. Returns False if a road group can't be found in either file.
+    """
+    tree = ET.parse(combined_file)
+    root = tree.getroot()
+    source_root = ET.parse(input_file).getroot()
+    
+    for group_id, subgroup_id in road_groups:
+        target = root.find(f".//*[@id='{group_id}']/*[@id='{subgroup_id}']")
+        source = source_root.find(f".//*[@id='{group_id}']/*[@id='{subgroup_id}']")
+        if target is None or source is None:
+            return False
+        target.attrib = dict(source.attrib)
+        target.text = source.text
+        target[:] = list(source)
+    
+    overlay = root.find(".//*[@id='BRC_Polygons_Overlay']")
+    for path_elem in (overlay if overlay is not None else []):
+        block_id = path_elem.get('id', '')[len("polygon_"):]
+        if block_id in path_data:
+            path_elem.set('d', path_data[block_id])
+    
+    tree.write(combined_file, encoding='utf-8', xml_declaration=True)
+    return True
+
+def update_outputs_incrementally(previous, element_hashes, rings, radials, args, input_file, combined_file, arc_file):
+    """Rebuild only the blocks touched by road edits and patch them into the existing outputs.
+
+    Returns the updated intersection table and the sorted list of block IDs
+    whose path data changed, or None when a full rebuild is needed (e.g. an
+    affected block could not be rebuilt or is missing from an output file).
+    """
+    changed_rings = diff_roads(previous['rings'], rings)
+    changed_radials = diff_roads(previous['radials'], radials)
+    print(f"🔍 Changed roads: rings {sorted(changed_rings) or '-'}, radials {sorted(changed_radials) or '-'}")
+    
+    intersections = update_intersection_table(previous['intersections'], rings, radials, changed_rings, changed_radials,
+                                              args.intersection_mode, args.residual_threshold)
+    block_ids = affected_block_ids(previous['intersections'], intersections, rings, radials, changed_rings)
+    print(f"🧩 Rebuilding {len(block_ids)} affected blocks")
+    
+    blocks = create_brc_blocks(rings, radials, intersection_mode=args.intersection_mode,
+                               residual_threshold=args.residual_threshold, representation='arc',
+                               intersections=intersections, block_ids=set(block_ids)) if block_ids else []
+    if len(blocks) != len(block_ids):
+        print("⚠️  Some affected blocks could not be rebuilt; falling back to a full rebuild")
+        return None
+    
+    arc_paths = {block['id']: block_path_data(block, precision=args.precision, relative=args.relative_paths)[0]
+                 for block in blocks}
+    combined_paths = {block['id']: block_path_data(block, use_bezier=False, precision=args.precision,
+                                                   relative=args.relative_paths)[0]
+                      for block in blocks}
+    old_arc_paths = read_svg_path_data(arc_file)
+    old_combined_paths = read_svg_path_data(combined_file, "polygon_")
+    if any(block_id not in old_arc_paths or block_id not in old_combined_paths for block_id in block_ids):
+        print("⚠️  Affected blocks missing from the existing outputs; falling back to a full rebuild")
+        return None
+    
+    changed_blocks = sorted(block_id for block_id in block_ids
+                            if arc_paths[block_id] != old_arc_paths[block_id]
+                            or combined_paths[block_id] != old_combined_paths[block_id])
+    
+    # The combined file embeds the input roads, so edited road groups are copied over too
+    changed_elements = set(previous['element_hashes'].items()) ^ set(element_hashes.items())
+    road_groups = sorted({tuple(element_key.split('/')[:2]) for element_key, _ in changed_elements})
+    if not patch_combined_svg(combined_file, input_file, road_groups,
+                              {block_id: combined_paths[block_id] for block_id in changed_blocks}):
+        print("⚠️  Edited road groups not found in the combined output; falling back to a full rebuild")
+        return None
+    if changed_blocks:
+        patch_svg_path_data(arc_file, {block_id: arc_paths[block_id] for block_id in changed_blocks})
+    
+    return intersections, changed_blocks
+
+def geocode_addresses(address_file, output_file, intersections, blocks, input_file):
+    """Geocode every address in address_file (one per line) and write the results as JSON"""
+    with open(address_file, encoding='utf-8') as f:
+        addresses = [line.strip() for line in f if line.strip()]
+    
+    geocoder = BlockGeocoder(intersections, [block['id'] for block in blocks], extract_plazas(input_file))
+    results = geocoder.geocode(addresses)
+    
+    output_file = output_file or os.path.splitext(address_file)[0] + ".geocoded.json"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    
+    failed = [result for result in results if result['error']]
+    print(f"📍 Geocoded {len(results) - len(failed)}/{len(results)} addresses → {output_file}")
+    for result in failed[:10]:
+        print(f"   ⚠️  {result['error']}")
+    if len(failed) > 10:
+        print(f"   ... and {len(failed) - 10} more")
+    return results
+
+def check_topology(blocks, rings, radials, report_file=None, overlay_file=None):
+    """Run the block topology checker against the expected block grid and write its JSON report / overlay SVG"""
+    expected_ids = [block_id for block_id, *_ in block_layout(ring_order(rings), *layout_times(radials))]
+    report, highlights = check_block_topology(blocks, expected_ids)
+    REPORT.count('topology_overlaps', len(report['overlaps']))
+    REPORT.count('topology_gaps', len(report['gaps']))
+    
+    print(f"\n🧩 Topology: {report['blocks']}/{report['expected_blocks']} blocks, "
+          f"{report['pairs']['radial']} radial + {report['pairs']['ring']} ring neighbour pairs")
+    print(f"   Overlap {report['total_overlap_area']:.2f}px² (max {report['max_overlap_area']:.2f}), "
+          f"gap slivers {report['total_gap_area']:.2f}px² (max {report['max_gap_area']:.2f})")
+    for key, label in (('overlaps', 'Overlap'), ('gaps', 'Gap')):
+        for entry in report[key][:5]:
+            print(f"   ⚠️  {label} {entry['blocks'][0]} / {entry['blocks'][1]} ({entry['relation']}): {entry['area']:.2f}px²")
+    for mismatch in report['corner_mismatches'][:5]:
+        print(f"   ⚠️  Corner {mismatch['corner']} differs by {mismatch['spread']:.3f}px across {', '.join(mismatch['blocks'])}")
+    for key, label in (('missing_blocks', 'Missing'), ('unexpected_blocks', 'Unexpected'),
+                       ('duplicate_blocks', 'Duplicate'), ('invalid_outlines', 'Invalid outline')):
+        if report[key]:
+            print(f"   ⚠️  {label}: {', '.join(report[key][:10])}{' ...' if len(report[key]) > 10 else ''}")
+    print(f"   {'✅ Topology OK' if report['ok'] else '❌ Topology issues found'}")
+    
+    if report_file:
+        write_topology_report(report, report_file)
+        print(f"📁 Topology report: {report_file}")
+    if overlay_file:
+        write_topology_overlay(highlights, overlay_file)
+        print(f"📁 Topology overlay: {overlay_file}")
+    return report
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate BRC block polygons from the manual edits SVG")
+    parser.add_argument('--input', default="your_input_manual_edits.svg",
+                        help="road layout SVG (default your_input_manual_edits.svg; see synthetic_city.py)")
+    parser.add_argument('--intersection-mode', choices=['sampled', 'circle'], default='sampled',
+                        help="sampled: search each ring/radial pair; circle: closed-form fitted ring circles")
+    parser.add_argument('--residual-threshold', type=float, default=1.0,
+                        help="max RMS circle fit residual (px) before a ring falls back to sampling")
+    parser.add_argument('--representation', choices=['arc', 'bezier', 'sampled', 'all'], default='arc',
+                        help="block geometry to compute up front (others are computed on first access)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for intersection search and Bezier fitting (default 1: serial)")
+    parser.add_argument('--cache-file', default=".polygonizer_cache.npz",
+                        help="road/intersection cache keyed by a hash of the input road geometry")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore and don't write the road cache")
+    parser.add_argument('--precision', type=int, default=1,
+                        help="decimal places for output path coordinates (default 1)")
+    parser.add_argument('--relative-paths', action='store_true',
+                        help="write output path data with relative (lowercase) commands")
+    parser.add_argument('--block-table', metavar='PATH',
+                        help="also save the blocks as a memory-mappable BlockTable file (e.g. brc_blocks.bin)")
+    parser.add_argument('--manifest', metavar='PATH',
+                        help="also write a quantized block manifest (GeoJSON for *.geojson, compact JSON otherwise)")
+    parser.add_argument('--manifest-scale', type=int, default=10,
+                        help="manifest coordinates are integers in 1/scale SVG px (default 10)")
+    parser.add_argument('--manifest-compress', nargs='+', choices=['gz', 'br'], default=[],
+                        help="also write precompressed .gz and/or .br manifest siblings")
+    parser.add_argument('--lod', metavar='DIR',
+                        help="also write zoom-level variants of the combined SVG and lod_manifest.json (byte sizes) into DIR")
+    parser.add_argument('--adjacency', metavar='PATH',
+                        help="also write a CSR block adjacency graph (same ring, across ring, diagonal) as compact JSON")
+    parser.add_argument('--geocode', metavar='ADDRESSES',
+                        help="geocode a text file of camp addresses (one per line) to block IDs and coordinates")
+    parser.add_argument('--geocode-output', metavar='PATH',
+                        help="JSON results for --geocode (default: <ADDRESSES>.geocoded.json)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="diff roads against the cache and patch only changed blocks in the existing outputs")
+    parser.add_argument('--validate-edges', nargs='?', const='arc', choices=['arc', 'bezier'],
+                        help="measure every block edge (both arcs and radials) against the source roads: "
+                             "max/RMS deviation and Hausdorff distance, plus the worst edges (default geometry: arc)")
+    parser.add_argument('--max-edge-error', type=float, metavar='PX',
+                        help="exit with status 1 if any edge's Hausdorff distance exceeds PX (implies --validate-edges)")
+    parser.add_argument('--topology', metavar='PATH',
+                        help="check block overlaps, gap slivers, shared corners and missing blocks; write a JSON report")
+    parser.add_argument('--topology-overlay', metavar='PATH',
+                        help="also write an SVG highlighting topology issues (runs the check without --topology)")
+    parser.add_argument('--report', metavar='PATH',
+                        help="write a JSON run report: per-stage wall/CPU time, code-path counters, peak memory")
+    parser.add_argument('--quiet', action='store_true',
+                        help="skip the per-ring/radial/block progress lines")
+    args = parser.parse_args(argv)
+    if args.incremental and args.no_cache:
+        parser.error("--incremental needs the road cache; drop --no-cache")
+    if args.incremental:
+        # Incremental runs only patch the two SVGs; the other outputs need every block
+        full_build_flags = [flag for flag, value in (('--block-table', args.block_table), ('--manifest', args.manifest),
+                                                     ('--geocode', args.geocode), ('--validate-edges', args.validate_edges),
+                                                     ('--topology', args.topology),
+                                                     ('--topology-overlay', args.topology_overlay),
+                                                     ('--adjacency', args.adjacency), ('--lod', args.lod))
+                            if value]
+        if full_build_flags:
+            parser.error(f"{', '.join(full_build_flags)} need a full build; drop --incremental")
+    if args.max_edge_error is not None:
+        if args.incremental:
+            parser.error("--max-edge-error validates a full build; drop --incremental")
+        args.validate_edges = args.validate_edges or 'arc'
+    return args
+
+def run_polygonizer(args):
+    """Run the polygonizer for parsed command line options, recording stages into REPORT"""
+    input_file = args.input
     combined_file = "brc_combined_validation.svg"
+    arc_file = "brc_arc_polygons.svg"
     
     print("🎯 CLEAN BRC POLYGONIZER")
     print("=" * 60)
-    print("Creating 96 inner + 160 outer = 256 total blocks")
-    print("=" * 60)
     
-    # Extract roads
-    rings, radials = extract_roads_from_manual_svg(input_file)
+    # Reuse parsed roads and intersections when the road geometry is unchanged
+    cache = None
+    previous = None
+    if not args.no_cache:
+        with REPORT.stage('road_cache'):
+            element_hashes = hash_road_elements(input_file)
+            settings = road_cache_settings(args.intersection_mode, args.residual_threshold)
+            cache_key = road_cache_key(element_hashes, args.intersection_mode, args.residual_threshold)
+            if args.incremental:
+                previous = load_road_cache(args.cache_file)
+                if previous is not None and previous['cache_key'] == cache_key:
+                    cache = previous
+            else:
+                cache = load_road_cache(args.cache_file, cache_key)
+    
+    outputs_exist = os.path.exists(combined_file) and os.path.exists(arc_file)
+    if args.incremental and not outputs_exist:
+        print("⚠️  No previous outputs to patch; running a full rebuild")
+    elif args.incremental and cache is not None:
+        print(f"♻️  No road changes since the last run; {combined_file} and {arc_file} are up to date")
+        print("🔁 Changed block IDs: none")
+        return
+    elif args.incremental and previous is not None and previous['settings'] == settings:
+        print(f"🔁 Incremental update against {args.cache_file}")
+        with REPORT.stage('extract_roads'):
+            rings, radials = extract_roads_from_manual_svg(input_file)
+        with REPORT.stage('incremental_update'):
+            result = update_outputs_incrementally(previous, element_hashes, rings, radials, args,
+                                                 input_file, combined_file, arc_file)
+        if result is not None:
+            intersections, changed_blocks = result
+            REPORT.count('changed_blocks', len(changed_blocks))
+            with REPORT.stage('save_cache'):
+                save_road_cache(args.cache_file, cache_key, element_hashes, rings, radials, intersections, settings)
+            print(f"\n🔁 Changed block IDs ({len(changed_blocks)}): {', '.join(changed_blocks) or 'none'}")
+            print(f"📁 Patched: {combined_file}, {arc_file}")
+            return
+    elif args.incremental:
+        print("⚠️  No compatible road cache from a previous run; running a full rebuild")
+    
+    if cache is not None:
+        print(f"♻️  Road cache hit ({args.cache_file}): skipping extraction and intersection search")
+        rings, radials, intersections = cache['rings'], cache['radials'], cache['intersections']
+    else:
+        # Extract roads
+        with REPORT.stage('extract_roads'):
+            rings, radials = extract_roads_from_manual_svg(input_file)
+        with REPORT.stage('intersections'):
+            intersections = compute_intersection_table(rings, radials, args.intersection_mode,
+                                                       args.residual_threshold, workers=args.workers)
+        if not args.no_cache:
+            with REPORT.stage('save_cache'):
+                save_road_cache(args.cache_file, cache_key, element_hashes, rings, radials, intersections, settings)
     
     # Create blocks
-    blocks = create_brc_blocks(rings, radials)
+    layout = block_layout(ring_order(rings), *layout_times(radials))
+    inner_target = sum(block_type == 'inner' for _, block_type, *_ in layout)
+    print(f"🧱 Creating {inner_target} inner + {len(layout) - inner_target} outer = {len(layout)} total blocks")
+    with REPORT.stage('create_blocks'):
+        blocks = create_brc_blocks(rings, radials, intersection_mode=args.intersection_mode,
+                                   residual_threshold=args.residual_threshold,
+                                   representation=args.representation, workers=args.workers,
+                                   intersections=intersections)
+    REPORT.count('blocks', len(blocks))
+    
+    # Create the combined validation and arc-optimized outputs in one streaming pass
+    with REPORT.stage('write_svgs'):
+        _, arc_stats = stream_block_svgs(blocks, [
+            combined_svg_output(input_file, combined_file, args.precision, args.relative_paths),
+            arc_svg_output(arc_file, args.precision, args.relative_paths)
+        ])
+    combined_svg, arc_svg = combined_file, arc_file
+    print_arc_svg_stats(arc_file, blocks, arc_stats)
+    
+    if args.lod:
+        with REPORT.stage('lod'):
+            lod_manifest = write_lod_outputs(blocks, input_file, args.lod, args.precision, args.relative_paths)
+        print(f"\n🔭 Level-of-detail outputs in {args.lod}:")
+        for level in lod_manifest['levels']:
+            max_zoom = f"zoom ≤ {level['max_zoom']}" if level['max_zoom'] else "any zoom"
+            print(f"   {level['name']:<8} {level['bytes']:>7,} bytes ({level['gzip_bytes']:>6,} gzip), "
+                  f"{level['points']} points, {level['chords']} arcs as chords - {max_zoom}")
+        REPORT.result('lod', lod_manifest['levels'])
+    
+    if args.block_table:
+        with REPORT.stage('block_table'):
+            BlockTable.from_blocks(blocks).save(args.block_table)
+        print(f"🗃️  Saved block table to {args.block_table}")
+    
+    if args.manifest:
+        with REPORT.stage('manifest'):
+            manifest_files = write_block_manifest(blocks, args.manifest, args.manifest_scale, args.manifest_compress)
+        print(f"🗺️  Wrote block manifest: {', '.join(manifest_files)}")
+    
+    if args.adjacency:
+        with REPORT.stage('adjacency'):
+            graph = write_block_adjacency(blocks, args.adjacency, args.manifest_scale)
+        REPORT.count('adjacency_edges', len(graph['neighbors']) // 2)
+        print(f"🕸️  Wrote block adjacency graph ({len(graph['neighbors']) // 2} edges): {args.adjacency}")
+    
+    if args.geocode:
+        with REPORT.stage('geocode'):
+            geocode_addresses(args.geocode, args.geocode_output, intersections, blocks, input_file)
+    
+    # Validate Bezier curves against original input (only when they were computed)
+    if args.representation != 'arc':
+        with REPORT.stage('validation'):
+            validate_bezier_against_original(blocks, rings)
+    else:
+        print(f"\n🔍 Skipping Bezier validation (representation=arc; use --representation bezier)")
     
-    # Create outputs
-    combined_svg = create_combined_svg(input_file, blocks, combined_file)
+    # Full-coverage edge accuracy, optionally gating the run on the worst edge
+    edge_summary = None
+    if args.validate_edges:
+        with REPORT.stage('edge_validation'):
+            edge_summary = validate_edge_accuracy(blocks, rings, radials, args.validate_edges)
+        REPORT.result('edge_validation', edge_summary)
     
-    # Create Arc-optimized version
-    arc_file = "brc_arc_polygons.svg"
-    arc_svg = create_arc_optimized_svg(blocks, arc_file)
-    
-    # Validate arc curves against original input
-    validate_bezier_against_original(blocks, rings)
+    if args.topology or args.topology_overlay:
+        with REPORT.stage('topology'):
+            topology = check_topology(blocks, rings, radials, args.topology, args.topology_overlay)
+        REPORT.result('topology', {key: topology[key] for key in ('ok', 'total_overlap_area', 'total_gap_area',
+                                                                  'max_overlap_area', 'max_gap_area')})
     
     # Statistics
     inner_count = len([b for b in blocks if b['type'].startswith('inner')])
@@ -1529,8 +3137,28 @@ def main():
     print(f"   Outer blocks: {outer_count}")
     print(f"   Exception blocks: {exception_count}")
     print(f"   Total: {len(blocks)}")
-    print(f"   Target: 256")
-    print(f"   Progress: {100 * len(blocks) / 256:.1f}%")
+    target = len(layout)
+    print(f"   Target: {target}")
+    print(f"   Progress: {100 * len(blocks) / target:.1f}%")
+    
+    if args.max_edge_error is not None:
+        failures = edge_gate_failures(edge_summary, args.max_edge_error)
+        REPORT.result('edge_gate', {'max_edge_error': args.max_edge_error, 'passed': not failures,
+                                    'failures': failures})
+        if failures:
+            print(f"\n❌ Edge validation failed (--max-edge-error {args.max_edge_error}px): {'; '.join(failures)}")
+            return 1
+    return 0
+
+def main(argv=None):
+    args = parse_args(argv)
+    REPORT.reset(quiet=args.quiet)
+    try:
+        return run_polygonizer(args) or 0
+    finally:
+        if args.report:
+            REPORT.write(args.report, input=args.input, options=vars(args))
+            print(f"📈 Run report: {args.report}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Normalized BRC radial index
+Maps canonical clock times ('2:30', '10:00') to the radial IDs that carry them,
+expanding compound radials ('3:00-9:00') and '_sec' secondaries, so corner
+lookups are dict hits instead of substring scans over every radial ID
+"""
+
+import re
+
+RADIAL_TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})')
+
+class AmbiguousRadialError(ValueError):
+    """More than one non-exact radial claims a clock time on the same ring"""
+
+def canonical_time(hour, minute=0):
+    """Clock time as 'H:MM' (e.g. 2:00, 10:00)"""
+    return f"{int(hour)}:{int(minute):02d}"
+
+def time_minutes(time_str):
+    """Minutes after midnight of an 'H:MM' clock time"""
+    hour, minute = time_str.split(':')
+    return int(hour) * 60 + int(minute)
+
+def radial_times(radial_id):
+    """Canonical clock times a radial ID stands for.
+
+    '3:00-9:00' → ['3:00', '9:00'], '2:15_sec' → ['2:15'], '02:30' → ['2:30'];
+    IDs with no H:MM part give [].
+    """
+    base = radial_id[:-len('_sec')] if radial_id.endswith('_sec') else radial_id
+    times = []
+    for part in base.split('-'):
+        match = RADIAL_TIME_PATTERN.fullmatch(part.strip())
+        if match:
+            times.append(canonical_time(*match.groups()))
+    return times
+
+class RadialIndex:
+    """Canonical time → radial IDs, built once from the extracted radial IDs.
+
+    Each time has at most one exact radial (its ID is the time itself) and
+    any number of fallbacks (compound radials and '_sec' secondaries), kept
+    in extraction order.
+    """
+
+    def __init__(self, radial_ids):
+        self.exact = {}
+        self.fallbacks = {}
+        for radial_id in radial_ids:
+            times = radial_times(radial_id)
+            if len(times) == 1 and radial_id == times[0]:
+                self.exact[times[0]] = radial_id
+            else:
+                for time_str in times:
+                    self.fallbacks.setdefault(time_str, []).append(radial_id)
+
+    def __contains__(self, time_str):
+        return time_str in self.exact or time_str in self.fallbacks
+
+    def times(self):
+        """Every indexed time in clock order"""
+        return sorted(set(self.exact) | set(self.fallbacks), key=time_minutes)
+
+    def lookup(self, intersections_dict, target_time):
+        """Intersection for target_time in one ring's {radial_id: (x, y)} table.
+
+        The exact radial wins; otherwise the single fallback radial present
+        on the ring. Returns None if no radial for the time meets the ring and
+        raises AmbiguousRadialError if several fallbacks disagree.
+        """
+        exact = self.exact.get(target_time)
+        if exact is not None and exact in intersections_dict:
+            return intersections_dict[exact]
+
+        found = [radial_id for radial_id in self.fallbacks.get(target_time, ()) if radial_id in intersections_dict]
+        if len({tuple(intersections_dict[radial_id]) for radial_id in found}) > 1:
+            raise AmbiguousRadialError(f"Time {target_time} matches several radials: {', '.join(found)}")
+        return intersections_dict[found[0]] if found else None
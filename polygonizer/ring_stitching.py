@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+BRC ring fragment stitching
+Joins the <path> fragments of one ring road into a single contour ordered by
+clock angle, so the ring's global t parameter runs monotonically from one
+end of the horseshoe to the other instead of jumping between fragments
+"""
+
+from svgpathtools import Path, Line, Arc, CubicBezier, QuadraticBezier
+
+from block_locator import clock_angle
+
+# Fragment ends closer than this (px) are snapped together; wider gaps are kept as gaps
+SNAP_TOLERANCE = 2.0
+
+def with_start(segment, start):
+    """Copy of a segment with its start point moved"""
+    if isinstance(segment, Line):
+        return Line(start, segment.end)
+    if isinstance(segment, QuadraticBezier):
+        return QuadraticBezier(start, segment.control, segment.end)
+    if isinstance(segment, CubicBezier):
+        return CubicBezier(start, segment.control1, segment.control2, segment.end)
+    if isinstance(segment, Arc):
+        return Arc(start, segment.radius, segment.rotation, segment.large_arc, segment.sweep, segment.end)
+    raise TypeError(f"Unsupported segment type: {type(segment).__name__}")
+
+def continuous_fragments(paths):
+    """Every continuous piece of a ring's parsed <path> elements, in document order"""
+    return [fragment for path in paths for fragment in path.continuous_subpaths() if len(fragment)]
+
+def stitch_ring_fragments(paths, center=(622.5, 272.04), snap_tolerance=SNAP_TOLERANCE):
+    """One Path for a ring drawn as several fragments, the gaps left in it and the fragment count.
+
+    Fragments are oriented the way the longest one runs (clockwise or
+    counter-clockwise around the center), sorted by clock angle along that
+    direction, and joined end to start. Ends within snap_tolerance px are
+    snapped onto the previous fragment's end; wider gaps (e.g. A at Center
+    Camp) stay open and are returned as a list of gap lengths in px.
+    Clock angles are measured from 12:00, the open side of the city, so
+    horseshoe rings never wrap through 0°. A ring drawn as one continuous
+    fragment is returned unchanged.
+    """
+    fragments = continuous_fragments(paths)
+    if len(fragments) <= 1:
+        return (fragments[0] if fragments else Path()), [], len(fragments)
+
+    def angle(point):
+        return clock_angle(point.real - center[0], point.imag - center[1])
+
+    def sweep(fragment):
+        return angle(fragment.end) - angle(fragment.start)
+
+    clockwise = sweep(max(fragments, key=lambda fragment: fragment.length())) > 0
+    oriented = [fragment if (sweep(fragment) > 0) == clockwise else fragment.reversed() for fragment in fragments]
+    oriented.sort(key=lambda fragment: angle(fragment.start), reverse=not clockwise)
+
+    segments = list(oriented[0])
+    gaps = []
+    for fragment in oriented[1:]:
+        gap = abs(fragment.start - segments[-1].end)
+        fragment_segments = list(fragment)
+        if gap <= snap_tolerance:
+            fragment_segments[0] = with_start(fragment_segments[0], segments[-1].end)
+        else:
+            gaps.append(gap)
+        segments.extend(fragment_segments)
+    return Path(*segments), gaps, len(fragments)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Polygonizer run instrumentation
+Per-stage wall/CPU timers, code-path counters and peak memory for one run,
+written as a machine-readable JSON report
+"""
+
+import json
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak memory is reported as null
+    resource = None
+
+REPORT_VERSION = 1
+
+def peak_memory_bytes():
+    """Peak resident set size of this process so far, or None if the platform can't tell"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class RunReport:
+    """Timers and counters for one polygonizer run.
+
+    stage(name) is a context manager accumulating wall and CPU seconds
+    (re-entering a name adds to it); count(name, n) bumps a counter;
+    result(name, value) attaches a summary such as the edge validation;
+    detail(message) prints per-element progress unless quiet is set.
+    Counters and CPU time cover this process only, not --workers children.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, quiet=False):
+        self.quiet = quiet
+        self.stages = {}
+        self.counters = Counter()
+        self.results = {}
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time()
+
+    @contextmanager
+    def stage(self, name):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'calls': 0})
+            timing['wall_seconds'] += time.perf_counter() - wall
+            timing['cpu_seconds'] += time.process_time() - cpu
+            timing['calls'] += 1
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def result(self, name, value):
+        """Attach a JSON-serializable result (e.g. a validation summary) to the report"""
+        self.results[name] = value
+
+    def detail(self, message):
+        """Print a per-element progress line (suppressed with quiet)"""
+        if not self.quiet:
+            print(message)
+
+    def as_dict(self, **extra):
+        return {
+            'version': REPORT_VERSION,
+            **extra,
+            'wall_seconds': time.perf_counter() - self.started,
+            'cpu_seconds': time.process_time() - self.started_cpu,
+            'peak_memory_bytes': peak_memory_bytes(),
+            'stages': self.stages,
+            'counters': dict(sorted(self.counters.items())),
+            'results': self.results
+        }
+
+    def write(self, path, **extra):
+        """Write the report as JSON; extra keys (e.g. input file, options) go at the top level"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(**extra), f, indent=2)
+        return path
+
+# The report the polygonizer's functions record into
+REPORT = RunReport()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Synthetic BRC city generator
+Writes an SVG with the Ring_Roads / Main_Radial_Roads / Secondary_Radial_Roads
+groups that extract_roads_from_manual_svg expects, for any number of rings and
+any radial spacing, so the polygonizer can be run on 10× and 100× block counts
+
+    python synthetic_city.py city10.svg --scale 10
+    python synthetic_city.py noisy.svg --rings 20 --radial-spacing 5 --noise 3 --ellipticity 0.05 --fragments 3
+    python clean_brc_polygonizer.py --input city10.svg --no-cache
+"""
+
+import argparse
+import math
+import numpy as np
+
+CENTER = (622.5, 272.04)
+BASE_RING_NAMES = ['Esplanade', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K']
+
+# (rings, radial spacing in minutes) giving roughly 10× / 100× the real city's 256 blocks
+SCALE_PRESETS = {
+    1: (12, 15),
+    10: (30, 5),
+    100: (60, 1),
+}
+
+def ring_names(count):
+    """Esplanade, A-K, then L, M, ..., Z, AA, AB, ... for rings past K"""
+    names = BASE_RING_NAMES[:count]
+    index = 11  # 'L' is the 12th letter, counting from 0
+    while len(names) < count:
+        name, value = "", index
+        while True:
+            name = chr(ord('A') + value % 26) + name
+            value = value // 26 - 1
+            if value < 0:
+                break
+        names.append(name)
+        index += 1
+    return names
+
+def city_times(spacing):
+    """Radial times from 2:00 to 10:00 every `spacing` minutes"""
+    if 15 % spacing:
+        raise ValueError(f"Radial spacing must divide 15 minutes (got {spacing})")
+    return [f"{minutes // 60}:{minutes % 60:02d}" for minutes in range(120, 601, spacing)]
+
+def clock_point(radius, clock_degrees, ellipticity=0.0, center=CENTER):
+    """SVG point at a clock angle (3:00 = 90°, 6:00 = 180°), stretched along 3-9 by ellipticity"""
+    angle = math.radians(clock_degrees)
+    return (center[0] + radius * (1 + ellipticity) * math.sin(angle),
+            center[1] - radius * (1 - ellipticity) * math.cos(angle))
+
+def time_degrees(time_str):
+    hour, minute = map(int, time_str.split(':'))
+    return (hour * 30 + minute * 0.5) % 360
+
+def ring_points(radius, segments, ellipticity=0.0, noise=0.0, rng=None):
+    """Points along one ring from 2:00 to 10:00 (through 6:00), with smooth radial noise of about
+    `noise` px built from a few random low-frequency sinusoids"""
+    degrees = np.linspace(60.0, 300.0, segments + 1)
+    offsets = np.zeros_like(degrees)
+    if noise and rng is not None:
+        for frequency in range(1, 4):
+            offsets += rng.normal(0, noise / 2) * np.sin(np.radians(degrees) * frequency + rng.uniform(0, 2 * math.pi))
+    return [clock_point(radius + offset, degree, ellipticity) for degree, offset in zip(degrees, offsets)]
+
+def catmull_rom_path_data(points):
+    """Smooth cubic path data through the points (Catmull-Rom converted to Beziers)"""
+    parts = [f"M{points[0][0]:.2f},{points[0][1]:.2f}"]
+    for i in range(len(points) - 1):
+        p0 = points[max(i - 1, 0)]
+        p1, p2 = points[i], points[i + 1]
+        p3 = points[min(i + 2, len(points) - 1)]
+        c1 = (p1[0] + (p2[0] - p0[0]) / 6, p1[1] + (p2[1] - p0[1]) / 6)
+        c2 = (p2[0] - (p3[0] - p1[0]) / 6, p2[1] - (p3[1] - p1[1]) / 6)
+        parts.append(f"C{c1[0]:.2f},{c1[1]:.2f} {c2[0]:.2f},{c2[1]:.2f} {p2[0]:.2f},{p2[1]:.2f}")
+    return " ".join(parts)
+
+def ring_fragments(points, fragments, scramble=False):
+    """Split a ring's points into `fragments` consecutive pieces that share their end points.
+
+    With scramble, every other fragment is reversed and the fragments are
+    written last-first, the way hand-edited rings (e.g. A) often come out.
+    """
+    bounds = np.linspace(0, len(points) - 1, fragments + 1).round().astype(int)
+    pieces = [points[bounds[i]:bounds[i + 1] + 1] for i in range(fragments)]
+    if scramble:
+        pieces = [piece[::-1] if i % 2 else piece for i, piece in enumerate(pieces)][::-1]
+    return pieces
+
+def generate_city_svg(rings=12, radial_spacing=15, ellipticity=0.0, noise=0.0, fragments=1, scramble=False,
+                      ring_segments=24, esplanade_radius=204.0, first_gap=64.0, ring_gap=28.0, seed=0):
+    """SVG text for a synthetic city.
+
+    Ring k (0 = Esplanade) sits at esplanade_radius, then first_gap and
+    ring_gap px further out per ring. Radials on every other time (plus 2:00
+    and 10:00) go in Main_Radial_Roads, the rest in Secondary_Radial_Roads,
+    so inner rings get the half-resolution radials like the real city.
+    """
+    rng = np.random.default_rng(seed)
+    names = ring_names(rings)
+    radii = [esplanade_radius] + [esplanade_radius + first_gap + ring_gap * k for k in range(rings - 1)]
+    times = city_times(radial_spacing)
+
+    lines = []
+    lines.append('  <g id="Ring_Roads" data-name="Ring Roads">')
+    # Denser rings get proportionally more path segments
+    for name, radius in zip(names, radii):
+        points = ring_points(radius, max(ring_segments, len(times) // 2), ellipticity, noise, rng)
+        lines.append(f'    <g id="{name}">')
+        for piece in ring_fragments(points, fragments, scramble):
+            lines.append(f'      <path class="cls-1" d="{catmull_rom_path_data(piece)}"/>')
+        lines.append('    </g>')
+    lines.append('  </g>')
+
+    # Radials run from inside Esplanade to past the outermost ring (plus noise/ellipticity slack)
+    inner_radius = esplanade_radius * (1 - abs(ellipticity)) * 0.8
+    outer_radius = radii[-1] * (1 + abs(ellipticity)) + 4 * noise + ring_gap
+    groups = {'Main_Radial_Roads': [], 'Secondary_Radial_Roads': []}
+    for i, time_str in enumerate(times):
+        group = 'Main_Radial_Roads' if i % 2 == 0 or time_str == times[-1] else 'Secondary_Radial_Roads'
+        (x1, y1), (x2, y2) = (clock_point(r, time_degrees(time_str)) for r in (inner_radius, outer_radius))
+        groups[group].append(f'    <g id="_{time_str}" data-name="{time_str}">\n'
+                             f'      <line class="cls-1" x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}"/>\n'
+                             f'    </g>')
+    for group, elements in groups.items():
+        lines.append(f'  <g id="{group}" data-name="{group.replace("_", " ")}">')
+        lines.extend(elements)
+        lines.append('  </g>')
+
+    extent = outer_radius + 10
+    view_box = f"{CENTER[0] - extent:.2f} {CENTER[1] - extent:.2f} {2 * extent:.2f} {2 * extent:.2f}"
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{view_box}">\n'
+            f'  <defs>\n    <style>\n      .cls-1 {{\n        fill: none;\n        stroke: #000;\n      }}\n    </style>\n  </defs>\n'
+            + "\n".join(lines) + "\n</svg>\n")
+
+def write_synthetic_city(output_file, **params):
+    """Write generate_city_svg(**params) to output_file; returns the path"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(generate_city_svg(**params))
+    return output_file
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic BRC city SVG for scale testing")
+    parser.add_argument('output', help="SVG file to write")
+    parser.add_argument('--scale', type=int, choices=sorted(SCALE_PRESETS),
+                        help="preset ring count / radial spacing for ~1×, 10× or 100× the real block count")
+    parser.add_argument('--rings', type=int, default=12, help="number of rings, Esplanade first (default 12)")
+    parser.add_argument('--radial-spacing', type=int, default=15,
+                        help="minutes between radials; must divide 15 (default 15)")
+    parser.add_argument('--ellipticity', type=float, default=0.0,
+                        help="stretch rings along 3:00-9:00 by this fraction (default 0)")
+    parser.add_argument('--noise', type=float, default=0.0,
+                        help="smooth radial wobble of the rings in px (default 0)")
+    parser.add_argument('--fragments', type=int, default=1,
+                        help="split every ring into this many <path> fragments (default 1)")
+    parser.add_argument('--scramble-fragments', action='store_true',
+                        help="reverse every other fragment and write them last-first")
+    parser.add_argument('--ring-segments', type=int, default=24,
+                        help="minimum cubic segments per ring (default 24)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for --noise (default 0)")
+    args = parser.parse_args(argv)
+    if args.scale:
+        args.rings, args.radial_spacing = SCALE_PRESETS[args.scale]
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    write_synthetic_city(args.output, rings=args.rings, radial_spacing=args.radial_spacing,
+                         ellipticity=args.ellipticity, noise=args.noise, fragments=args.fragments,
+                         scramble=args.scramble_fragments, ring_segments=args.ring_segments, seed=args.seed)
+    inner_blocks = min(6, args.rings - 1) * (len(city_times(args.radial_spacing)) // 2)
+    outer_blocks = max(args.rings - 7, 0) * (len(city_times(args.radial_spacing)) - 1)
+    print(f"🏙️  Wrote {args.output}: {args.rings} rings, radials every {args.radial_spacing} min "
+          f"(~{inner_blocks + outer_blocks} blocks)")
+
+if __name__ == "__main__":
+    main()
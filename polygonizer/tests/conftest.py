@@ -0,0 +1,28 @@
+"""Shared fixtures: roads, intersections and blocks of the checked-in SVG, built once per test session"""
+
+import os
+import sys
+
+import pytest
+
+POLYGONIZER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, POLYGONIZER_DIR)
+
+import clean_brc_polygonizer as polygonizer  # noqa: E402
+
+INPUT_SVG = os.path.join(POLYGONIZER_DIR, 'your_input_manual_edits.svg')
+
+@pytest.fixture(scope='session')
+def roads():
+    """(rings, radials) extracted from the checked-in SVG"""
+    return polygonizer.extract_roads_from_manual_svg(INPUT_SVG)
+
+@pytest.fixture(scope='session')
+def intersections(roads):
+    rings, radials = roads
+    return polygonizer.compute_intersection_table(rings, radials)
+
+@pytest.fixture(scope='session')
+def blocks(roads, intersections):
+    rings, radials = roads
+    return polygonizer.create_brc_blocks(rings, radials, intersections=intersections)
@@ -0,0 +1,173 @@
+"""Behaviour checks for the radial index, geocoder, block table, adjacency graph and edge gate on the checked-in SVG"""
+
+import numpy as np
+import pytest
+
+from block_adjacency import build_block_adjacency, block_neighbours
+from block_geocoder import BlockGeocoder, extract_plazas
+from block_table import BLOCK_DTYPE, BlockTable
+from clean_brc_polygonizer import edge_gate_failures, validate_edge_accuracy
+from radial_index import AmbiguousRadialError, RadialIndex, radial_times
+from conftest import INPUT_SVG
+
+# Radial index
+
+def test_radial_times_canonicalizes_compound_and_secondary_ids():
+    assert radial_times('3:00-9:00') == ['3:00', '9:00']
+    assert radial_times('2:15_sec') == ['2:15']
+    assert radial_times('02:30') == ['2:30']
+    assert radial_times('Esplanade') == []
+
+def test_exact_radial_wins_over_fallbacks():
+    index = RadialIndex(['3:00-9:00', '3:00'])
+    table = {'3:00': (1.0, 2.0), '3:00-9:00': (5.0, 6.0)}
+    assert index.lookup(table, '3:00') == (1.0, 2.0)
+    # Without the exact radial on this ring, the single fallback is used
+    assert index.lookup({'3:00-9:00': (5.0, 6.0)}, '3:00') == (5.0, 6.0)
+    assert index.lookup({'3:00-9:00': (5.0, 6.0)}, '9:00') == (5.0, 6.0)
+    assert index.lookup({}, '3:00') is None
+
+def test_disagreeing_fallbacks_are_ambiguous():
+    index = RadialIndex(['3:00-9:00', '3:00_sec'])
+    with pytest.raises(AmbiguousRadialError):
+        index.lookup({'3:00-9:00': (5.0, 6.0), '3:00_sec': (7.0, 8.0)}, '3:00')
+    # Fallbacks that agree on the point are not ambiguous
+    assert index.lookup({'3:00-9:00': (5.0, 6.0), '3:00_sec': (5.0, 6.0)}, '3:00') == (5.0, 6.0)
+
+def test_radial_index_covers_checked_in_radials(intersections):
+    index = RadialIndex(dict.fromkeys(radial_id for table in intersections.values() for radial_id in table))
+    times = index.times()
+    assert times[0] == '2:00' and times[-1] == '10:00'
+    assert {'2:15', '6:00', '9:45'} <= set(times)
+    assert index.lookup(intersections['G'], '6:00') is not None
+
+# Geocoder
+
+@pytest.fixture(scope='module')
+def geocoder(intersections, blocks):
+    return BlockGeocoder(intersections, [block['id'] for block in blocks], extract_plazas(INPUT_SVG))
+
+@pytest.mark.parametrize('address, expected', [
+    ('7:45 & G', ('G', '7:45', False)),
+    ('G & 7:45', ('G', '7:45', False)),
+    ('3&J', ('J', '3:00', False)),
+    ('esp and 10:00', ('Esplanade', '10:00', False)),
+    ('3:00 B Plaza', ('B', '3:00', True)),
+    ('G Plaza', ('G', None, True)),
+    ('Center Camp', ('A', '6:00', True)),
+])
+def test_parse_addresses(geocoder, address, expected):
+    assert geocoder.parse(address) == expected
+
+@pytest.mark.parametrize('address', ['', '7:45', 'G', '7:45 & G & H', 'Center Camp & G', 'somewhere'])
+def test_parse_rejects_incomplete_addresses(geocoder, address):
+    with pytest.raises(ValueError):
+        geocoder.parse(address)
+
+def test_geocode_blocks_and_plazas(geocoder, intersections):
+    results = {result['address']: result for result in
+               geocoder.geocode(['7:45 & G', 'G & 7:45', '3&J', '4:40 & C', '3:00 B Plaza', 'Center Camp Plaza',
+                                 'G Plaza', '11:00 & C'])}
+    assert results['7:45 & G']['block_id'] == results['G & 7:45']['block_id'] == 'G_7:45'
+    assert (results['7:45 & G']['x'], results['7:45 & G']['y']) == pytest.approx(intersections['G']['7:45'])
+    assert results['3&J']['block_id'] == 'J_3:00'
+    # Between radials: the block whose frontage holds the time (inner blocks span 30 minutes)
+    assert results['4:40 & C']['block_id'] == 'C_4:30'
+
+    assert results['3:00 B Plaza']['plaza_id'] == 'plaza_3:00_B'
+    assert (results['3:00 B Plaza']['x'], results['3:00 B Plaza']['y']) == (916.5, 272.04)
+    assert results['Center Camp Plaza']['plaza_id'] == 'plaza_Center_Camp'
+    assert results['G Plaza']['error'].startswith('Ambiguous plaza')
+    assert results['11:00 & C']['error'] == '11:00 & C is outside the city'
+
+# Block table
+
+def test_block_table_round_trip(blocks, tmp_path):
+    table = BlockTable.from_blocks(blocks)
+    path = table.save(str(tmp_path / 'blocks.bin'))
+
+    for mmap in (True, False):
+        loaded = BlockTable.load(path, mmap=mmap)
+        assert loaded.ids == [block['id'] for block in blocks]
+        assert loaded.records.dtype == BLOCK_DTYPE
+        np.testing.assert_array_equal(loaded.records.view(np.ndarray), table.records.view(np.ndarray))
+        np.testing.assert_array_equal(loaded.vertices, table.vertices)
+
+    row = loaded.row('Esplanade_6:00')
+    assert loaded.block(row)['polyline_data']['polygon_points'] == \
+        [tuple(point) for point in blocks[row]['polyline_data']['polygon_points']]
+    arc_block = loaded.block(loaded.row('C_4:30'))
+    assert arc_block['arc_data']['inner_arc']['radius'] == \
+        pytest.approx(blocks[loaded.row('C_4:30')]['arc_data']['inner_arc']['radius'])
+
+def test_block_table_loads_u1_index_headers(blocks, tmp_path):
+    # Tables written before the ring/time indexes were widened store them as u1
+    table = BlockTable.from_blocks(blocks)
+    old_dtype = np.dtype([(name, 'u1' if name in ('ring', 'outer_ring', 'time', 'time2') else BLOCK_DTYPE[name])
+                          for name in BLOCK_DTYPE.names])
+    old_table = BlockTable(table.records.view(np.ndarray).astype(old_dtype), table.vertices,
+                           table.ring_names, table.time_names)
+    path = old_table.save(str(tmp_path / 'old.bin'))
+
+    loaded = BlockTable.load(path)
+    assert loaded.records.dtype['time'] == np.dtype('u1')
+    assert loaded.ids == table.ids
+    assert loaded.block(loaded.row('J_9:45')) == table.block(table.row('J_9:45'))
+
+def test_block_table_rejects_other_files(tmp_path):
+    path = tmp_path / 'not_a_table.bin'
+    path.write_bytes(b'PK\x03\x04 not a block table')
+    with pytest.raises(ValueError):
+        BlockTable.load(str(path))
+
+# Adjacency graph
+
+def test_adjacency_across_the_f_transition(blocks):
+    graph = build_block_adjacency(blocks)
+    neighbours = {neighbour: (edge_type, length) for neighbour, edge_type, length in
+                  block_neighbours(graph, 'polygon_E_4:30')}
+
+    # E is an inner (30-minute) ring pair; across F it meets two 15-minute outer blocks
+    assert {neighbour for neighbour, (edge_type, _) in neighbours.items() if edge_type == 'same_ring'} == \
+        {'polygon_E_4:00', 'polygon_E_5:00'}
+    assert {neighbour for neighbour, (edge_type, _) in neighbours.items() if edge_type == 'across_ring'} == \
+        {'polygon_D_4:30', 'polygon_F_4:30', 'polygon_F_4:45'}
+    assert {neighbour for neighbour, (edge_type, _) in neighbours.items() if edge_type == 'diagonal'} == \
+        {'polygon_D_4:00', 'polygon_D_5:00', 'polygon_F_4:15', 'polygon_F_5:00'}
+    assert neighbours['polygon_F_4:15'][1] == 0.0
+
+    # The two F blocks split E_4:30's outer arc between them
+    arc = blocks[graph['ids'].index('polygon_E_4:30')]['arc_data']['outer_arc']
+    half_chord = np.hypot(*np.subtract(arc['end_point'], arc['start_point'])) / 2
+    outer_length = 2 * arc['radius'] * np.arcsin(half_chord / arc['radius'])
+    shared = neighbours['polygon_F_4:30'][1] + neighbours['polygon_F_4:45'][1]
+    assert shared == pytest.approx(outer_length, abs=0.5)
+
+def test_adjacency_csr_is_symmetric(blocks):
+    graph = build_block_adjacency(blocks)
+    offsets, neighbors = graph['offsets'], graph['neighbors']
+    assert len(offsets) == len(blocks) + 1 and offsets[-1] == len(neighbors)
+    edges = {}
+    for row in range(len(blocks)):
+        for k in range(offsets[row], offsets[row + 1]):
+            edges[(row, neighbors[k])] = (graph['types'][k], graph['lengths'][k])
+    assert all(edges[(b, a)] == value for (a, b), value in edges.items())
+
+# Edge validation gate
+
+def test_edge_gate_passes_the_checked_in_svg(roads, blocks):
+    rings, radials = roads
+    summary = validate_edge_accuracy(blocks, rings, radials)
+    assert summary['no_source'] == ['Esplanade_5:30/inner', 'Esplanade_6:00/inner']
+    assert not summary['skipped'] and not summary['unmatched']
+    assert summary['by_edge']['radial']['max_hausdorff'] < 2
+    assert edge_gate_failures(summary, 15) == []
+    assert edge_gate_failures(summary, 5) == [f"worst edge is {summary['max_hausdorff']:.3f}px from its source road"]
+
+def test_edge_gate_fails_on_unvalidated_edges(roads, blocks):
+    rings, radials = roads
+    # Without the 6:00 radial its edges can't be matched; they must fail the gate rather than drop out
+    summary = validate_edge_accuracy(blocks, rings, {key: path for key, path in radials.items() if key != '6:00'})
+    assert 'G_6:00/radial1' in summary['unmatched']
+    assert edge_gate_failures(summary, 1000) == [f"{len(summary['unmatched'])} edges off their ring/radial"]
+    assert edge_gate_failures(validate_edge_accuracy([], rings, radials), 1000) == ["no edge could be validated"]